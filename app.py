@@ -8,7 +8,10 @@ Initializes the database, sets up the main window, sidebar, header, and various
 import logging
 import customtkinter as ctk
 import theme
-from database.database import init_db
+from database.database import init_db, shutdown_db
+from database.migrations import MigrationError
+from database.worker import get_worker
+from database.instrumentation import recorder, QUERY_STATS_PATH
 from views.tasks_view import TasksView
 from views.sidebar import Sidebar
 from views.header import Header
@@ -18,6 +21,11 @@ from views.settings_view import SettingsView
 from views.projects_view import ProjectsView
 from utils.translations import TranslationsManager
 from controllers.project_controller import ProjectController
+from controllers.task_controller import TaskController
+from controllers.identity_map import cache_stats
+from controllers.settings_controller import flush_settings
+from controllers.export_controller import cancel_running_jobs
+from controllers import events
 
 # Configure logging for debugging purposes.
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -37,6 +45,9 @@ def run_app():
     """Initializes the database and runs the application."""
     try:
         init_db()
+    except MigrationError as e:
+        logging.error("Database migration error, not starting: %s", e)
+        return
     except Exception as e:
         logging.error("Database initialization error: %s", e)
     app = TodoApp()
@@ -63,8 +74,13 @@ class TodoApp(ctk.CTk):
         # Set the menu toggle callback in Header.
         self.header.menu_toggle_callback = self._toggle_sidebar
 
+        # Database jobs run on the worker thread; their callbacks run on this main loop.
+        get_worker().attach(self)
+        # Change events are delivered on this main loop as well.
+        events.bus.set_dispatcher(get_worker().call_soon)
         self._initialize_views()
         self.bind("<Configure>", self._update_main_container)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _create_sidebar(self):
         """Creates and places the sidebar on the left."""
@@ -72,7 +88,8 @@ class TodoApp(ctk.CTk):
             self,
             width=self.sidebar_open_width,
             navigate_callback=self._navigate,
-            translations=translations
+            translations=translations,
+            search_callback=lambda text: self.header.schedule_search(text)
         )
         self.sidebar.place(x=0, y=0, relheight=1)
 
@@ -92,7 +109,9 @@ class TodoApp(ctk.CTk):
             share_callback=lambda: logging.info(translations.t("share")),
             login_callback=lambda: logging.info(translations.t("login")),
             user_logged_in=False,
-            translations=translations
+            translations=translations,
+            search_callback=self._on_search,
+            search_select_callback=self._on_search_select
         )
         self.header.grid(row=0, column=0, sticky="ew")
         
@@ -169,19 +188,43 @@ class TodoApp(ctk.CTk):
         if isinstance(destination, tuple) and destination[0] == "project":
             project_id = destination[1]
             self.views["tasks"].set_project(project_id)
-            project_ctrl = ProjectController()
-            projects = project_ctrl.list_projects()
-            project_match = [p for p in projects if p.id == project_id]
-            title = project_match[0].name if project_match else VIEW_TITLES["tasks"]
+            project = ProjectController().get_project(project_id)
+            title = project.name if project else VIEW_TITLES["tasks"]
             self.header.set_title(title)
         else:
             try:
                 view = self.views[destination]
+                if destination == "dashboard":
+                    # Cheap (counters and cached overdue count) and catches a date change.
+                    view.refresh()
                 view.tkraise()
                 self.header.set_title(translations.t(destination))
             except KeyError:
                 logging.warning(f"Unknown destination: {destination}")
 
+    def _on_search(self, text):
+        """
+        Runs a full-text search on the database worker and shows the results in the
+        header; results for a text that has been edited since are dropped.
+
+        Args:
+            text (str): The search text.
+        """
+        get_worker().submit(
+            TaskController().search_tasks, text, limit=8,
+            callback=lambda results: self.header.show_search_results(results, text)
+        )
+
+    def _on_search_select(self, task_id):
+        """
+        Shows the tasks view and opens the selected task, loading its page if needed.
+
+        Args:
+            task_id (int): The ID of the selected task.
+        """
+        self._navigate("tasks")
+        self.views["tasks"].focus_task(task_id)
+
     def _on_change_theme(self):
         """
         Called when theme or font changes are triggered.
@@ -192,5 +235,23 @@ class TodoApp(ctk.CTk):
             if hasattr(v, "refresh"):
                 v.refresh()
 
+    def _on_close(self):
+        """
+        Called when the main window is closed.
+        Cancels and waits for the background export, import and backup jobs,
+        stops the database worker, flushes buffered settings, writes the query
+        statistics, then releases the shared database connections before
+        destroying the window.
+        """
+        if not cancel_running_jobs():
+            logging.warning("A background job did not stop before the database was closed")
+        get_worker().shutdown()
+        flush_settings()
+        logging.info("Identity map statistics: %s", cache_stats())
+        if recorder.dump(QUERY_STATS_PATH):
+            logging.info("Query statistics written to %s", QUERY_STATS_PATH)
+        shutdown_db()
+        self.destroy()
+
 if __name__ == "__main__":
     run_app()
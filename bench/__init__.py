@@ -0,0 +1,12 @@
+"""
+bench
+
+Benchmarks behind the performance figures quoted in the commit history.
+Each module is a script run from the repository root, e.g.
+
+    python -m bench.connection_pool
+
+Every run creates a scratch database in a temporary directory and removes it
+afterwards; data/database.db is never touched. Figures depend on the machine
+and the disk, so compare the rows of one run rather than absolute numbers.
+"""
@@ -0,0 +1,133 @@
+"""
+common.py
+
+Helpers shared by the benchmarks: a scratch database, generated tasks and
+timing and memory measurements.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from database.database import init_db, shutdown_db
+from controllers.task_controller import TaskController
+from controllers.project_controller import ProjectController
+
+# Generated task values: few distinct statuses and priorities, about 336 due dates and 24 times.
+STATUSES = ("not started", "in progress", "completed")
+PRIORITIES = ("low", "medium", "high")
+DUE_DATE_SPAN = 336
+TIMES = tuple(f"{hour:02d}:00" for hour in range(24))
+
+# Rows inserted per create_tasks_bulk / create_subtasks_bulk call while populating.
+POPULATE_BATCH = 10000
+
+@contextmanager
+def scratch_database():
+    """
+    Runs the block in a new temporary directory holding an initialized database.
+    DB_PATH is relative, so the shared pool and every controller use the scratch
+    file; the pool is shut down and the directory removed afterwards.
+
+    Yields:
+        str: The temporary directory.
+    """
+    previous = os.getcwd()
+    directory = tempfile.mkdtemp(prefix="tdl-bench-")
+    os.chdir(directory)
+    try:
+        init_db()
+        yield directory
+    finally:
+        shutdown_db()
+        os.chdir(previous)
+        shutil.rmtree(directory, ignore_errors=True)
+
+def populate_tasks(count: int, subtasks_per_task: int = 0, projects: int = 0) -> list:
+    """
+    Inserts generated tasks (and subtasks) into the current database. Tasks with
+    the "completed" status are marked done.
+
+    Args:
+        count (int): Number of tasks.
+        subtasks_per_task (int): Subtasks created for every task.
+        projects (int): Projects created; tasks are spread over them in turn.
+
+    Returns:
+        list: The task ids.
+    """
+    controller = TaskController()
+    for number in range(projects):
+        ProjectController().create_project(f"Project {number}")
+    project_rows, _ = controller.execute_query("SELECT id FROM projects ORDER BY id", fetch=True)
+    project_ids = [row[0] for row in project_rows or ()]
+    start = date(2026, 1, 1)
+    ids = []
+    for first in range(0, count, POPULATE_BATCH):
+        ids.extend(controller.create_tasks_bulk(
+            {
+                "title": f"Task {i}",
+                "description": f"Generated task number {i} for the benchmarks",
+                "due_date": start + timedelta(days=i % DUE_DATE_SPAN),
+                "time": TIMES[i % len(TIMES)],
+                "duration": 15 + i % 120,
+                "priority": PRIORITIES[i % len(PRIORITIES)],
+                "status": STATUSES[i % len(STATUSES)],
+                "project_id": project_ids[i % len(project_ids)] if project_ids else None,
+            }
+            for i in range(first, min(first + POPULATE_BATCH, count))
+        ))
+    for first in range(0, len(ids) * subtasks_per_task, POPULATE_BATCH):
+        last = min(first + POPULATE_BATCH, len(ids) * subtasks_per_task)
+        controller.create_subtasks_bulk(
+            {"task_id": ids[i // subtasks_per_task], "title": f"Subtask {i}", "description": "Generated subtask"}
+            for i in range(first, last)
+        )
+    controller.execute_query("UPDATE tasks SET done = 1 WHERE status = 'completed'")
+    return ids
+
+def timed(func, *args, **kwargs):
+    """
+    Calls func and measures the wall-clock time it takes.
+
+    Returns:
+        tuple: (result, seconds)
+    """
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+def traced(func, *args, **kwargs):
+    """
+    Calls func with tracemalloc running.
+
+    Returns:
+        tuple: (result, current_bytes, peak_bytes) where current_bytes is the memory
+               still allocated when func returns (held by the result) and peak_bytes
+               the highest amount allocated during the call.
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+def print_table(title: str, header: tuple, rows):
+    """
+    Prints rows as left-aligned columns under a title.
+
+    Args:
+        title (str): Printed above the table.
+        header (tuple): Column names.
+        rows (iterable): Tuples of printable values, one per line.
+    """
+    lines = [tuple(str(value) for value in header)] + [tuple(str(value) for value in row) for row in rows]
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    print(title)
+    for line in lines:
+        print("  " + "  ".join(value.ljust(width) for value, width in zip(line, widths)).rstrip())
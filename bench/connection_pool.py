@@ -0,0 +1,59 @@
+"""
+connection_pool.py
+
+Latency of point SELECTs run through TaskController.execute_query on the shared
+ConnectionPool, against opening and closing a connection for every statement as
+the controllers did before the pool.
+
+    python -m bench.connection_pool [--statements 2000] [--tasks 10000] [--rounds 5]
+"""
+
+import argparse
+import random
+from database.database import connect_db, close_db
+from controllers.task_controller import TaskController
+from bench.common import scratch_database, populate_tasks, timed, print_table
+
+POINT_SELECT = "SELECT * FROM tasks WHERE id = ?"
+
+def query_per_connection(query: str, params: tuple = (), fetch: bool = False):
+    """
+    The controllers' execute_query before the pool: connect, run, commit and close.
+    """
+    db = connect_db()
+    try:
+        cursor = db.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall() if fetch else None
+        db.commit()
+        return (rows, cursor.lastrowid)
+    finally:
+        close_db(db)
+
+def run_statements(execute, ids: list):
+    for task_id in ids:
+        execute(POINT_SELECT, (task_id,), fetch=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", type=int, default=2000, help="point SELECTs per round")
+    parser.add_argument("--tasks", type=int, default=10000, help="tasks in the scratch database")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per variant; the best is reported")
+    args = parser.parse_args()
+
+    with scratch_database():
+        task_ids = populate_tasks(args.tasks)
+        ids = random.Random(0).choices(task_ids, k=args.statements)
+        variants = (
+            ("connect/close per statement", query_per_connection),
+            ("pooled connection", TaskController().execute_query),
+        )
+        rows = []
+        for name, execute in variants:
+            best = min(timed(run_statements, execute, ids)[1] for _ in range(args.rounds))
+            rows.append((name, f"{best * 1e6 / args.statements:.1f} us"))
+    print_table(f"{args.statements} point SELECTs through execute_query (best of {args.rounds})",
+                ("variant", "per statement"), rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+json_export.py
+
+Throughput and peak memory of ExportController.export_json (JSON array, JSON
+Lines, gzip-compressed JSON Lines) against the export it replaced, which built
+the whole list with dataclasses.asdict() and wrote it with json.dump(indent=4).
+
+    python -m bench.json_export [--tasks 200000] [--subtasks-per-task 1]
+"""
+
+import argparse
+import json
+import os
+from dataclasses import asdict
+from controllers.export_controller import ExportController, FORMAT_JSON, FORMAT_NDJSON, JOB_DONE
+from controllers.task_controller import TaskController
+from bench.common import scratch_database, populate_tasks, timed, traced, print_table
+
+def export(path: str, fmt: str, compress: bool = False):
+    """
+    Runs export_json to completion.
+    """
+    job = ExportController().export_json(path, fmt, compress)
+    job.wait()
+    if job.status != JOB_DONE:
+        raise RuntimeError(f"Export of {path} {job.status}: {job.error}")
+
+def export_previous(path: str):
+    """
+    The JSON export before streaming: every task with its subtasks as a list of dicts, then one json.dump.
+    """
+    data = [asdict(t) for t in TaskController().iter_tasks(with_subtasks=True)]
+    with open(path, "w", encoding="utf-8") as jf:
+        json.dump(data, jf, ensure_ascii=False, indent=4)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200000, help="tasks in the scratch database")
+    parser.add_argument("--subtasks-per-task", type=int, default=1, help="subtasks created for every task")
+    args = parser.parse_args()
+
+    variants = (
+        ("JSON", "tasks.json", lambda path: export(path, FORMAT_JSON)),
+        ("JSON Lines", "tasks.jsonl", lambda path: export(path, FORMAT_NDJSON)),
+        ("JSON Lines gz", "tasks.jsonl.gz", lambda path: export(path, FORMAT_NDJSON, compress=True)),
+        ("previous", "previous.json", export_previous),
+    )
+    with scratch_database():
+        populate_tasks(args.tasks, args.subtasks_per_task)
+        timings = []
+        for name, path, run in variants:
+            _, seconds = timed(run, path)
+            timings.append((name, path, seconds))
+        # Compressed output is rated by the size of the JSON Lines it encodes.
+        document_size = os.path.getsize("tasks.jsonl")
+        rows = []
+        for name, path, seconds in timings:
+            size = os.path.getsize(path)
+            rated = document_size if path.endswith(".gz") else size
+            rows.append((name, f"{seconds:.2f} s", f"{size / 1e6:.1f} MB", f"{rated / 1e6 / seconds:.1f} MB/s"))
+        print_table(f"{args.tasks} tasks, {args.tasks * args.subtasks_per_task} subtasks",
+                    ("variant", "time", "file", "throughput"), rows)
+        # A separate pass: tracemalloc slows the exports down.
+        memory = []
+        for name, path, run in variants:
+            if name in ("JSON Lines", "previous"):
+                _, _, peak = traced(run, path)
+                memory.append((name, f"{peak / 2 ** 20:.1f} MiB"))
+        print_table("Peak traced memory", ("variant", "peak"), memory)
+
+if __name__ == "__main__":
+    main()
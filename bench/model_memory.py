@@ -0,0 +1,86 @@
+"""
+model_memory.py
+
+Memory held by Task objects hydrated from database rows: a regular dataclass
+with a per-instance __dict__, the slotted Task, and the slotted Task built by
+TaskController._task_from_row, which also interns the repeated status,
+priority, due date and time values. Measured with tracemalloc while the rows
+stream from SQLite, so the strings read for each task are counted too.
+
+    python -m bench.model_memory [--tasks 500000]
+"""
+
+import argparse
+from dataclasses import MISSING, field, fields, make_dataclass
+from database.database import connection
+from controllers.task_controller import TASK_COLUMNS, TaskController
+from models.task import Task
+from bench.common import scratch_database, populate_tasks, traced, print_table
+
+# Rows fetched from the cursor at a time.
+FETCH_SIZE = 1000
+
+def _plain_fields(cls) -> list:
+    """
+    Returns the fields of a dataclass in the form accepted by make_dataclass().
+    """
+    specs = []
+    for f in fields(cls):
+        default = field(default=f.default) if f.default is not MISSING else field(default_factory=f.default_factory)
+        specs.append((f.name, f.type, default))
+    return specs
+
+# Task as it was before the models were slotted.
+PlainTask = make_dataclass("PlainTask", _plain_fields(Task))
+
+def build_without_interning(cls):
+    """
+    Returns a row -> task function that builds cls the way _task_from_row did before interning.
+    """
+
+    def build(row):
+        (id_, title, desc, created_at, updated_at, due_date, time_field, dur,
+         priority, status, done_val, proj_id) = row
+        return cls(
+            id=id_, title=title, description=desc or "", created_at=created_at, updated_at=updated_at,
+            due_date=due_date, time=time_field, duration=dur, priority=priority, status=status,
+            done=bool(done_val), project_id=proj_id
+        )
+
+    return build
+
+def hydrate(build) -> list:
+    """
+    Streams every task row and keeps the object built from each.
+    """
+    tasks = []
+    with connection() as db:
+        cursor = db.execute(f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            tasks.extend(build(row) for row in rows)
+    return tasks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500000, help="tasks in the scratch database")
+    args = parser.parse_args()
+
+    variants = (
+        ("regular dataclass", build_without_interning(PlainTask)),
+        ("slots", build_without_interning(Task)),
+        ("slots + interning", TaskController._task_from_row),
+    )
+    with scratch_database():
+        populate_tasks(args.tasks)
+        rows = []
+        for name, build in variants:
+            tasks, current, _ = traced(hydrate, build)
+            rows.append((name, f"{current / 2 ** 20:.1f} MiB", f"{current / len(tasks):.0f} B/task"))
+            del tasks
+    print_table(f"Memory held after hydrating {args.tasks} tasks (tracemalloc)", ("variant", "total", "per task"), rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+task_store.py
+
+Dashboard-style analytics on the columnar task store against the same figures
+computed with Python loops over the Task objects of iter_tasks(): counts by
+status and project, due date buckets and planned time of open tasks, a 3-way
+facet and a month of per-day counts. The results of both are checked to be
+equal. The indexed SQL aggregate behind the dashboard workload is timed too.
+Needs NumPy.
+
+    python -m bench.task_store [--tasks 1000000] [--projects 20] [--rounds 3]
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import date, timedelta
+from controllers.task_controller import TaskController, overdue_cache, store_cache
+from controllers.task_store import columnar_available
+from bench.common import scratch_database, populate_tasks, timed, print_table
+
+# Reference day of the due date buckets, inside the generated due dates.
+TODAY = date(2026, 6, 15)
+# Month counted per day.
+MONTH_START, MONTH_END = date(2026, 6, 1), date(2026, 6, 30)
+# Facet selected by both variants: project, status and priority.
+FACET = {"status": "in progress", "priority": "high"}
+
+def columnar_analytics(store, project_id: int) -> dict:
+    open_tasks = store.mask(done=False)
+    return {
+        "status": store.count_by("status"),
+        "project": store.count_by("project_id"),
+        "buckets": store.due_buckets(TODAY, mask=open_tasks),
+        "minutes": store.total_duration(open_tasks),
+        "facet": store.count(store.mask(project_id=project_id, **FACET)),
+        "days": store.count_by_day(MONTH_START, MONTH_END),
+    }
+
+def loop_analytics(tasks: list, project_id: int) -> dict:
+    today, tomorrow, week_end = TODAY.isoformat(), (TODAY + timedelta(days=1)).isoformat(), \
+        (TODAY + timedelta(days=7)).isoformat()
+    month_start, month_end = MONTH_START.isoformat(), MONTH_END.isoformat()
+    buckets = dict.fromkeys(("overdue", "today", "this_week", "later", "no_date"), 0)
+    status, project, days = Counter(), Counter(), Counter()
+    minutes = facet = 0
+    for t in tasks:
+        status[t.status] += 1
+        project[t.project_id] += 1
+        if t.due_date is not None and month_start <= t.due_date <= month_end:
+            days[t.due_date] += 1
+        if t.project_id == project_id and t.status == FACET["status"] and t.priority == FACET["priority"]:
+            facet += 1
+        if t.done:
+            continue
+        minutes += t.duration or 0
+        if t.due_date is None:
+            buckets["no_date"] += 1
+        elif t.due_date < today:
+            buckets["overdue"] += 1
+        elif t.due_date < tomorrow:
+            buckets["today"] += 1
+        elif t.due_date < week_end:
+            buckets["this_week"] += 1
+        else:
+            buckets["later"] += 1
+    return {
+        "status": dict(status), "project": dict(project), "buckets": buckets, "minutes": minutes,
+        "facet": facet, "days": dict(days),
+    }
+
+def load_store(controller: TaskController):
+    store_cache.invalidate()
+    return controller.load_task_store()
+
+def sql_workload(controller: TaskController) -> dict:
+    overdue_cache.invalidate()
+    return controller.get_workload()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000000, help="tasks in the scratch database")
+    parser.add_argument("--projects", type=int, default=20, help="projects the tasks are spread over")
+    parser.add_argument("--rounds", type=int, default=3, help="analytics rounds; the best is reported")
+    args = parser.parse_args()
+    if not columnar_available():
+        sys.exit("NumPy is not installed: the columnar task store is unavailable.")
+
+    controller = TaskController()
+    with scratch_database():
+        populate_tasks(args.tasks, projects=args.projects)
+        project_id = args.projects or None
+        tasks, list_build = timed(lambda: list(controller.iter_tasks()))
+        store, store_build = timed(load_store, controller)
+        _, store_reload = timed(controller.load_task_store)
+        loop_result = loop_analytics(tasks, project_id)
+        store_result = columnar_analytics(store, project_id)
+        if loop_result != store_result:
+            sys.exit("The columnar results differ from the Python loops.")
+        loop_time = min(timed(loop_analytics, tasks, project_id)[1] for _ in range(args.rounds))
+        store_time = min(timed(columnar_analytics, store, project_id)[1] for _ in range(args.rounds))
+        facet_time = min(timed(lambda: store.count(store.mask(project_id=project_id, **FACET)))[1]
+                         for _ in range(args.rounds))
+        # get_workload() buckets around the current day, so only its time is comparable.
+        _, workload_time = timed(sql_workload, controller)
+        store_size = sum(array.nbytes for array in (store.ids, store.project_ids, store.status, store.priority,
+                                                    store.due, store.duration, store.done))
+    print_table(f"{args.tasks} tasks, {args.projects} projects (results verified equal)",
+                ("step", "dataclasses", "columnar"), [
+                    ("build", f"{list_build:.2f} s",
+                     f"{store_build:.2f} s ({store_size / 2 ** 20:.0f} MiB of arrays; cached reload {store_reload * 1e6:.0f} us)"),
+                    ("analytics", f"{loop_time * 1000:.0f} ms", f"{store_time * 1000:.0f} ms"),
+                    ("one facet mask + count", "", f"{facet_time * 1000:.1f} ms"),
+                ])
+    print(f"Dashboard workload (indexed SQL aggregate, uncached): {workload_time * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ task_row.py
 TaskRow represents a single row in the task table, showing task details such as title,
 project, status, priority, due date, and last update. It also provides inline editing features
 and a toggle for displaying additional details.
+Rows display a TaskSummary; the full Task shown in the details panel is requested
+through on_toggle_details and handed back to show_details().
 
 It uses a common grid configuration from grid_config.py for consistent column layouts.
 """
@@ -11,9 +13,10 @@ It uses a common grid configuration from grid_config.py for consistent column la
 import customtkinter as ctk
 from theme import get_font
 from components.task_details import TaskDetails
-from datetime import datetime, date
+from datetime import datetime
 from tkcalendar import DateEntry
 from components.grid_config import COMMON_GRID_CONFIG
+from utils.dates import format_due, format_timestamp, parse_datetime
 
 SEPARATOR_COLOR = "#CCCCCC"
 
@@ -24,10 +27,11 @@ class TaskRow(ctk.CTkFrame):
 
         Args:
             master: Parent container.
-            task (Task): The task instance to represent.
+            task (TaskSummary): The task to represent.
             on_update (callable): Callback to invoke when the task is updated.
             on_delete (callable): Callback to invoke when deleting the task.
-            on_toggle_details (callable): Callback to toggle the detailed view.
+            on_toggle_details (callable): Called with the task ID to request the full task
+                for the details panel, which is then passed to show_details().
             on_field_edit (callable): Callback to handle inline field edits.
             on_details_save (callable): Callback to save updated task details.
             on_subtask_update (callable): Callback to handle subtask updates.
@@ -41,16 +45,18 @@ class TaskRow(ctk.CTkFrame):
         self.on_details_save = on_details_save
         self.on_subtask_update = on_subtask_update
         self.details_shown = False
+        self.details_frame = None
         self.due_date_editor = None
 
         # Variables for inline editing.
         self.select_var = ctk.BooleanVar(value=False)
         self.title_var = ctk.StringVar(value=self.task.title)
-        self.project_var = ctk.StringVar(value=getattr(self.task, "project", "None"))
-        self.status_var = ctk.StringVar(value=getattr(self.task, "status", "Not Started"))
-        self.priority_var = ctk.StringVar(value=getattr(self.task, "priority", "Medium"))
-        self.duedate_var = ctk.StringVar(value=self._format_date(self.task.due_date, default_today=True))
-        self.updated_var = ctk.StringVar(value=self._format_date(self.task.updated_at, modifiable=False))
+        self.title_display_var = ctk.StringVar(value=self._title_text(self.task))
+        self.project_var = ctk.StringVar(value=self.task.project or "None")
+        self.status_var = ctk.StringVar(value=self._display_choice(getattr(self.task, "status", None), "Not Started"))
+        self.priority_var = ctk.StringVar(value=self._display_choice(getattr(self.task, "priority", None), "Medium"))
+        self.duedate_var = ctk.StringVar(value=format_due(self.task.due_date, self.task.time, default_today=True))
+        self.updated_var = ctk.StringVar(value=format_timestamp(self.task.updated_at))
         
         # Apply common grid configuration.
         for col, conf in COMMON_GRID_CONFIG.items():
@@ -58,29 +64,34 @@ class TaskRow(ctk.CTkFrame):
         
         self._create_widgets()
 
-    def _format_date(self, date_str, default_today=False, modifiable=True) -> str:
+    @staticmethod
+    def _display_choice(value, default) -> str:
         """
-        Formats an ISO date string into a display format.
+        Formats a stored status or priority (e.g. "in progress") for display ("In Progress").
 
         Args:
-            date_str (str): The ISO date string.
-            default_today (bool): If True and date_str is empty, use today's date.
-            modifiable (bool): Flag indicating if field is modifiable.
-        
+            value (str): The stored value.
+            default (str): Text shown when no value is set.
+
         Returns:
-            str: Formatted date string.
+            str: The display text.
         """
-        if not date_str:
-            if default_today:
-                dt = datetime.combine(date.today(), datetime.strptime("00:00", "%H:%M").time())
-            else:
-                return ""
-        else:
-            try:
-                dt = datetime.fromisoformat(date_str)
-            except Exception:
-                return date_str
-        return dt.strftime("%d/%m - %H:%M")
+        return value.title() if value else default
+
+    @staticmethod
+    def _title_text(task) -> str:
+        """
+        Formats the title label: the title, followed by done/total subtasks when there are any.
+
+        Args:
+            task (TaskSummary): The displayed task.
+
+        Returns:
+            str: e.g. "Write report (2/5)".
+        """
+        if not task.subtasks_total:
+            return task.title
+        return f"{task.title} ({task.subtasks_done}/{task.subtasks_total})"
 
     def _vertical_separator(self):
         """
@@ -104,7 +115,7 @@ class TaskRow(ctk.CTkFrame):
         sep1.grid(row=0, column=1, padx=2, pady=3)
 
         # Title label (clickable to enter edit mode).
-        self.title_label = ctk.CTkLabel(self, textvariable=self.title_var, anchor="w", font=get_font("button"))
+        self.title_label = ctk.CTkLabel(self, textvariable=self.title_display_var, anchor="w", font=get_font("button"))
         self.title_label.grid(row=0, column=2, padx=3, pady=3, sticky="nsew")
         self.title_label.bind("<Button-1>", lambda e: self._enter_edit_mode("title"))
 
@@ -237,7 +248,9 @@ class TaskRow(ctk.CTkFrame):
 
         self.date_entry = DateEntry(self.due_date_editor, date_pattern="dd/mm/yyyy")
         try:
-            current_dt = datetime.strptime(self.duedate_var.get(), "%d/%m - %H:%M")
+            day = parse_datetime(self.task.due_date)[0]
+            clock = datetime.strptime(self.task.time, "%H:%M").time() if self.task.time else datetime.min.time()
+            current_dt = datetime.combine(day, clock)
         except Exception:
             current_dt = datetime.now()
         self.date_entry.set_date(current_dt.date())
@@ -274,9 +287,9 @@ class TaskRow(ctk.CTkFrame):
         except Exception:
             minute = 0
         dt = datetime.combine(selected_date, datetime.strptime(f"{hour:02d}:{minute:02d}", "%H:%M").time())
-        formatted = dt.strftime("%d/%m - %H:%M")
-        self.duedate_var.set(formatted)
-        self.on_field_edit("due_date", formatted, self.task)
+        self.duedate_var.set(format_due(dt.date().isoformat(), dt.strftime("%H:%M")))
+        # The datetime is converted to the stored date and time by the view.
+        self.on_field_edit("due_date", dt, self.task)
         self.on_update(self.task)
         if self.due_date_editor is not None:
             self.due_date_editor.destroy()
@@ -295,6 +308,8 @@ class TaskRow(ctk.CTkFrame):
             entry_widget.configure(border_color="red")
             self.after(500, lambda: entry_widget.configure(border_color="transparent"))
             return
+        if field == "title":
+            self.title_display_var.set(self._title_text(self.task._replace(title=new_value)))
         self.on_field_edit(field, new_value, self.task)
         self.on_update(self.task)
 
@@ -313,25 +328,60 @@ class TaskRow(ctk.CTkFrame):
                                 command=lambda: confirm_frame.destroy())
         no_btn.grid(row=0, column=2, padx=5, pady=5)
 
+    def refresh(self, task):
+        """
+        Shows the current values of a task that was changed elsewhere, without rebuilding the row.
+        An open details panel is rebuilt so it shows the new subtasks and fields.
+
+        Args:
+            task (TaskSummary): The updated task.
+        """
+        self.task = task
+        self.title_var.set(task.title)
+        self.title_display_var.set(self._title_text(task))
+        self.project_var.set(task.project or "None")
+        self.status_var.set(self._display_choice(getattr(task, "status", None), "Not Started"))
+        self.priority_var.set(self._display_choice(getattr(task, "priority", None), "Medium"))
+        self.duedate_var.set(format_due(task.due_date, task.time, default_today=True))
+        self.updated_var.set(format_timestamp(task.updated_at))
+        if self.details_shown:
+            self.on_toggle_details(task.id)
+
     def toggle_details(self):
         """
-        Toggles the display of task details.
+        Toggles the display of task details. Opening requests the full task through
+        on_toggle_details; the panel is built when it arrives in show_details().
         """
         if not self.details_shown:
             if self.due_date_editor is not None:
                 self.due_date_editor.destroy()
                 self.due_date_editor = None
-            self.details_frame = TaskDetails(
-                self,
-                task=self.task,
-                on_save=self.on_details_save,
-                on_subtask_update=self.on_subtask_update
-            )
-            self.details_frame.grid(row=1, column=0, columnspan=15, sticky="ew", pady=5, padx=5)
-            self.toggle_btn.configure(text="▲")
             self.details_shown = True
+            self.toggle_btn.configure(text="▲")
+            self.on_toggle_details(self.task.id)
         else:
-            if self.details_frame:
-                self.details_frame.grid_forget()
+            if self.details_frame is not None:
+                self.details_frame.destroy()
+                self.details_frame = None
             self.toggle_btn.configure(text="▼")
             self.details_shown = False
+
+    def show_details(self, task):
+        """
+        Builds the details panel for the full task requested by toggle_details().
+        Ignored if the panel was closed in the meantime.
+
+        Args:
+            task (Task): The task with its description and subtasks.
+        """
+        if not self.details_shown:
+            return
+        if self.details_frame is not None:
+            self.details_frame.destroy()
+        self.details_frame = TaskDetails(
+            self,
+            task=task,
+            on_save=self.on_details_save,
+            on_subtask_update=self.on_subtask_update
+        )
+        self.details_frame.grid(row=1, column=0, columnspan=15, sticky="ew", pady=5, padx=5)
@@ -13,18 +13,20 @@ from theme import get_font
 
 class TaskTable(ctk.CTkFrame):
     def __init__(self, master, tasks, on_select_all, on_delete_selected, on_filter_sort_change, 
-                 on_update, on_delete, on_field_edit, on_details_save, on_subtask_update, **kwargs):
+                 on_update, on_delete, on_toggle_details, on_field_edit, on_details_save, on_subtask_update, **kwargs):
         """
         Initialize TaskTable.
 
         Args:
             master: Parent widget.
-            tasks (list): List of Task objects.
+            tasks (list): List of TaskSummary rows.
             on_select_all (callable): Callback for selecting/deselecting all tasks.
             on_delete_selected (callable): Callback to delete selected tasks.
             on_filter_sort_change (callable): Callback for filtering/sorting.
             on_update (callable): Callback when a task is updated.
             on_delete (callable): Callback when a task is deleted.
+            on_toggle_details (callable): Called with a task ID when its details panel opens;
+                the full task is handed back through show_details().
             on_field_edit (callable): Callback for inline field editing.
             on_details_save (callable): Callback for saving task details.
             on_subtask_update (callable): Callback to manage subtask updates.
@@ -37,6 +39,7 @@ class TaskTable(ctk.CTkFrame):
         self.on_filter_sort_change = on_filter_sort_change
         self.on_update = on_update
         self.on_delete = on_delete
+        self.on_toggle_details = on_toggle_details
         self.on_field_edit = on_field_edit
         self.on_details_save = on_details_save
         self.on_subtask_update = on_subtask_update
@@ -77,14 +80,24 @@ class TaskTable(ctk.CTkFrame):
         for widget in self.rows_container.winfo_children():
             widget.destroy()
         self.task_rows = {}
-        row_index = 0
-        for task in self.tasks:
+        self.next_row_index = 0
+        self._add_task_rows(self.tasks)
+
+    def _add_task_rows(self, tasks):
+        """
+        Appends a TaskRow widget for each task below the existing rows.
+
+        Args:
+            tasks (list): TaskSummary rows to add.
+        """
+        row_index = self.next_row_index
+        for task in tasks:
             task_row = TaskRow(
                 self.rows_container,
                 task=task,
                 on_update=self.on_update,
                 on_delete=self.on_delete,
-                on_toggle_details=lambda task=task: self._toggle_row_details(task),
+                on_toggle_details=self.on_toggle_details,
                 on_field_edit=self.on_field_edit,
                 on_details_save=self.on_details_save,
                 on_subtask_update=self.on_subtask_update
@@ -93,23 +106,63 @@ class TaskTable(ctk.CTkFrame):
             task_row.grid(row=row_index, column=0, sticky="ew", padx=5, pady=3)
             self.task_rows[task.id] = task_row
             row_index += 1
+        # Grid rows of removed tasks are left empty, so new rows always go below the last one.
+        self.next_row_index = row_index
 
     def refresh(self, tasks):
         """
         Refreshes the entire task table with an updated list of tasks.
 
         Args:
-            tasks (list): Updated list of Task objects.
+            tasks (list): Updated list of TaskSummary rows.
         """
         self.tasks = tasks
         self._create_task_rows()
 
-    def _toggle_row_details(self, task):
+    def append_tasks(self, tasks):
+        """
+        Adds another page of tasks to the table without rebuilding existing rows.
+
+        Args:
+            tasks (list): TaskSummary rows to append.
+        """
+        self.tasks.extend(tasks)
+        self._add_task_rows(tasks)
+
+    def update_task(self, task):
+        """
+        Refreshes the row showing a task that was changed elsewhere.
+
+        Args:
+            task (TaskSummary): The updated task.
+        """
+        row = self.task_rows.get(task.id)
+        if row is None:
+            return
+        self.tasks = [task if t.id == task.id else t for t in self.tasks]
+        row.refresh(task)
+
+    def remove_tasks(self, task_ids):
+        """
+        Removes the rows of deleted tasks; the other rows are kept as they are.
+
+        Args:
+            task_ids (iterable): IDs of the deleted tasks.
+        """
+        removed = {tid for tid in task_ids if tid in self.task_rows}
+        if not removed:
+            return
+        for tid in removed:
+            self.task_rows.pop(tid).destroy()
+        self.tasks = [t for t in self.tasks if t.id not in removed]
+
+    def show_details(self, task):
         """
-        Toggles the detailed view for a specific task row.
+        Hands a full task requested through on_toggle_details to its row.
 
         Args:
-            task (Task): The task for which details should be toggled.
+            task (Task): The task with its description and subtasks.
         """
-        if task.id in self.task_rows:
-            self.task_rows[task.id].toggle_details()
+        row = self.task_rows.get(task.id)
+        if row is not None:
+            row.show_details(task)
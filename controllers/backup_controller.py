@@ -0,0 +1,140 @@
+"""
+backup_controller.py
+
+BackupController takes snapshots of the database and restores them on a
+background thread (see database/backup.py), reporting page progress through a
+BackupJob that can be cancelled like an export. Only the BACKUP_KEEP most
+recent snapshots are kept.
+
+Restoring first snapshots the current database, so a restore can itself be
+undone, then drops every cached object and publishes DATABASE_RESTORED so the
+views reload.
+"""
+
+from database.backup import (
+    BACKUP_KEEP, BACKUP_STEP_PAGES, backup_to, list_snapshots, restore_from, rotate_snapshots, snapshot_path
+)
+from controllers.export_controller import ExportJob
+from controllers.identity_map import clear_caches
+from controllers.settings_controller import flush_settings, clear_settings_cache
+from controllers import events
+
+# BackupJob.phase values.
+PHASE_BACKUP = "backup"
+PHASE_RESTORE = "restore"
+
+class BackupJob(ExportJob):
+    """
+    A background backup or restore. Progress is reported in database pages as
+    on_progress(pages_copied, total_pages), once per phase.
+
+    Attributes:
+        phase (str): PHASE_BACKUP while a snapshot is written, PHASE_RESTORE while one is restored.
+        restore_path (str): The snapshot a restore job restores; None for backups.
+        snapshot (str): Path of the snapshot written by the job, if any.
+        deleted (list): Snapshots removed by the rotation.
+    """
+
+    SOURCE = "BackupController"
+    ACTION = "backing up"
+
+    def __init__(self, target, on_progress=None, on_done=None, dispatcher=None, restore_path: str = None):
+        super().__init__(target, on_progress, on_done, dispatcher)
+        if restore_path is not None:
+            self.ACTION = "restoring"
+        self.restore_path = restore_path
+        self.phase = PHASE_BACKUP
+        self.snapshot = None
+        self.deleted = []
+
+    def report(self, pages_copied: int, total_pages: int):
+        """
+        Checks for cancellation, then records and reports the pages copied. Called between backup steps.
+        """
+        self.check_cancelled()
+        self.rows_written = pages_copied
+        self.total_rows = total_pages
+        self._notify(self.on_progress, pages_copied, total_pages)
+
+class BackupController:
+    """
+    Controller for database snapshots.
+    """
+
+    def __init__(self, dispatcher=None):
+        """
+        Args:
+            dispatcher (callable): Delivers job callbacks, e.g. DatabaseWorker.call_soon.
+        """
+        self.dispatcher = dispatcher
+
+    def list_snapshots(self) -> list:
+        """
+        Returns the available snapshots, newest first.
+
+        Returns:
+            list: Snapshot tuples (path, created, size).
+        """
+        return list_snapshots()
+
+    def create_snapshot(self, on_progress=None, on_done=None, keep: int = BACKUP_KEEP,
+                        pages: int = BACKUP_STEP_PAGES) -> BackupJob:
+        """
+        Starts writing a snapshot of the database on a background thread, then
+        deletes the snapshots beyond the keep most recent. The application keeps
+        reading and writing meanwhile; the snapshot is the database as of the start.
+
+        Args:
+            on_progress (callable): Called as on_progress(pages_copied, total_pages).
+            on_done (callable): Called with the job when it has finished; job.snapshot is the new file.
+            keep (int): Number of snapshots kept.
+            pages (int): Pages copied per step.
+
+        Returns:
+            BackupJob: The started job.
+        """
+
+        def run(job):
+            self._snapshot(job, pages)
+            job.deleted = rotate_snapshots(keep)
+
+        return BackupJob(run, on_progress, on_done, self.dispatcher).start()
+
+    def restore_snapshot(self, path: str, on_progress=None, on_done=None,
+                         pages: int = BACKUP_STEP_PAGES) -> BackupJob:
+        """
+        Starts replacing the database with a snapshot on a background thread.
+        The current database is snapshotted first (job.snapshot); it is not rotated
+        away by this job, so the restored snapshot also stays available. Changes
+        committed after the safety snapshot are lost; writers wait while the copy runs.
+
+        Args:
+            path (str): The snapshot to restore.
+            on_progress (callable): Called as on_progress(pages_copied, total_pages) for
+                the safety snapshot, then again for the restore (see job.phase).
+            on_done (callable): Called with the job when it has finished.
+            pages (int): Pages copied per step.
+
+        Returns:
+            BackupJob: The started job.
+        """
+
+        def run(job):
+            self._snapshot(job, pages)
+            job.phase = PHASE_RESTORE
+            restore_from(path, job.report, pages)
+            # The objects cached in memory belong to the replaced database.
+            clear_caches()
+            clear_settings_cache()
+            events.bus.publish(events.DATABASE_RESTORED, ())
+
+        return BackupJob(run, on_progress, on_done, self.dispatcher, restore_path=path).start()
+
+    @staticmethod
+    def _snapshot(job: BackupJob, pages: int):
+        """
+        Writes buffered settings, then a new snapshot of the database, recording it on the job.
+        """
+        flush_settings()
+        job.snapshot = backup_to(snapshot_path(), job.report, pages)
+        job.paths.append(job.snapshot)
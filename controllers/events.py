@@ -0,0 +1,121 @@
+"""
+events.py
+
+Publish/subscribe bus for data-change events emitted by the controllers.
+Every successful write publishes a ChangeEvent carrying the affected ids and
+the names of the changed fields, so views can update the affected widgets
+instead of reloading everything.
+
+Events raised inside transaction() are held back until the transaction
+commits and dropped if it rolls back. Handlers run through the bus
+dispatcher; the application routes them to the Tk thread.
+"""
+
+import threading
+from collections import namedtuple
+from database.database import current_transaction
+
+TASK_CREATED = "task_created"
+TASK_UPDATED = "task_updated"
+TASK_DELETED = "task_deleted"
+PROJECT_CREATED = "project_created"
+PROJECT_UPDATED = "project_updated"
+PROJECT_DELETED = "project_deleted"
+# The whole database was replaced (e.g. restored from a snapshot); published without ids.
+DATABASE_RESTORED = "database_restored"
+
+# Field name reported in TASK_UPDATED when a task's subtasks were added, edited or removed.
+SUBTASKS_FIELD = "subtasks"
+
+# type: one of the constants above; ids: tuple of primary keys;
+# fields: tuple of changed field names (empty for creations and deletions).
+ChangeEvent = namedtuple("ChangeEvent", ["type", "ids", "fields"])
+
+class EventBus:
+    """
+    Delivers change events to the handlers subscribed to their type.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._direct = set()
+        self._lock = threading.Lock()
+        self._dispatcher = None
+
+    def set_dispatcher(self, dispatcher):
+        """
+        Sets the function used to invoke handlers, e.g. DatabaseWorker.call_soon to
+        run them on the Tk thread. Without a dispatcher handlers are called directly.
+
+        Args:
+            dispatcher (callable or None): Called as dispatcher(handler, event).
+        """
+        self._dispatcher = dispatcher
+
+    def subscribe(self, event_type: str, handler, direct: bool = False):
+        """
+        Registers handler for events of event_type.
+
+        Args:
+            event_type (str): One of the event type constants.
+            handler (callable): Called with the ChangeEvent.
+            direct (bool): If True, call the handler on the publishing thread, bypassing
+                the dispatcher. Meant for cache invalidation, not for widgets.
+        """
+        with self._lock:
+            handlers = self._handlers.setdefault(event_type, [])
+            if handler not in handlers:
+                handlers.append(handler)
+            if direct:
+                self._direct.add((event_type, handler))
+
+    def unsubscribe(self, event_type: str, handler):
+        """
+        Removes a handler registered with subscribe(); unknown handlers are ignored.
+
+        Args:
+            event_type (str): The event type the handler was registered for.
+            handler (callable): The handler to remove.
+        """
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            self._direct.discard((event_type, handler))
+
+    def publish(self, event_type: str, ids, fields=()):
+        """
+        Publishes a change event. Inside a transaction the event is delivered
+        after the commit, or not at all if the transaction rolls back.
+
+        Args:
+            event_type (str): One of the event type constants.
+            ids (iterable): Primary keys of the changed rows.
+            fields (iterable): Names of the changed fields.
+        """
+        event = ChangeEvent(event_type, tuple(ids), tuple(fields))
+        if not event.ids and event_type != DATABASE_RESTORED:
+            return
+        tx = current_transaction()
+        if tx is not None:
+            tx.on_commit(lambda: self._deliver(event))
+        else:
+            self._deliver(event)
+
+    def _deliver(self, event: ChangeEvent):
+        """
+        Invokes every handler subscribed to the event's type.
+        """
+        with self._lock:
+            handlers = [(h, (event.type, h) in self._direct) for h in self._handlers.get(event.type, [])]
+        for handler, direct in handlers:
+            if self._dispatcher is not None and not direct:
+                self._dispatcher(handler, event)
+                continue
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"[EventBus] Error in handler for {event.type}: {e}")
+
+# Shared by every controller and view.
+bus = EventBus()
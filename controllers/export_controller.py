@@ -0,0 +1,427 @@
+"""
+export_controller.py
+
+ExportController writes tasks (and optionally their subtasks) to files without
+loading them into memory: rows are streamed from a database cursor in chunks
+and written through a buffered file on a background thread. Each export is an
+ExportJob that reports progress, can be cancelled, and only replaces the
+destination file once it is complete.
+
+Formats: CSV (tasks, plus an optional subtasks CSV), and JSON or JSON Lines
+with each task's subtasks nested in it, optionally gzip-compressed.
+"""
+
+import csv
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from database.database import connection
+from database.instrumentation import track, timed
+from controllers.task_controller import TASK_COLUMNS
+
+# Columns that can be exported: the task columns in table order, then the project name.
+TASK_EXPORT_FIELDS = tuple(c.strip() for c in TASK_COLUMNS.split(",")) + ("project",)
+SUBTASK_EXPORT_FIELDS = ("id", "task_id", "title", "description", "done")
+# Subtasks in the order the task cursor is merged with; subtasks.task_id is nullable and
+# orphaned subtasks (NULL task_id) belong to no task, so they are not exported.
+SUBTASK_EXPORT_QUERY = (
+    f"SELECT {', '.join(SUBTASK_EXPORT_FIELDS)} FROM subtasks WHERE task_id IS NOT NULL ORDER BY task_id, id"
+)
+
+# SQL expression of each exported task field; tasks are selected as t.
+TASK_EXPORT_EXPRESSIONS = {field: f"t.{field}" for field in TASK_EXPORT_FIELDS}
+TASK_EXPORT_EXPRESSIONS["project"] = "(SELECT name FROM projects WHERE id = t.project_id)"
+
+# Columns exported when the caller does not choose.
+DEFAULT_TASK_EXPORT_FIELDS = ("id", "title", "description", "due_date", "time", "duration", "done", "project")
+
+# Rows fetched from the cursor (and written) at a time.
+EXPORT_CHUNK_SIZE = 1000
+# Size of the write buffer of export files.
+EXPORT_BUFFER_SIZE = 1 << 20
+# gzip compression level of compressed exports (1 = fastest, 9 = smallest).
+GZIP_LEVEL = 6
+
+# JSON export formats: one JSON array, or one JSON object per line.
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+
+# ExportJob.status values (also used by import jobs).
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+
+# Seconds cancel_running_jobs() waits for each job to stop by default.
+JOB_STOP_TIMEOUT = 5.0
+
+# Jobs whose thread has started and not yet finished.
+_running_jobs = set()
+_running_lock = threading.Lock()
+
+class ExportCancelled(Exception):
+    """
+    Raised inside an export when its job has been cancelled.
+    """
+
+class ExportJob:
+    """
+    A background export. Callbacks are invoked through the dispatcher given to
+    ExportController (e.g. DatabaseWorker.call_soon to run them on the Tk thread).
+    """
+
+    # Used in error messages.
+    SOURCE = "ExportController"
+    ACTION = "exporting"
+
+    def __init__(self, target, on_progress=None, on_done=None, dispatcher=None):
+        """
+        Args:
+            target (callable): Called with the job on the export thread; writes the files.
+            on_progress (callable): Called as on_progress(rows_written, total_rows).
+            on_done (callable): Called as on_done(job) once the job has finished.
+            dispatcher (callable): Called as dispatcher(func, *args) to deliver callbacks;
+                callbacks are invoked directly on the export thread when None.
+        """
+        self.target = target
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.dispatcher = dispatcher
+        self.status = JOB_RUNNING
+        self.error = None
+        self.rows_written = 0
+        self.total_rows = 0
+        self.paths = []
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+
+    def start(self):
+        with _running_lock:
+            _running_jobs.add(self)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """
+        Requests cancellation; the export stops after the chunk being written.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits for the export thread to finish.
+
+        Returns:
+            bool: True if the job has finished.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def check_cancelled(self):
+        """
+        Raises ExportCancelled if cancel() was called. Called by writers between chunks.
+        """
+        if self._cancelled.is_set():
+            raise ExportCancelled()
+
+    def advance(self, rows: int):
+        """
+        Records rows written and reports progress.
+        """
+        self.rows_written += rows
+        self._notify(self.on_progress, self.rows_written, self.total_rows)
+
+    def _notify(self, callback, *args):
+        if callback is None:
+            return
+        if self.dispatcher is not None:
+            self.dispatcher(callback, *args)
+        else:
+            callback(*args)
+
+    def _run(self):
+        try:
+            self.target(self)
+            self.status = JOB_DONE
+        except ExportCancelled:
+            self.status = JOB_CANCELLED
+        except Exception as e:
+            self.status = JOB_FAILED
+            self.error = e
+            print(f"[{self.SOURCE}] Error {self.ACTION}: {e}")
+        finally:
+            with _running_lock:
+                _running_jobs.discard(self)
+        self._notify(self.on_done, self)
+
+def cancel_running_jobs(timeout: float = JOB_STOP_TIMEOUT) -> bool:
+    """
+    Cancels every running export, import and backup job and waits for their
+    threads to finish, e.g. before the database connections are closed on exit.
+
+    Args:
+        timeout (float): Seconds to wait for each job.
+
+    Returns:
+        bool: True if every job has finished.
+    """
+    with _running_lock:
+        jobs = list(_running_jobs)
+    for job in jobs:
+        job.cancel()
+    return all([job.wait(timeout) for job in jobs])
+
+class ExportController:
+    """
+    Controller for exporting tasks and subtasks to files.
+    """
+
+    def __init__(self, dispatcher=None):
+        """
+        Args:
+            dispatcher (callable): Delivers job callbacks, e.g. DatabaseWorker.call_soon.
+        """
+        self.dispatcher = dispatcher
+
+    def export_csv(self, path: str, fields=DEFAULT_TASK_EXPORT_FIELDS, subtasks_path: str = None,
+                   on_progress=None, on_done=None, chunk_size: int = EXPORT_CHUNK_SIZE) -> ExportJob:
+        """
+        Starts exporting tasks to a CSV file on a background thread.
+        Tasks and subtasks are read from the same snapshot of the database.
+
+        Args:
+            path (str): Destination of the tasks CSV.
+            fields (iterable): Task columns to export, from TASK_EXPORT_FIELDS.
+            subtasks_path (str): Optional destination of a second CSV with every subtask of a task.
+            on_progress (callable): Called as on_progress(rows_written, total_rows).
+            on_done (callable): Called with the job when it has finished.
+            chunk_size (int): Rows fetched and written at a time.
+
+        Returns:
+            ExportJob: The started job.
+
+        Raises:
+            ValueError: If a field cannot be exported.
+        """
+        fields = self._check_fields(fields)
+
+        def write(job):
+            with connection() as db:
+                # One read transaction keeps tasks and subtasks consistent with each other.
+                db.execute("BEGIN")
+                job.total_rows = self._count(db, "tasks") + (
+                    self._count(db, "subtasks", "task_id IS NOT NULL") if subtasks_path else 0
+                )
+                # Neither file replaces its destination until both are complete.
+                with self._staged_outputs() as staged:
+                    self._write_csv(job, db, path, fields, self._task_query(fields), chunk_size, staged)
+                    if subtasks_path:
+                        self._write_csv(job, db, subtasks_path, SUBTASK_EXPORT_FIELDS, SUBTASK_EXPORT_QUERY,
+                                        chunk_size, staged)
+                job.paths.extend(path for _, path in staged)
+
+        return ExportJob(write, on_progress, on_done, self.dispatcher).start()
+
+    def export_json(self, path: str, fmt: str = FORMAT_JSON, compress: bool = False,
+                    fields=TASK_EXPORT_FIELDS, on_progress=None, on_done=None,
+                    chunk_size: int = EXPORT_CHUNK_SIZE) -> ExportJob:
+        """
+        Starts exporting tasks, each with its subtasks nested under "subtasks", to a
+        JSON array or a JSON Lines file on a background thread. Tasks are serialized
+        one at a time as they stream from the database, so memory use does not
+        depend on the number of tasks.
+
+        Args:
+            path (str): Destination file.
+            fmt (str): FORMAT_JSON or FORMAT_NDJSON.
+            compress (bool): If True, gzip the output.
+            fields (iterable): Task columns to export, from TASK_EXPORT_FIELDS.
+            on_progress (callable): Called as on_progress(tasks_written, total_tasks).
+            on_done (callable): Called with the job when it has finished.
+            chunk_size (int): Rows fetched at a time.
+
+        Returns:
+            ExportJob: The started job.
+
+        Raises:
+            ValueError: If the format or a field is not supported.
+        """
+        if fmt not in (FORMAT_JSON, FORMAT_NDJSON):
+            raise ValueError(f"Unsupported export format: {fmt}")
+        fields = self._check_fields(fields)
+        # The id is needed to attach the subtasks.
+        columns = fields if "id" in fields else ("id",) + fields
+
+        def write(job):
+            with connection() as db:
+                # One read transaction keeps tasks and subtasks consistent with each other.
+                db.execute("BEGIN")
+                job.total_rows = self._count(db, "tasks")
+                with self._output(path, compress) as out:
+                    items = self._iter_task_documents(job, db, columns, fields, chunk_size)
+                    if fmt == FORMAT_NDJSON:
+                        for document in items:
+                            out.write(document)
+                            out.write("\n")
+                    else:
+                        out.write("[")
+                        separator = "\n"
+                        for document in items:
+                            out.write(separator)
+                            out.write(document)
+                            separator = ",\n"
+                        out.write("\n]\n")
+                job.paths.append(path)
+
+        return ExportJob(write, on_progress, on_done, self.dispatcher).start()
+
+    @staticmethod
+    def _iter_task_documents(job: ExportJob, db, columns: tuple, fields: tuple, chunk_size: int):
+        """
+        Yields each task serialized as a JSON object with its subtasks.
+        Tasks (by id) and subtasks (by task_id) are read from two cursors in the
+        same order and merged, so only the current task's subtasks are held in memory.
+        """
+        task_query = ExportController._task_query(columns)
+        id_index, done_index = columns.index("id"), columns.index("done") if "done" in columns else None
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        # Only the reads are timed, not the serialization and writing of the consumer.
+        with track(task_query, db, (), streaming=True) as probe:
+            subtasks = timed(probe, db.execute, SUBTASK_EXPORT_QUERY)
+            pending = timed(probe, subtasks.fetchone)
+            tasks = timed(probe, db.execute, task_query)
+            while True:
+                job.check_cancelled()
+                rows = timed(probe, tasks.fetchmany, chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    task_id = row[id_index]
+                    # Skip subtasks of tasks that no longer exist.
+                    while pending is not None and pending[1] < task_id:
+                        pending = timed(probe, subtasks.fetchone)
+                    nested = []
+                    while pending is not None and pending[1] == task_id:
+                        nested.append({
+                            "id": pending[0], "title": pending[2], "description": pending[3],
+                            "done": bool(pending[4]),
+                        })
+                        pending = timed(probe, subtasks.fetchone)
+                    document = dict(zip(columns, row))
+                    if done_index is not None:
+                        document["done"] = bool(row[done_index])
+                    if "id" not in fields:
+                        del document["id"]
+                    document["subtasks"] = nested
+                    yield dumps(document)
+                probe["rows"] += len(rows)
+                job.advance(len(rows))
+
+    @staticmethod
+    @contextmanager
+    def _output(path: str, compress: bool = False, staged: list = None):
+        """
+        Opens a buffered UTF-8 text stream on <path>.part, optionally gzip-compressed.
+        The file replaces path when the block completes and is removed if it raises.
+
+        Args:
+            path (str): Destination file.
+            compress (bool): If True, gzip the output.
+            staged (list): List yielded by _staged_outputs(); if given, the completed
+                file is added to it instead of replacing path.
+
+        Yields:
+            io.TextIOBase: The stream to write to.
+        """
+        partial = f"{path}.part"
+        try:
+            if compress:
+                f = gzip.open(partial, "wt", compresslevel=GZIP_LEVEL, encoding="utf-8", newline="")
+            else:
+                f = open(partial, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE)
+            with f:
+                yield f
+            if staged is None:
+                os.replace(partial, path)
+            else:
+                staged.append((partial, path))
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+    @staticmethod
+    @contextmanager
+    def _staged_outputs():
+        """
+        Groups the files written by several _output() blocks: they replace their
+        destinations together when this block completes, and are all removed if it raises.
+
+        Yields:
+            list: (partial, path) pairs of the completed files, passed to _output() as staged.
+        """
+        staged = []
+        try:
+            yield staged
+            for partial, path in staged:
+                os.replace(partial, path)
+        except BaseException:
+            for partial, _ in staged:
+                if os.path.exists(partial):
+                    os.remove(partial)
+            raise
+
+    @staticmethod
+    def _check_fields(fields) -> tuple:
+        """
+        Returns fields as a tuple, or raises ValueError if one cannot be exported.
+        """
+        fields = tuple(fields)
+        unknown = [f for f in fields if f not in TASK_EXPORT_FIELDS]
+        if unknown or not fields:
+            raise ValueError(f"Unsupported export fields: {unknown or 'none selected'}")
+        return fields
+
+    @staticmethod
+    def _task_query(fields: tuple) -> str:
+        """
+        Returns the statement selecting fields of every task, in id order.
+        """
+        return f"SELECT {', '.join(TASK_EXPORT_EXPRESSIONS[f] for f in fields)} FROM tasks t ORDER BY t.id"
+
+    @staticmethod
+    def _count(db, table: str, where: str = None) -> int:
+        return db.execute(f"SELECT COUNT(*) FROM {table}" + (f" WHERE {where}" if where else "")).fetchone()[0]
+
+    @staticmethod
+    def _write_csv(job: ExportJob, db, path: str, fields: tuple, query: str, chunk_size: int, staged: list = None):
+        """
+        Streams the rows of a query into a CSV file, written through _output().
+
+        Args:
+            job (ExportJob): The running job.
+            db (sqlite3.Connection): Connection holding the read transaction.
+            path (str): Destination file.
+            fields (tuple): Column names written as the header row.
+            query (str): Statement selecting the rows, built from whitelisted columns.
+            chunk_size (int): Rows fetched and written at a time.
+            staged (list): Passed to _output(); the caller records path in job.paths once it is replaced.
+        """
+        with ExportController._output(path, staged=staged) as f, track(query, db, (), streaming=True) as probe:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            cursor = timed(probe, db.execute, query)
+            while True:
+                job.check_cancelled()
+                rows = timed(probe, cursor.fetchmany, chunk_size)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                probe["rows"] += len(rows)
+                job.advance(len(rows))
@@ -0,0 +1,202 @@
+"""
+identity_map.py
+
+Identity map of the model objects loaded by the controllers. Each map is an
+LRU cache keyed by primary key with a size limit: repeated reads of an
+unchanged row return the object already in memory instead of building a new
+one, and controller writes patch or invalidate the cached objects.
+Hit and miss counters are kept so the hit rate can be monitored.
+QueryCache holds derived query results (e.g. overdue counts) until the next change.
+"""
+
+import threading
+from collections import OrderedDict
+
+# Maximum number of objects kept per model.
+TASK_CACHE_SIZE = 5000
+PROJECT_CACHE_SIZE = 500
+
+class IdentityMap:
+    """
+    Thread-safe LRU map of primary key -> model object.
+    An optional version attribute (e.g. updated_at) lets readers detect cached
+    objects that no longer match the row they just read.
+    """
+
+    def __init__(self, maxsize: int, version_attr: str = "updated_at"):
+        """
+        Args:
+            maxsize (int): Maximum number of cached objects; the least recently used are evicted.
+            version_attr (str): Attribute compared with the version passed to get().
+        """
+        self.maxsize = maxsize
+        self.version_attr = version_attr
+        self._objects = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, version=None, check_version: bool = False):
+        """
+        Returns the cached object for key, counting a hit or a miss.
+
+        Args:
+            key: The primary key.
+            version: The version read from the database.
+            check_version (bool): If True, a cached object whose version differs is
+                dropped and reported as a miss.
+
+        Returns:
+            The cached object, or None.
+        """
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None and check_version and getattr(obj, self.version_attr) != version:
+                del self._objects[key]
+                obj = None
+            if obj is None:
+                self.misses += 1
+                return None
+            self._objects.move_to_end(key)
+            self.hits += 1
+            return obj
+
+    def peek(self, key):
+        """
+        Returns the cached object for key without affecting the counters or the LRU order.
+        """
+        with self._lock:
+            return self._objects.get(key)
+
+    def put(self, key, obj):
+        """
+        Caches obj under key, evicting the least recently used object if the map is full.
+        """
+        with self._lock:
+            self._objects[key] = obj
+            self._objects.move_to_end(key)
+            while len(self._objects) > self.maxsize:
+                self._objects.popitem(last=False)
+
+    def invalidate(self, key):
+        """
+        Removes key from the map if present.
+        """
+        with self._lock:
+            self._objects.pop(key, None)
+
+    def invalidate_many(self, keys):
+        """
+        Removes every key in keys from the map.
+        """
+        with self._lock:
+            for key in keys:
+                self._objects.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every cached object; the counters are kept.
+        """
+        with self._lock:
+            self._objects.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the cache size and hit/miss counters.
+
+        Returns:
+            dict: size, maxsize, hits, misses and hit_rate (0.0 - 1.0).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._objects),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+class QueryCache:
+    """
+    Thread-safe cache of query results that stay valid until the next data change.
+    A generation counter guards against storing a result computed before an
+    invalidation that happened while the query was running.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Returns the current generation; read it before running the query.
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key):
+        """
+        Returns the cached result for key, or None.
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def put(self, key, generation: int, result):
+        """
+        Caches result unless the cache was invalidated since generation was read.
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._results[key] = result
+
+    def invalidate(self, *args):
+        """
+        Drops every cached result. Accepts and ignores event arguments so it can be
+        subscribed to change events directly.
+        """
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the number of cached results and the hit/miss counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._results),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+# Shared by every controller instance.
+task_cache = IdentityMap(TASK_CACHE_SIZE)
+project_cache = IdentityMap(PROJECT_CACHE_SIZE)
+
+def cache_stats() -> dict:
+    """
+    Returns the statistics of every identity map, keyed by model name.
+
+    Returns:
+        dict: {"tasks": {...}, "projects": {...}}
+    """
+    return {"tasks": task_cache.stats(), "projects": project_cache.stats()}
+
+def clear_caches():
+    """
+    Empties every identity map, e.g. after the database file has been replaced.
+    """
+    task_cache.clear()
+    project_cache.clear()
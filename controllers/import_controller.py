@@ -0,0 +1,631 @@
+"""
+import_controller.py
+
+ImportController loads tasks (with their subtasks) from the files written by
+ExportController: CSV (with an optional <name>_subtasks.csv next to it), JSON
+arrays and JSON Lines, optionally gzip-compressed. Files are parsed as they are
+read, records are validated and inserted in batches with executemany on a
+background thread, all in one transaction: a failed or cancelled import leaves
+the database unchanged. Other writers wait for the write lock while it runs.
+
+Projects are resolved by name through a lookup loaded once per import; unknown
+names create the project. Each imported task records a hash of its content in
+tasks.import_hash, which lets later imports skip tasks that were already imported.
+"""
+
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from itertools import chain
+from database.database import connection, transaction
+from database.instrumentation import track
+from controllers.export_controller import ExportJob, FORMAT_JSON, FORMAT_NDJSON
+from controllers.task_controller import normalize_choice, get_current_timestamp, MAX_PAGE_SIZE
+from controllers import events
+from utils.dates import to_storage_date, to_storage_time, to_storage_timestamp
+from utils.validators import validate_date, validate_non_empty, validate_positive_int
+
+FORMAT_CSV = "csv"
+
+# Records validated and inserted at a time.
+IMPORT_BATCH_SIZE = 5000
+# Characters read at a time from JSON array files.
+JSON_READ_SIZE = 1 << 16
+# Invalid records reported in ImportJob.errors; further ones are only counted.
+MAX_REPORTED_ERRORS = 100
+# Page cache (KiB) of the import connection, so the task indexes stay in memory while they grow.
+IMPORT_CACHE_KB = 65536
+
+# Switch off the per-row search index and counter triggers inside a batch transaction
+# (see database/migrations.py); the batch's id range is indexed and counted with one
+# statement each instead. The rollback of a failed import switches them back on.
+PAUSE_ROW_TRIGGERS = ("UPDATE search_sync SET enabled = 0", "UPDATE stats_sync SET enabled = 0")
+RESUME_ROW_TRIGGERS = ("UPDATE search_sync SET enabled = 1", "UPDATE stats_sync SET enabled = 1")
+
+# Separators skipped between the elements of a JSON array.
+_ARRAY_SEPARATORS = re.compile(r"[\s,]*")
+
+# Values of the done column read as True.
+_TRUE_VALUES = ("1", "true", "yes", "y")
+
+# Rows of a batch are staged with executemany in temporary tables, which have no
+# triggers, then copied with one INSERT ... SELECT each. Inserting row by row into
+# tasks or subtasks costs about twice as much: every statement execution opens a
+# savepoint for the (switched-off) search index triggers.
+TASK_COLUMNS_IMPORTED = (
+    "title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id, "
+    "import_hash"
+)
+STAGE_TABLES = (
+    f"CREATE TEMP TABLE import_tasks ({TASK_COLUMNS_IMPORTED})",
+    "CREATE TEMP TABLE import_subtasks (task_id, title, description, done)",
+)
+DROP_STAGE_TABLES = ("DROP TABLE temp.import_tasks", "DROP TABLE temp.import_subtasks")
+TASK_STAGE = "INSERT INTO temp.import_tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SUBTASK_STAGE = "INSERT INTO temp.import_subtasks VALUES (?, ?, ?, ?)"
+# Staged rows are copied in staging order, so the new AUTOINCREMENT ids follow it.
+TASK_INSERT = (
+    f"INSERT INTO tasks ({TASK_COLUMNS_IMPORTED}) SELECT {TASK_COLUMNS_IMPORTED} FROM temp.import_tasks ORDER BY rowid"
+)
+SUBTASK_INSERT = """
+    INSERT INTO subtasks (task_id, title, description, done)
+    SELECT task_id, title, description, done FROM temp.import_subtasks ORDER BY rowid
+"""
+INDEX_IMPORTED_TASKS = """
+    INSERT INTO tasks_fts(rowid, title, description, subtasks)
+    SELECT t.id, t.title, t.description,
+           (SELECT IFNULL(group_concat(s.title, ' '), '') FROM subtasks s WHERE s.task_id = t.id)
+      FROM tasks t
+     WHERE t.id BETWEEN ? AND ?
+"""
+# Adds the dashboard counters of the imported tasks, as tasks_stats_insert would have.
+# Imported tasks are new rows, so only their id range needs counting.
+COUNT_IMPORTED_TASKS = """
+    INSERT INTO stats (dimension, key, count)
+    SELECT * FROM (
+        SELECT 'tasks', 'total', COUNT(*) FROM tasks WHERE id BETWEEN ?1 AND ?2
+        UNION ALL SELECT 'tasks', 'done', COUNT(*) FROM tasks WHERE id BETWEEN ?1 AND ?2 AND IFNULL(done, 0) <> 0
+        UNION ALL SELECT 'status', IFNULL(status, ''), COUNT(*) FROM tasks WHERE id BETWEEN ?1 AND ?2 GROUP BY 2
+        UNION ALL SELECT 'priority', IFNULL(priority, ''), COUNT(*) FROM tasks WHERE id BETWEEN ?1 AND ?2 GROUP BY 2
+        UNION ALL SELECT 'project', IFNULL(project_id, ''), COUNT(*) FROM tasks WHERE id BETWEEN ?1 AND ?2 GROUP BY 2
+    ) WHERE true
+    ON CONFLICT(dimension, key) DO UPDATE SET count = count + excluded.count
+"""
+
+def detect_format(path: str) -> str:
+    """
+    Returns the format of an import file from its name, ignoring a .gz suffix:
+    .csv is CSV, .jsonl and .ndjson are JSON Lines, anything else is read as JSON.
+    A JSON file that does not start with '[' is read as JSON Lines.
+
+    Args:
+        path (str): The file to import.
+
+    Returns:
+        str: FORMAT_CSV, FORMAT_JSON or FORMAT_NDJSON.
+    """
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return FORMAT_CSV
+    if name.endswith((".jsonl", ".ndjson")):
+        return FORMAT_NDJSON
+    with open_input(path) as f:
+        start = f.read(JSON_READ_SIZE).lstrip()
+    return FORMAT_JSON if start.startswith("[") or not start else FORMAT_NDJSON
+
+def open_input(path: str):
+    """
+    Opens an import file as UTF-8 text, decompressing it if it is gzipped.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        io.TextIOBase: The text stream.
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+def iter_json_array(f, read_size: int = JSON_READ_SIZE):
+    """
+    Yields the elements of a JSON array read incrementally from a text stream,
+    decoding one element at a time with JSONDecoder.raw_decode.
+
+    Args:
+        f (io.TextIOBase): The stream.
+        read_size (int): Characters read at a time.
+
+    Raises:
+        ValueError: If the stream is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+
+    fill()
+    buffer = buffer.lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array")
+    pos = 1
+    while True:
+        pos = _ARRAY_SEPARATORS.match(buffer, pos).end()
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError("Unterminated JSON array")
+            fill()
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            element, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The element continues in the next chunk.
+            if eof:
+                raise
+            fill()
+            continue
+        pos = end
+        yield element
+
+def iter_json_lines(f):
+    """
+    Yields the JSON value on each non-empty line of a text stream.
+    """
+    for number, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"line {number}: {e}")
+
+def iter_csv_records(f, subtasks_file=None):
+    """
+    Yields the rows of a tasks CSV as dicts. If a subtasks CSV is given, each
+    task gets the subtasks whose task_id is its id under "subtasks"; both files
+    must be in task id order, as written by ExportController.export_csv.
+
+    Args:
+        f (io.TextIOBase): The tasks CSV.
+        subtasks_file (io.TextIOBase): The subtasks CSV, or None.
+    """
+    tasks = csv.DictReader(f)
+    if subtasks_file is None:
+        yield from tasks
+        return
+    if "id" not in (tasks.fieldnames or ()):
+        raise ValueError("The tasks CSV needs an id column to attach subtasks")
+    subtasks = csv.DictReader(subtasks_file)
+    pending = next(subtasks, None)
+
+    def key(value):
+        return int(value) if value and value.strip().lstrip("-").isdigit() else None
+
+    for record in tasks:
+        task_id = key(record.get("id"))
+        nested = []
+        if task_id is not None:
+            # Skip subtasks of tasks that are not in the file.
+            while pending is not None and (key(pending.get("task_id")) or 0) < task_id:
+                pending = next(subtasks, None)
+            while pending is not None and key(pending.get("task_id")) == task_id:
+                nested.append(pending)
+                pending = next(subtasks, None)
+        record["subtasks"] = nested
+        yield record
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+def _optional(value):
+    """
+    Returns None for missing or blank values, else the value.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return value
+
+def _flag(value) -> int:
+    """
+    Converts a done value (bool, number or text) to 0 or 1.
+    """
+    if isinstance(value, str):
+        return int(value.strip().lower() in _TRUE_VALUES)
+    return int(bool(value))
+
+# Column values repeat across records (a few thousand distinct dates, times and
+# durations in a million tasks), so each distinct value is validated once. The
+# caches are typed: True and 1.0 must not share the entry of 1.
+
+@lru_cache(maxsize=4096, typed=True)
+def _due_date(value) -> str:
+    if not isinstance(value, str) or not validate_date(value):
+        raise ValueError(f"invalid due date {value!r}")
+    return to_storage_date(value)
+
+@lru_cache(maxsize=4096, typed=True)
+def _due_time(value) -> str:
+    try:
+        return to_storage_time(value)
+    except ValueError:
+        raise ValueError(f"invalid time {value!r}") from None
+
+@lru_cache(maxsize=4096, typed=True)
+def _duration(value) -> int:
+    if isinstance(value, (bool, float)) or not validate_positive_int(value):
+        raise ValueError(f"invalid duration {value!r}")
+    return int(value)
+
+@lru_cache(maxsize=256, typed=True)
+def _choice(value) -> str:
+    return normalize_choice(value)
+
+def content_hash(task: tuple, subtasks: list) -> str:
+    """
+    Returns the hash identifying a task's content: its fields (without
+    timestamps), its project and its subtasks, as validated by ImportController.
+
+    Args:
+        task (tuple): (title, description, due_date, time, duration, priority, status, done, project),
+            where project is the project name, or the project id for files without names.
+        subtasks (list): (title, description, done) tuples.
+
+    Returns:
+        str: 128-bit BLAKE2b digest in hex.
+    """
+    # The values are str, int or None, whose repr() is stable.
+    return hashlib.blake2b(repr((task, subtasks)).encode("utf-8"), digest_size=16).hexdigest()
+
+class ImportJob(ExportJob):
+    """
+    A background import. Progress is reported in bytes of the (possibly compressed)
+    input file as on_progress(bytes_read, file_size).
+
+    Attributes:
+        task_ids (list): (first, last) id range of the tasks inserted by each batch; set on commit.
+        imported (int): Tasks inserted; set on commit.
+        duplicates (int): Tasks skipped because they were already imported.
+        invalid (int): Records skipped because they failed validation.
+        errors (list): The first MAX_REPORTED_ERRORS "record N: reason" messages.
+    """
+
+    SOURCE = "ImportController"
+    ACTION = "importing"
+
+    def __init__(self, target, on_progress=None, on_done=None, dispatcher=None):
+        super().__init__(target, on_progress, on_done, dispatcher)
+        self.task_ids = []
+        self.imported = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors = []
+
+    def report(self, position: int):
+        """
+        Records the input position and reports progress.
+        """
+        self.rows_written = position
+        self._notify(self.on_progress, position, self.total_rows)
+
+    def reject(self, index: int, reason: str):
+        """
+        Counts an invalid record and keeps its message if there is room.
+        """
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"record {index}: {reason}")
+
+class ImportController:
+    """
+    Controller for importing tasks and subtasks from files.
+    """
+
+    def __init__(self, dispatcher=None):
+        """
+        Args:
+            dispatcher (callable): Delivers job callbacks, e.g. DatabaseWorker.call_soon.
+        """
+        self.dispatcher = dispatcher
+
+    def import_file(self, path: str, subtasks_path: str = None, fmt: str = None, dedupe: bool = False,
+                    on_progress=None, on_done=None, batch_size: int = IMPORT_BATCH_SIZE) -> ImportJob:
+        """
+        Starts importing a file on a background thread. Invalid records are skipped
+        and reported on the job; everything else is inserted in batches of batch_size
+        records and committed in one transaction.
+
+        Args:
+            path (str): CSV, JSON or JSON Lines file, optionally gzipped.
+            subtasks_path (str): For CSV, an optional subtasks CSV to attach by task id.
+            fmt (str): FORMAT_CSV, FORMAT_JSON or FORMAT_NDJSON; detected from path when None.
+            dedupe (bool): If True, skip tasks whose content hash was already imported.
+            on_progress (callable): Called as on_progress(bytes_read, file_size).
+            on_done (callable): Called with the job when it has finished.
+            batch_size (int): Records validated and inserted at a time.
+
+        Returns:
+            ImportJob: The started job.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if fmt is not None and fmt not in (FORMAT_CSV, FORMAT_JSON, FORMAT_NDJSON):
+            raise ValueError(f"Unsupported import format: {fmt}")
+
+        def load(job):
+            fmt_ = fmt or detect_format(path)
+            job.total_rows = os.path.getsize(path)
+            with open_input(path) as f:
+                subtasks_file = open_input(subtasks_path) if fmt_ == FORMAT_CSV and subtasks_path else None
+                try:
+                    if fmt_ == FORMAT_CSV:
+                        records = iter_csv_records(f, subtasks_file)
+                    elif fmt_ == FORMAT_NDJSON:
+                        records = iter_json_lines(f)
+                    else:
+                        records = iter_json_array(f)
+                    raw = f.buffer.fileobj if isinstance(f.buffer, gzip.GzipFile) else f.buffer
+                    self._load(job, records, raw, dedupe, batch_size)
+                finally:
+                    if subtasks_file is not None:
+                        subtasks_file.close()
+            job.paths.append(path)
+
+        return ImportJob(load, on_progress, on_done, self.dispatcher).start()
+
+    def _load(self, job: ImportJob, records, raw, dedupe: bool, batch_size: int):
+        """
+        Validates records and inserts them in batches, all in one transaction: a
+        failed or cancelled import leaves the database unchanged. PROJECT_CREATED
+        and TASK_CREATED are published once the transaction has committed.
+
+        Args:
+            job (ImportJob): The running job.
+            records (iterable): Task records (dicts, with an optional "subtasks" list).
+            raw: Underlying binary file, whose position is reported as progress.
+            dedupe (bool): If True, skip tasks whose content hash was already imported.
+            batch_size (int): Records per batch.
+        """
+        projects = ProjectLookup()
+        timestamp = get_current_timestamp()
+        task_ids = []
+        with transaction() as tx, connection() as db:
+            cache_size = db.execute("PRAGMA cache_size").fetchone()[0]
+            db.execute(f"PRAGMA cache_size = {-IMPORT_CACHE_KB}")
+            try:
+                batch = []
+                for index, record in enumerate(records, 1):
+                    try:
+                        batch.append(self._validate(record, timestamp))
+                    except (ValueError, TypeError, AttributeError) as e:
+                        job.reject(index, str(e))
+                    if index % batch_size == 0:
+                        self._commit_batch(job, db, batch, projects, dedupe, task_ids)
+                        batch = []
+                        job.check_cancelled()
+                        job.report(raw.tell())
+                self._commit_batch(job, db, batch, projects, dedupe, task_ids)
+            finally:
+                # PRAGMA does not accept bound parameters; cache_size is an int read above.
+                db.execute(f"PRAGMA cache_size = {int(cache_size)}")
+
+            def committed():
+                job.task_ids = task_ids
+                job.imported = sum(last - first + 1 for first, last in task_ids)
+                if projects.created:
+                    events.bus.publish(events.PROJECT_CREATED, projects.created)
+                if task_ids:
+                    ids = chain.from_iterable(range(first, last + 1) for first, last in task_ids)
+                    events.bus.publish(events.TASK_CREATED, ids)
+
+            tx.on_commit(committed)
+        job.report(job.total_rows)
+
+    def _commit_batch(self, job: ImportJob, db, batch: list, projects, dedupe: bool, task_ids: list):
+        """
+        Inserts a batch of validated records into the import transaction. The per-row
+        search index and counter triggers are switched off for the batch; its id range
+        is indexed and counted once, then appended to task_ids.
+        """
+        if not batch:
+            return
+        for statement in PAUSE_ROW_TRIGGERS:
+            db.execute(statement)
+        inserted = self._insert_batch(job, db, batch, projects, dedupe)
+        if inserted:
+            for statement in (INDEX_IMPORTED_TASKS, COUNT_IMPORTED_TASKS):
+                with track(statement, db, inserted):
+                    db.execute(statement, inserted)
+            task_ids.append(inserted)
+        for statement in RESUME_ROW_TRIGGERS:
+            db.execute(statement)
+
+    def _insert_batch(self, job: ImportJob, db, batch: list, projects, dedupe: bool):
+        """
+        Inserts a batch of validated records with their subtasks, through the staging tables.
+        AUTOINCREMENT ids are consecutive while the transaction holds the write lock,
+        so the new ids are derived from last_insert_rowid() and the row count.
+
+        Returns:
+            tuple or None: (first, last) id of the inserted tasks, or None if none was inserted.
+        """
+        seen = self._imported_hashes(db, [digest for *_, digest in batch]) if dedupe else None
+        tasks, subtasks = [], []
+        for values, project, nested, digest in batch:
+            if seen is not None:
+                if digest in seen:
+                    job.duplicates += 1
+                    continue
+                seen.add(digest)
+            project_id = projects.resolve(db, project) if isinstance(project, str) else projects.existing(db, project)
+            tasks.append(values + (project_id, digest))
+            subtasks.append(nested)
+        if not tasks:
+            return None
+        for statement in STAGE_TABLES:
+            db.execute(statement)
+        db.executemany(TASK_STAGE, tasks)
+        with track(TASK_INSERT, db) as probe:
+            count = db.execute(TASK_INSERT).rowcount
+            probe["rows"] = count
+        last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+        start = last_id - count + 1
+        rows = [
+            (task_id, *subtask)
+            for task_id, nested in zip(range(start, last_id + 1), subtasks)
+            for subtask in nested
+        ]
+        if rows:
+            db.executemany(SUBTASK_STAGE, rows)
+            with track(SUBTASK_INSERT, db) as probe:
+                probe["rows"] = db.execute(SUBTASK_INSERT).rowcount
+        for statement in DROP_STAGE_TABLES:
+            db.execute(statement)
+        return (start, last_id)
+
+    @staticmethod
+    def _validate(record: dict, timestamp: str):
+        """
+        Validates one record and converts it to the inserted values.
+
+        Args:
+            record (dict): The record read from the file.
+            timestamp (str): created_at/updated_at for records without them.
+
+        Returns:
+            tuple: (task values for TASK_INSERT up to done, project, subtasks, content hash).
+                project is the project name (str) when the record has one, else its
+                project_id (int or None); subtasks are (title, description, done) tuples.
+
+        Raises:
+            ValueError: If a value is invalid.
+        """
+        if not isinstance(record, dict):
+            raise ValueError("not an object")
+        title = _text(record.get("title"))
+        if not validate_non_empty(title):
+            raise ValueError("title is required")
+        due_date = _optional(record.get("due_date"))
+        due_time = _optional(record.get("time"))
+        duration = _optional(record.get("duration"))
+        # The project name, when the file has it, takes precedence over ids from another database.
+        if "project" in record:
+            project = _text(record["project"]).strip()
+        else:
+            try:
+                project = int(record.get("project_id"))
+            except (TypeError, ValueError):
+                project = None
+        nested = []
+        for number, subtask in enumerate(record.get("subtasks") or (), 1):
+            subtask_title = _text(subtask.get("title"))
+            if not validate_non_empty(subtask_title):
+                raise ValueError(f"subtask {number}: title is required")
+            nested.append((subtask_title, _text(subtask.get("description")), _flag(subtask.get("done"))))
+        content = (
+            title,
+            _text(record.get("description")),
+            None if due_date is None else _due_date(due_date),
+            None if due_time is None else _due_time(due_time),
+            None if duration is None else _duration(duration),
+            _choice(_optional(record.get("priority")) or "medium"),
+            _choice(_optional(record.get("status")) or "not started"),
+            _flag(record.get("done")),
+        )
+        created_at = ImportController._timestamp(record.get("created_at")) or timestamp
+        updated_at = ImportController._timestamp(record.get("updated_at")) or created_at
+        values = content[:2] + (created_at, updated_at) + content[2:]
+        return values, project, nested, content_hash(content + (project,), nested)
+
+    @staticmethod
+    def _timestamp(value):
+        """
+        Returns the canonical form of a timestamp, or None if it is missing or invalid.
+        """
+        try:
+            return to_storage_timestamp(value) if _optional(value) is not None else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _imported_hashes(db, hashes: list) -> set:
+        """
+        Returns the hashes among hashes that are recorded on existing tasks.
+        """
+        found = set()
+        for start in range(0, len(hashes), MAX_PAGE_SIZE):
+            chunk = hashes[start:start + MAX_PAGE_SIZE]
+            query = f"SELECT import_hash FROM tasks WHERE import_hash IN ({', '.join('?' for _ in chunk)})"
+            found.update(row[0] for row in db.execute(query, chunk))
+        return found
+
+class ProjectLookup:
+    """
+    Project name and id lookup for one import, loaded on first use from the projects
+    table. Unknown names create the project in the transaction of the batch naming it.
+    """
+
+    def __init__(self):
+        self.ids = None
+        self.by_name = {}
+        self.created = []
+
+    def _load(self, db):
+        if self.ids is None:
+            self.ids = {}
+            for id_, name in db.execute("SELECT id, name FROM projects ORDER BY id"):
+                self.ids[id_] = name
+                self.by_name.setdefault(name.casefold(), id_)
+
+    def resolve(self, db, name: str) -> int:
+        """
+        Returns the id of the project named name (case-insensitive), creating it if needed.
+
+        Args:
+            db (sqlite3.Connection): The connection holding the batch transaction.
+            name (str): The project name.
+        """
+        self._load(db)
+        if not name:
+            return None
+        key = name.casefold()
+        project_id = self.by_name.get(key)
+        if project_id is None:
+            timestamp = get_current_timestamp()
+            project_id = db.execute(
+                "INSERT INTO projects (name, description, created_at, updated_at) VALUES (?, '', ?, ?)",
+                (name, timestamp, timestamp)
+            ).lastrowid
+            self.ids[project_id] = name
+            self.by_name[key] = project_id
+            self.created.append(project_id)
+        return project_id
+
+    def existing(self, db, project_id):
+        """
+        Returns project_id as an int if that project exists, else None.
+        Files without project names only keep ids that are valid in this database.
+
+        Args:
+            db (sqlite3.Connection): The connection holding the batch transaction.
+            project_id: The project id read from the file.
+        """
+        self._load(db)
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            return None
+        return project_id if project_id in self.ids else None
@@ -4,21 +4,31 @@ project_controller.py
 The ProjectController class handles operations related to projects including
 creation, listing, updating, and deletion. It uses a helper function to get the
 current timestamp, and executes SQL queries with proper error handling.
+Loaded projects are kept in an identity map (controllers.identity_map.project_cache),
+and every successful write publishes a change event on controllers.events.bus.
 """
 
-from datetime import datetime
 import sqlite3
+from utils.dates import now_timestamp
 from models.project import Project
-from database.database import connect_db, close_db
+from database.database import transaction, current_transaction
+from database.instrumentation import run_query
+from controllers.identity_map import project_cache, task_cache
+from controllers import events
 
 def get_current_timestamp() -> str:
     """
-    Returns the current timestamp in ISO format.
+    Returns the current timestamp in the canonical ISO form of utils.dates.
 
     Returns:
         str: The current timestamp.
     """
-    return datetime.now().isoformat()
+    return now_timestamp()
+
+PROJECT_COLUMNS = "id, name, description, created_at, updated_at, color, icon, position"
+
+# Fields written by update_project.
+PROJECT_FIELDS = ("name", "description", "color", "icon", "position")
 
 class ProjectController:
     """
@@ -40,21 +50,11 @@ class ProjectController:
             tuple: (rows, last_id) where rows is the fetched data if any,
                    and last_id is the last inserted row ID.
         """
-        db = None
         try:
-            db = connect_db()
-            if not db:
-                return (None, None)
-            cursor = db.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall() if fetch else None
-            db.commit()
-            return (rows, cursor.lastrowid)
+            return run_query(query, params, fetch)
         except Exception as e:
             print(f"[ProjectController] Error executing query: {e}")
             return (None, None)
-        finally:
-            close_db(db)
 
     def create_project(self, name: str, description: str = "", color: str = None,
                        icon: str = None, position: int = None) -> bool:
@@ -80,36 +80,78 @@ class ProjectController:
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """
         _, last_id = self.execute_query(query, (name, description, timestamp, timestamp, color, icon, position))
-        return last_id is not None
+        if last_id is None:
+            return False
+        events.bus.publish(events.PROJECT_CREATED, (last_id,))
+        return True
 
     def list_projects(self):
         """
         Retrieves a list of projects from the database.
+        Projects whose row is unchanged are served from the identity map.
 
         Returns:
             list: List of Project objects.
         """
-        query = "SELECT id, name, description, created_at, updated_at, color, icon, position FROM projects"
+        query = f"SELECT {PROJECT_COLUMNS} FROM projects"
         rows, _ = self.execute_query(query, fetch=True)
         projects = []
         if rows:
             for row in rows:
-                id_, name, description, created_at, updated_at, color, icon, position = row
-                projects.append(Project(
-                    id=id_,
-                    name=name,
-                    description=description,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    color=color,
-                    icon=icon,
-                    position=position
-                ))
+                project = project_cache.get(row[0], version=row[4], check_version=True)
+                if project is None:
+                    project = self._project_from_row(row)
+                    project_cache.put(project.id, project)
+                projects.append(project)
         return projects
 
+    def get_project(self, project_id: int):
+        """
+        Returns a project, served from the identity map when cached.
+
+        Args:
+            project_id (int): The project ID.
+
+        Returns:
+            Project or None: The project, or None if it does not exist.
+        """
+        project = project_cache.get(project_id)
+        if project is not None:
+            return project
+        rows, _ = self.execute_query(f"SELECT {PROJECT_COLUMNS} FROM projects WHERE id = ?", (project_id,), fetch=True)
+        if not rows:
+            return None
+        project = self._project_from_row(rows[0])
+        project_cache.put(project.id, project)
+        return project
+
+    @staticmethod
+    def _project_from_row(row) -> Project:
+        """
+        Builds a Project from a row selected with PROJECT_COLUMNS.
+
+        Args:
+            row (tuple): The database row.
+
+        Returns:
+            Project: The hydrated project.
+        """
+        id_, name, description, created_at, updated_at, color, icon, position = row
+        return Project(
+            id=id_,
+            name=name,
+            description=description,
+            created_at=created_at,
+            updated_at=updated_at,
+            color=color,
+            icon=icon,
+            position=position
+        )
+
     def update_project(self, project: Project):
         """
         Updates a project in the database. Automatically updates the updated_at timestamp.
+        The project object and its cached copy are brought in line with the stored row.
 
         Args:
             project (Project): The project object containing updated values.
@@ -120,7 +162,7 @@ class ProjectController:
                SET name = ?, description = ?, updated_at = ?, color = ?, icon = ?, position = ?
              WHERE id = ?
         """
-        self.execute_query(query, (
+        _, last_id = self.execute_query(query, (
             project.name,
             project.description,
             timestamp,
@@ -129,27 +171,49 @@ class ProjectController:
             project.position,
             project.id
         ))
-
-    def delete_project(self, project_id: int, delete_tasks: bool = True):
+        if last_id is None or current_transaction() is not None:
+            # Failed, or may still be rolled back: reload on the next read.
+            project_cache.invalidate(project.id)
+        else:
+            project.updated_at = timestamp
+            cached = project_cache.peek(project.id)
+            if cached is not None and cached is not project:
+                for name in PROJECT_FIELDS + ("updated_at",):
+                    setattr(cached, name, getattr(project, name))
+        if last_id is not None:
+            events.bus.publish(events.PROJECT_UPDATED, (project.id,), PROJECT_FIELDS)
+
+    def delete_project(self, project_id: int, delete_tasks: bool = True) -> bool:
         """
         Deletes a project. If delete_tasks is True, also deletes associated tasks and subtasks;
         otherwise, dissociates tasks by setting their project_id to NULL.
+        All statements are committed together, or not at all.
 
         Args:
             project_id (int): The project ID to delete.
             delete_tasks (bool): Flag to indicate whether to remove associated tasks/subtasks.
+
+        Returns:
+            bool: True if the deletion was committed, False otherwise.
         """
-        if delete_tasks:
-            # Delete subtasks for tasks in the project.
-            query_subtasks = "DELETE FROM subtasks WHERE task_id IN (SELECT id FROM tasks WHERE project_id = ?)"
-            self.execute_query(query_subtasks, (project_id,))
-            # Delete tasks for the project.
-            query_tasks = "DELETE FROM tasks WHERE project_id = ?"
-            self.execute_query(query_tasks, (project_id,))
-        else:
-            # Dissociate tasks from the project.
-            query_update = "UPDATE tasks SET project_id = NULL WHERE project_id = ?"
-            self.execute_query(query_update, (project_id,))
-        # Finally, delete the project itself.
-        query_project = "DELETE FROM projects WHERE id = ?"
-        self.execute_query(query_project, (project_id,))
+        with transaction() as tx:
+            if delete_tasks:
+                # Delete subtasks for tasks in the project.
+                query_subtasks = "DELETE FROM subtasks WHERE task_id IN (SELECT id FROM tasks WHERE project_id = ?)"
+                self.execute_query(query_subtasks, (project_id,))
+                # Delete tasks for the project.
+                query_tasks = "DELETE FROM tasks WHERE project_id = ?"
+                self.execute_query(query_tasks, (project_id,))
+            else:
+                # Dissociate tasks from the project.
+                query_update = "UPDATE tasks SET project_id = NULL WHERE project_id = ?"
+                self.execute_query(query_update, (project_id,))
+            # Finally, delete the project itself.
+            query_project = "DELETE FROM projects WHERE id = ?"
+            self.execute_query(query_project, (project_id,))
+            # Subscribers reload the project's tasks, which were deleted or detached.
+            events.bus.publish(events.PROJECT_DELETED, (project_id,))
+        project_cache.invalidate(project_id)
+        # The project's tasks were deleted or detached.
+        task_cache.clear()
+        return not tx.failed
@@ -3,20 +3,46 @@ settings_controller.py
 
 SettingsController provides methods to manage user settings.
 It supports creating/updating, retrieving, and deleting settings in the database.
+
+Settings are read through a per-user cache loaded with one query, so reads
+after the first never touch the database. Writes update the cache at once and
+are buffered: repeated writes of a key are coalesced and the buffer is flushed
+in one transaction FLUSH_DELAY seconds after the first pending write, and by
+flush_settings() on exit.
 """
 
-from datetime import datetime
 import sqlite3
-from database.database import connect_db, close_db
+import threading
+from utils.dates import now_timestamp
+from database.database import transaction
+from database.instrumentation import run_query, run_many
+
+# Seconds between the first buffered write and the flush.
+FLUSH_DELAY = 0.5
+
+UPSERT_SETTING = """
+    INSERT INTO settings (user_id, key, value, created_at, updated_at) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+"""
+
+# Marks a buffered deletion.
+_DELETED = object()
+
+# user_id -> {key: value} for every user whose settings were loaded.
+_settings_cache = {}
+# (user_id, key) -> (value or _DELETED, timestamp) awaiting the next flush.
+_pending = {}
+_lock = threading.RLock()
+_flush_timer = None
 
 def get_current_timestamp() -> str:
     """
-    Returns the current timestamp in ISO format.
+    Returns the current timestamp in the canonical ISO form of utils.dates.
 
     Returns:
         str: The current timestamp.
     """
-    return datetime.now().isoformat()
+    return now_timestamp()
 
 class SettingsController:
     """
@@ -36,26 +62,64 @@ class SettingsController:
             tuple: (rows, last_id) where rows is the fetched data (if any)
                    and last_id is the last inserted row ID.
         """
-        db = None
         try:
-            db = connect_db()
-            if not db:
-                return (None, None)
-            cursor = db.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall() if fetch else None
-            db.commit()
-            return (rows, cursor.lastrowid)
+            return run_query(query, params, fetch)
         except sqlite3.Error as e:
             print(f"[SettingsController] Error executing query: {e}")
             return (None, None)
-        finally:
-            close_db(db)
+
+    def execute_many(self, query: str, seq_of_params):
+        """
+        Executes an SQL statement once for every parameter tuple.
+
+        Args:
+            query (str): The SQL statement.
+            seq_of_params (iterable): Parameter tuples.
+
+        Returns:
+            int or None: Number of affected rows, or None if an error occurred.
+        """
+        try:
+            return run_many(query, seq_of_params)
+        except sqlite3.Error as e:
+            print(f"[SettingsController] Error executing batch: {e}")
+            return None
+
+    def get_all_settings(self, user_id: int) -> dict:
+        """
+        Returns every setting of a user. The first call loads them in one query;
+        later calls are served from the cache.
+
+        Args:
+            user_id (int): The user's ID.
+
+        Returns:
+            dict: key -> value (a copy; modify settings with set_setting).
+        """
+        with _lock:
+            settings = _settings_cache.get(user_id)
+            if settings is None:
+                query = "SELECT key, value FROM settings WHERE user_id = ?"
+                rows, _ = self.execute_query(query, (user_id,), fetch=True)
+                if rows is None:
+                    return {}
+                settings = dict(rows)
+                # Writes buffered before the first load take precedence over the stored values.
+                for (pending_user, key), (value, _) in _pending.items():
+                    if pending_user != user_id:
+                        continue
+                    if value is _DELETED:
+                        settings.pop(key, None)
+                    else:
+                        settings[key] = value
+                _settings_cache[user_id] = settings
+            return dict(settings)
 
     def set_setting(self, user_id: int, key: str, value: str) -> bool:
         """
         Creates or updates a setting value for a given user.
-        If the key exists for the user, it updates the setting; otherwise, it creates a new entry.
+        The cache is updated immediately; the database write is buffered and
+        upserted on the next flush.
 
         Args:
             user_id (int): The user's ID.
@@ -63,49 +127,113 @@ class SettingsController:
             value (str): The value to store.
             
         Returns:
-            bool: True if operation succeeded, False otherwise.
-        """
-        timestamp = get_current_timestamp()
-        # Check if setting exists.
-        query_check = "SELECT id FROM settings WHERE user_id = ? AND key = ?"
-        rows, _ = self.execute_query(query_check, (user_id, key), fetch=True)
-        if rows:
-            # Update existing setting.
-            setting_id = rows[0][0]
-            query_update = "UPDATE settings SET value = ?, updated_at = ? WHERE id = ?"
-            self.execute_query(query_update, (value, timestamp, setting_id))
-        else:
-            # Create a new setting.
-            query_insert = "INSERT INTO settings (user_id, key, value, created_at, updated_at) VALUES (?, ?, ?, ?, ?)"
-            _, last_id = self.execute_query(query_insert, (user_id, key, value, timestamp, timestamp))
-            if last_id is None:
-                return False
+            bool: True if the write was accepted.
+        """
+        with _lock:
+            settings = _settings_cache.get(user_id)
+            if settings is not None:
+                settings[key] = value
+            _pending[(user_id, key)] = (value, get_current_timestamp())
+            self._schedule_flush()
         return True
 
-    def get_setting(self, user_id: int, key: str):
+    def get_setting(self, user_id: int, key: str, default=None):
         """
-        Retrieves the setting value for a user.
+        Retrieves the setting value for a user from the cache.
 
         Args:
             user_id (int): The user's ID.
             key (str): The setting key to look up.
+            default: Value returned when the setting does not exist.
             
         Returns:
-            str or None: The setting value if found, else None.
+            str or None: The setting value if found, else default.
         """
-        query = "SELECT value FROM settings WHERE user_id = ? AND key = ?"
-        rows, _ = self.execute_query(query, (user_id, key), fetch=True)
-        if rows:
-            return rows[0][0]
-        return None
+        with _lock:
+            settings = _settings_cache.get(user_id)
+            if settings is None:
+                self.get_all_settings(user_id)
+                settings = _settings_cache.get(user_id, {})
+            return settings.get(key, default)
 
     def delete_setting(self, user_id: int, key: str):
         """
-        Deletes a specific setting for a user.
+        Deletes a specific setting for a user. Like set_setting, the deletion is
+        applied to the cache at once and written on the next flush.
 
         Args:
             user_id (int): The user's ID.
             key (str): The setting key to delete.
         """
-        query = "DELETE FROM settings WHERE user_id = ? AND key = ?"
-        self.execute_query(query, (user_id, key))
+        with _lock:
+            settings = _settings_cache.get(user_id)
+            if settings is not None:
+                settings.pop(key, None)
+            _pending[(user_id, key)] = (_DELETED, None)
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """
+        Starts the flush timer unless one is already pending. Called with _lock held.
+        """
+        global _flush_timer
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_DELAY, self.flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        Writes the buffered settings in one transaction: one upsert batch and one
+        delete batch. If anything fails (a statement, or the transaction itself,
+        e.g. while another connection holds the write lock), the writes are
+        buffered again (unless the same keys were written since) and another
+        flush is scheduled.
+
+        Returns:
+            bool: True if nothing was pending or the writes were committed.
+        """
+        global _flush_timer
+        with _lock:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            batch = dict(_pending)
+            _pending.clear()
+        if not batch:
+            return True
+        upserts = [(user_id, key, value, ts, ts) for (user_id, key), (value, ts) in batch.items() if value is not _DELETED]
+        deletes = [key for key, (value, _) in batch.items() if value is _DELETED]
+        committed = False
+        try:
+            with transaction() as tx:
+                if upserts and self.execute_many(UPSERT_SETTING, upserts) is None:
+                    tx.failed = True
+                if deletes and self.execute_many("DELETE FROM settings WHERE user_id = ? AND key = ?", deletes) is None:
+                    tx.failed = True
+            committed = not tx.failed
+        except sqlite3.Error as e:
+            # The transaction could not start or commit (locked or closed database): try again later.
+            print(f"[SettingsController] Error flushing settings: {e}")
+        if not committed:
+            with _lock:
+                for key, entry in batch.items():
+                    _pending.setdefault(key, entry)
+                self._schedule_flush()
+        return committed
+
+def flush_settings() -> bool:
+    """
+    Writes every buffered setting now, e.g. before the application exits.
+
+    Returns:
+        bool: True if the buffered writes were committed.
+    """
+    return SettingsController().flush()
+
+def clear_settings_cache():
+    """
+    Drops the cached settings (buffered writes are kept), e.g. after the database file has been replaced.
+    """
+    with _lock:
+        _settings_cache.clear()
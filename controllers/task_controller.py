@@ -4,22 +4,189 @@ task_controller.py
 TaskController manages operations related to tasks and subtasks, including creation,
 retrieval, update, and deletion of tasks along with their associated subtasks.
 It also provides helper methods for marking tasks as done.
+Loaded tasks are kept in an identity map (controllers.identity_map.task_cache):
+reads of unchanged rows reuse the cached Task, and writes patch or invalidate it.
+Every successful write publishes a change event on controllers.events.bus.
 """
 
-from datetime import datetime
+from datetime import date, timedelta
+import re
+import sqlite3
+import sys
 from models.task import Task
 from models.subtask import Subtask
 from models.project import Project
-from database.database import connect_db, close_db
+from models.task_summary import TaskSummary
+from database.database import connection, transaction, current_transaction
+from database.instrumentation import run_query, run_many, track, timed
+from controllers.identity_map import task_cache, QueryCache
+from controllers.task_store import TaskColumnStore, STORE_COLUMNS, columnar_available
+from controllers import events
+from utils.dates import now_timestamp, to_storage_date, to_storage_time
+from utils.validators import validate_non_empty, validate_positive_int
+
+TASK_COLUMNS = "id, title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id"
+
+# Fields written by update_task, reported in TASK_UPDATED events when the caller does not narrow them down.
+EDITABLE_TASK_FIELDS = ("title", "description", "due_date", "time", "duration", "priority", "status", "done", "project_id")
+
+# Columns list_tasks_page may order by; each is backed by an index (the primary key for id).
+# project_id sorts by project name (see _project_segments).
+PAGE_SORT_COLUMNS = ("id", "title", "created_at", "updated_at", "due_date", "project_id", "status", "priority")
+MAX_PAGE_SIZE = 500
+
+# Task columns read for a TaskSummary, and the page sort columns it carries (for the next page key).
+SUMMARY_COLUMNS = "id, title, project_id, status, priority, due_date, time, updated_at"
+SUMMARY_SORT_COLUMNS = tuple(c for c in PAGE_SORT_COLUMNS if c in TaskSummary._fields)
+
+# Relative weights of the title, description and subtask columns when ranking search results.
+SEARCH_WEIGHTS = (10.0, 1.0, 3.0)
+
+# Table header fields that can be sorted on, mapped to their task column.
+SORT_FIELDS = {
+    "title": "title",
+    "project": "project_id",
+    "status": "status",
+    "priority": "priority",
+    "due_date": "due_date",
+    "updated": "updated_at",
+}
+
+# Table header fields that can be filtered on, mapped to a parameterized condition.
+FILTER_CONDITIONS = {
+    "project": "project_id IN (SELECT id FROM projects WHERE name = ?)",
+    "status": "status = ?",
+    "priority": "priority = ?",
+}
+
+# Workload buckets of open tasks by due date: ?1 is today, ?2 the day after this week.
+# Reads only the partial index idx_tasks_open_due(due_date, duration).
+WORKLOAD_BUCKETS = ("overdue", "today", "this_week", "later", "no_date")
+WORKLOAD_QUERY = """
+    SELECT CASE
+               WHEN due_date IS NULL THEN 'no_date'
+               WHEN due_date < ?1 THEN 'overdue'
+               WHEN due_date = ?1 THEN 'today'
+               WHEN due_date < ?2 THEN 'this_week'
+               ELSE 'later'
+           END AS bucket,
+           COUNT(*), IFNULL(SUM(duration), 0)
+      FROM tasks
+     WHERE done = 0
+     GROUP BY bucket
+"""
+
+# Overdue and workload results for the current day and columnar task stores; any task or project change drops them.
+overdue_cache = QueryCache()
+store_cache = QueryCache()
+for _event_type in (events.TASK_CREATED, events.TASK_UPDATED, events.TASK_DELETED, events.PROJECT_DELETED,
+                    events.DATABASE_RESTORED):
+    events.bus.subscribe(_event_type, overdue_cache.invalidate, direct=True)
+    events.bus.subscribe(_event_type, store_cache.invalidate, direct=True)
 
 def get_current_timestamp() -> str:
     """
-    Returns the current timestamp in ISO format.
+    Returns the current timestamp in the canonical ISO form of utils.dates.
 
     Returns:
         str: The current timestamp.
     """
-    return datetime.now().isoformat()
+    return now_timestamp()
+
+def intern_text(value):
+    """
+    Returns the interned copy of a string, so that the many loaded rows sharing a
+    low-cardinality value (status, priority, dates) share one string object.
+
+    Args:
+        value: A column value.
+
+    Returns:
+        The interned string, or value unchanged if it is not a string.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+def normalize_choice(value):
+    """
+    Normalizes a status or priority value to the lowercase form stored in the database
+    (e.g. "In Progress" -> "in progress"), so that equality filters and sorting can use indexes.
+
+    Args:
+        value (str): The value as entered or displayed.
+
+    Returns:
+        str or None: The stored form of the value.
+    """
+    return intern_text(value.strip().lower()) if isinstance(value, str) else value
+
+def build_match_expression(text: str):
+    """
+    Converts free text typed in a search box into an FTS5 MATCH expression.
+    Every word must appear; the last word is matched as a prefix so results
+    update while the user is typing. Words are quoted, so FTS5 operators in
+    the input are treated as plain text.
+
+    Args:
+        text (str): The raw search text.
+
+    Returns:
+        str or None: The MATCH expression, or None if the text has no words.
+    """
+    words = re.findall(r"\w+", text or "")
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+def build_summary_query(selection: str, order: str) -> str:
+    """
+    Builds the statement reading TaskSummary rows. The selected tasks are read first;
+    the project names are then joined and the subtask counts grouped for those tasks only.
+
+    Args:
+        selection (str): WHERE / ORDER BY / LIMIT clauses selecting the tasks.
+        order (str): ORDER BY terms of the result, on the columns of "page".
+
+    Returns:
+        str: The statement.
+    """
+    return f"""
+        WITH page AS (SELECT {SUMMARY_COLUMNS} FROM tasks {selection})
+        SELECT page.id, page.title, page.project_id, projects.name, page.status, page.priority,
+               page.due_date, page.time, page.updated_at, IFNULL(counts.done, 0), IFNULL(counts.total, 0)
+          FROM page
+          LEFT JOIN projects ON projects.id = page.project_id
+          LEFT JOIN (SELECT task_id, SUM(done) AS done, COUNT(*) AS total
+                       FROM subtasks
+                      WHERE task_id IN (SELECT id FROM page)
+                      GROUP BY task_id) AS counts ON counts.task_id = page.id
+         ORDER BY {order}
+    """
+
+def build_task_query(criteria: dict) -> dict:
+    """
+    Translates the filter/sort criteria collected by TasksView into keyword
+    arguments for TaskController.list_tasks_page and count_tasks.
+    Only whitelisted fields are accepted; values always travel as parameters.
+
+    Args:
+        criteria (dict): {"sort": (field, "asc" | "desc"), "filters": {field: value}}.
+
+    Returns:
+        dict: order_by, descending and filters keyword arguments.
+    """
+    query = {"order_by": "id", "descending": False, "filters": {}}
+    sort = criteria.get("sort")
+    if sort:
+        field, direction = sort
+        if field in SORT_FIELDS:
+            query["order_by"] = SORT_FIELDS[field]
+            query["descending"] = direction == "desc"
+    for field, value in criteria.get("filters", {}).items():
+        if field in FILTER_CONDITIONS and value:
+            query["filters"][field] = value
+    return query
 
 class TaskController:
     """
@@ -39,22 +206,57 @@ class TaskController:
             tuple: (rows, last_id) where rows is the query result (if fetched)
                    and last_id is the last inserted row ID.
         """
-        db = None
         try:
-            db = connect_db()
-            if not db:
-                return (None, None)
-            cursor = db.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall() if fetch else None
-            db.commit()
-            return (rows, cursor.lastrowid)
+            return run_query(query, params, fetch)
         except Exception as e:
             # In production, replace print with proper logging.
             print(f"[TaskController] Error executing query: {e}")
             return (None, None)
-        finally:
-            close_db(db)
+
+    def execute_many(self, query: str, seq_of_params):
+        """
+        Executes a given SQL statement once for every parameter tuple.
+
+        Args:
+            query (str): The SQL statement.
+            seq_of_params (iterable): Parameter tuples; may be a generator.
+
+        Returns:
+            int or None: Number of affected rows, or None if an error occurred.
+        """
+        try:
+            return run_many(query, seq_of_params)
+        except Exception as e:
+            print(f"[TaskController] Error executing batch: {e}")
+            return None
+
+    def _insert_bulk(self, query: str, params, index_new_rows: str):
+        """
+        Inserts rows with executemany in one transaction and returns their ids.
+        AUTOINCREMENT ids are allocated consecutively while the write lock is held,
+        so they are derived from last_insert_rowid() and the number of rows.
+        Per-row search index triggers are paused for the batch and the new id range
+        is indexed afterwards with a single statement.
+
+        Args:
+            query (str): The INSERT statement.
+            params (iterable): Parameter tuples for each row.
+            index_new_rows (str): Statement updating tasks_fts for ids BETWEEN ? AND ?.
+
+        Returns:
+            list: The new row ids in insertion order, or an empty list on failure.
+        """
+        with transaction() as tx:
+            self.execute_query("UPDATE search_sync SET enabled = 0")
+            count = self.execute_many(query, params)
+            rows, _ = self.execute_query("SELECT last_insert_rowid()", fetch=True)
+            ids = []
+            if count and rows:
+                last_id = rows[0][0]
+                ids = list(range(last_id - count + 1, last_id + 1))
+                self.execute_query(index_new_rows, (ids[0], ids[-1]))
+            self.execute_query("UPDATE search_sync SET enabled = 1")
+        return [] if tx.failed else ids
 
     # --- TASK METHODS ---
 
@@ -67,8 +269,8 @@ class TaskController:
         Args:
             title (str): The title of the task.
             description (str): The detailed description.
-            due_date (str): The due date (ISO format).
-            time (str): Specific time if applicable.
+            due_date (str or date): The due date, stored as 'YYYY-MM-DD'.
+            time (str or time): Specific time if applicable, stored as 'HH:MM'.
             duration (int): Estimated task duration in minutes.
             priority (str): Priority level (default "medium").
             status (str): Task status (default "not started").
@@ -79,20 +281,91 @@ class TaskController:
         """
         if not title.strip():
             return False
+        try:
+            due_date, time = to_storage_date(due_date), to_storage_time(time)
+        except ValueError as e:
+            print(f"[TaskController] Invalid due date or time: {e}")
+            return False
         timestamp = get_current_timestamp()
         query = """
             INSERT INTO tasks (
                 title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
         """
-        params = (title, description, timestamp, timestamp, due_date, time, duration, priority, status, project_id)
+        params = (title, description, timestamp, timestamp, due_date, time, duration,
+                  normalize_choice(priority), normalize_choice(status), project_id)
         _, last_id = self.execute_query(query, params)
-        return last_id is not None
+        if last_id is None:
+            return False
+        events.bus.publish(events.TASK_CREATED, (last_id,))
+        return True
+
+    def create_tasks_bulk(self, rows) -> list:
+        """
+        Creates many tasks in a single transaction.
+        Each row is a mapping using the keyword names of create_task (title is required).
+        Rows are validated as they are inserted; an invalid row aborts the whole batch.
+
+        Args:
+            rows (iterable): Mappings describing the tasks to create.
+
+        Returns:
+            list: The ids of the created tasks in input order, or an empty list on failure.
+        """
+        timestamp = get_current_timestamp()
+
+        def params():
+            for index, row in enumerate(rows):
+                title = row.get("title", "")
+                duration = row.get("duration")
+                if duration == "":
+                    duration = None
+                if not validate_non_empty(title):
+                    raise ValueError(f"row {index}: title is required")
+                try:
+                    # Accepts date and datetime objects as well as strings, like create_task.
+                    due_date = to_storage_date(row.get("due_date") or None)
+                except (TypeError, ValueError):
+                    raise ValueError(f"row {index}: invalid due date {row.get('due_date')!r}")
+                try:
+                    due_time = to_storage_time(row.get("time"))
+                except ValueError:
+                    raise ValueError(f"row {index}: invalid time {row.get('time')!r}")
+                if duration is not None and not validate_positive_int(duration):
+                    raise ValueError(f"row {index}: invalid duration {duration!r}")
+                yield (
+                    title,
+                    row.get("description", ""),
+                    timestamp,
+                    timestamp,
+                    due_date,
+                    due_time,
+                    int(duration) if duration is not None else None,
+                    normalize_choice(row.get("priority", "medium")),
+                    normalize_choice(row.get("status", "not started")),
+                    row.get("project_id")
+                )
+
+        query = """
+            INSERT INTO tasks (
+                title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+        """
+        index_new_rows = """
+            INSERT INTO tasks_fts(rowid, title, description, subtasks)
+            SELECT id, title, description, '' FROM tasks WHERE id BETWEEN ? AND ?
+        """
+        ids = self._insert_bulk(query, params(), index_new_rows)
+        if ids:
+            # Inside an enclosing transaction the event waits for its commit.
+            events.bus.publish(events.TASK_CREATED, ids)
+        return ids
 
     def list_tasks(self, project_id = None):
         """
         Retrieves tasks from the database, optionally filtered by a project ID.
-        Also retrieves associated subtasks for each task.
+        Subtasks of the tasks not already in the identity map are loaded with one
+        additional query per MAX_PAGE_SIZE tasks and grouped by task_id.
 
         Args:
             project_id (int): Optional project ID to filter tasks.
@@ -101,42 +374,575 @@ class TaskController:
             list: A list of Task objects.
         """
         if project_id is None:
-            query = """
-                SELECT id, title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id 
-                FROM tasks
-            """
-            rows, _ = self.execute_query(query, fetch=True)
+            where, params = "", ()
         else:
-            query = """
-                SELECT id, title, description, created_at, updated_at, due_date, time, duration, priority, status, done, project_id 
-                FROM tasks WHERE project_id = ?
-            """
-            rows, _ = self.execute_query(query, (project_id,), fetch=True)
+            where, params = "WHERE project_id = ?", (project_id,)
+        query = f"SELECT {TASK_COLUMNS} FROM tasks {where}"
+        rows, _ = self.execute_query(query, params, fetch=True)
 
-        tasks = []
-        if rows:
-            for row in rows:
-                (id_, title, desc, created_at, updated_at, due_date, time_field, dur,
-                 priority, status, done_val, proj_id) = row
-                t = Task(
-                    id=id_,
-                    title=title,
-                    description=desc or "",
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    due_date=due_date,
-                    time=time_field,
-                    duration=dur,
-                    priority=priority,
-                    status=status,
-                    done=bool(done_val),
-                    project_id=proj_id
+        return self._hydrate_tasks(rows or [])
+
+    def list_tasks_page(self, after_key = None, limit: int = 50, order_by: str = "id",
+                        descending: bool = False, project_id = None, filters: dict = None):
+        """
+        Retrieves one page of tasks using keyset (seek) pagination.
+        Instead of an OFFSET, the query resumes right after the last row of the
+        previous page, so every page costs the same regardless of its position.
+
+        Args:
+            after_key (tuple): The next_key returned for the previous page, or None for the first page.
+            limit (int): Maximum number of tasks to return (capped at MAX_PAGE_SIZE).
+            order_by (str): Sort column, one of PAGE_SORT_COLUMNS.
+            descending (bool): True to sort in descending order.
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            tuple: (tasks, next_key) where tasks is a list of Task objects with their
+                   subtasks and next_key is None when there are no more rows.
+        """
+        if order_by not in PAGE_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {order_by}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        order = self._order_clause(order_by, descending)
+        rows = self._seek_rows(
+            lambda where: f"SELECT {TASK_COLUMNS} FROM tasks {where} ORDER BY {order} LIMIT ?",
+            limit, order_by, descending, after_key, project_id, filters
+        )
+        tasks = self._hydrate_tasks(rows[:limit])
+        next_key = None
+        if len(rows) > limit:
+            last = tasks[-1]
+            next_key = (getattr(last, order_by), last.id)
+        return tasks, next_key
+
+    def list_task_summaries(self, after_key = None, limit: int = 50, order_by: str = "id",
+                            descending: bool = False, project_id = None, filters: dict = None):
+        """
+        Retrieves one page of TaskSummary rows for the task table, with the same keyset
+        pagination, sorting and filters as list_tasks_page. Only the displayed columns
+        are read; the project name and subtask counts are added by the same query.
+        Summaries bypass the identity map.
+
+        Args:
+            after_key (tuple): The next_key returned for the previous page, or None for the first page.
+            limit (int): Maximum number of rows to return (capped at MAX_PAGE_SIZE).
+            order_by (str): Sort column, one of SUMMARY_SORT_COLUMNS.
+            descending (bool): True to sort in descending order.
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            tuple: (summaries, next_key) where next_key is None when there are no more rows.
+        """
+        if order_by not in SUMMARY_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {order_by}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        inner, outer = self._order_clause(order_by, descending), self._order_clause(order_by, descending, "page.")
+        rows = self._seek_rows(
+            lambda where: build_summary_query(f"{where} ORDER BY {inner} LIMIT ?", outer),
+            limit, order_by, descending, after_key, project_id, filters
+        )
+        summaries = [self._summary_from_row(row) for row in rows[:limit]]
+        next_key = None
+        if len(rows) > limit:
+            last = summaries[-1]
+            next_key = (getattr(last, order_by), last.id)
+        return summaries, next_key
+
+    def get_task_summaries(self, task_ids) -> list:
+        """
+        Returns the TaskSummary of each existing task in task_ids, in id order.
+
+        Args:
+            task_ids (iterable): IDs of the tasks.
+
+        Returns:
+            list: The summaries.
+        """
+        task_ids = list(task_ids)
+        summaries = []
+        for start in range(0, len(task_ids), MAX_PAGE_SIZE):
+            chunk = task_ids[start:start + MAX_PAGE_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = build_summary_query(f"WHERE id IN ({placeholders})", "page.id")
+            rows, _ = self.execute_query(query, tuple(chunk), fetch=True)
+            summaries.extend(self._summary_from_row(row) for row in rows or [])
+        return sorted(summaries, key=lambda summary: summary.id)
+
+    @staticmethod
+    def _order_clause(order_by: str, descending: bool, prefix: str = "") -> str:
+        """
+        Returns the ORDER BY terms of a keyset page: the sort column, then id as tie-breaker.
+        """
+        direction = "DESC" if descending else "ASC"
+        if order_by == "id":
+            return f"{prefix}id {direction}"
+        return f"{prefix}{order_by} {direction}, {prefix}id {direction}"
+
+    def _seek_rows(self, build_query, limit: int, order_by: str, descending: bool, after_key,
+                   project_id, filters) -> list:
+        """
+        Reads up to limit + 1 rows of a keyset page.
+        Each segment is a plain index range; they are read in sort order until
+        one row more than requested has been seen.
+
+        Args:
+            build_query (callable): Returns the statement for a WHERE clause; its last
+                parameter is the LIMIT.
+            limit (int): Number of rows requested.
+            order_by (str): Sort column.
+            descending (bool): Sort direction.
+            after_key (tuple): Keyset of the previous page, or None.
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            list: The rows, in sort order.
+        """
+        base_conditions, base_params = self._filter_conditions(project_id, filters)
+        if order_by == "project_id":
+            segments = self._project_segments(descending, after_key)
+        else:
+            segments = self._keyset_segments(order_by, descending, after_key)
+        rows = []
+        for clause, key_params in segments:
+            conditions = base_conditions + ([clause] if clause else [])
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params = tuple(base_params) + tuple(key_params) + (limit + 1 - len(rows),)
+            segment_rows, _ = self.execute_query(build_query(where), params, fetch=True)
+            rows.extend(segment_rows or [])
+            if len(rows) > limit:
+                break
+        return rows
+
+    def iter_tasks(self, project_id = None, filters: dict = None, with_subtasks: bool = False,
+                   chunk_size: int = 500):
+        """
+        Streams tasks from the database in id order without loading them all into memory.
+        Rows are read from one open cursor with fetchmany(chunk_size); when with_subtasks
+        is True, the subtasks of each chunk are attached with one extra query per chunk.
+        Tasks already in the identity map are reused (with their subtasks).
+
+        Args:
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+            with_subtasks (bool): If True, populate Task.subtasks.
+            chunk_size (int): Number of rows fetched from the cursor at a time.
+
+        Yields:
+            Task: Each matching task.
+        """
+        conditions, params = self._filter_conditions(project_id, filters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {TASK_COLUMNS} FROM tasks {where} ORDER BY id"
+        try:
+            with connection() as db, track(query, db, tuple(params), streaming=True) as probe:
+                cursor = timed(probe, db.execute, query, tuple(params))
+                while True:
+                    rows = timed(probe, cursor.fetchmany, chunk_size)
+                    if not rows:
+                        break
+                    probe["rows"] += len(rows)
+                    # Streamed tasks reuse cached objects but are not added to the cache.
+                    yield from self._hydrate_tasks(rows, with_subtasks=with_subtasks, populate=False)
+        except sqlite3.Error as e:
+            print(f"[TaskController] Error streaming tasks: {e}")
+
+    @staticmethod
+    def _keyset_segments(column: str, descending: bool, after_key):
+        """
+        Builds the conditions selecting rows that sort after after_key.
+        SQLite sorts NULLs first in ascending order and last in descending order,
+        so resuming around NULL values takes up to two consecutive range segments.
+
+        Args:
+            column (str): A whitelisted sort column.
+            descending (bool): Sort direction.
+            after_key (tuple): (column value, id) of the last row already returned, or None.
+
+        Returns:
+            list: (SQL condition, parameters) tuples to query in order.
+        """
+        if after_key is None:
+            return [("", ())]
+        value, last_id = after_key
+        if column == "id":
+            return [("id < ?" if descending else "id > ?", (last_id,))]
+        if descending:
+            if value is None:
+                return [(f"{column} IS NULL AND id < ?", (last_id,))]
+            return [(f"({column}, id) < (?, ?)", (value, last_id)), (f"{column} IS NULL", ())]
+        if value is None:
+            return [(f"{column} IS NULL AND id > ?", (last_id,)), (f"{column} IS NOT NULL", ())]
+        return [(f"({column}, id) > (?, ?)", (value, last_id))]
+
+    def _project_segments(self, descending: bool, after_key):
+        """
+        Yields the conditions selecting, in order, the tasks that sort after after_key
+        when sorting by project. Tasks are ordered by project name (then project id)
+        and by id within a project; tasks without a project come first in ascending
+        order. Each segment is one project, read from the project_id index, so the
+        key (project_id, id) of the last row is enough to resume.
+
+        Args:
+            descending (bool): Sort direction.
+            after_key (tuple): (project_id, id) of the last row already returned, or None.
+
+        Yields:
+            tuple: (SQL condition, parameters).
+        """
+        direction = "DESC" if descending else "ASC"
+        rows, _ = self.execute_query(f"SELECT id FROM projects ORDER BY name {direction}, id {direction}", fetch=True)
+        project_ids = [row[0] for row in rows or []]
+        compare = "<" if descending else ">"
+        remaining = project_ids
+        if after_key is not None and after_key[0] is None:
+            yield (f"project_id IS NULL AND id {compare} ?", (after_key[1],))
+            if descending:
+                return
+        elif after_key is not None and after_key[0] in project_ids:
+            yield (f"project_id = ? AND id {compare} ?", after_key)
+            remaining = project_ids[project_ids.index(after_key[0]) + 1:]
+        elif not descending:
+            # First page (or the key's project was deleted since; views reload on PROJECT_DELETED).
+            yield ("project_id IS NULL", ())
+        for project in remaining:
+            yield ("project_id = ?", (project,))
+        if descending:
+            yield ("project_id IS NULL", ())
+
+    def count_tasks(self, project_id = None, filters: dict = None) -> int:
+        """
+        Returns the number of tasks, optionally restricted to a project and header filters.
+
+        Args:
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            int: The number of matching tasks.
+        """
+        conditions, params = self._filter_conditions(project_id, filters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows, _ = self.execute_query(f"SELECT COUNT(*) FROM tasks {where}", tuple(params), fetch=True)
+        return rows[0][0] if rows else 0
+
+    def get_dashboard_stats(self) -> dict:
+        """
+        Returns the aggregate counters maintained by triggers in the stats table.
+        The cost of this read does not depend on the number of tasks.
+
+        Returns:
+            dict: total, done and projects counts, plus by_status, by_priority and
+                  by_project mappings of value -> task count (None for unset values).
+        """
+        rows, _ = self.execute_query("SELECT dimension, key, count FROM stats WHERE count <> 0", fetch=True)
+        stats = {"total": 0, "done": 0, "projects": 0, "by_status": {}, "by_priority": {}, "by_project": {}}
+        for dimension, key, count in rows or []:
+            if dimension == "tasks":
+                stats[key] = count
+            elif dimension == "projects":
+                stats["projects"] = count
+            elif dimension == "project":
+                stats["by_project"][int(key) if key else None] = count
+            else:
+                stats[f"by_{dimension}"][key or None] = count
+        return stats
+
+    def get_workload(self) -> dict:
+        """
+        Buckets the open tasks by due date relative to today and sums their planned
+        durations with one aggregate over the partial index of open tasks on
+        (due_date, duration), without reading the table. The result is cached like
+        count_overdue().
+
+        Returns:
+            dict: overdue, today, this_week (the next 6 days), later and no_date counts,
+                  plus "minutes", the summed duration of the open tasks.
+        """
+        today = date.today()
+        key = ("workload", today.isoformat())
+        workload = overdue_cache.get(key)
+        if workload is None:
+            generation = overdue_cache.generation
+            rows, _ = self.execute_query(WORKLOAD_QUERY, (today.isoformat(), (today + timedelta(days=7)).isoformat()),
+                                         fetch=True)
+            if rows is None:
+                rows = []
+            workload = dict.fromkeys(WORKLOAD_BUCKETS, 0)
+            workload["minutes"] = 0
+            for bucket, count, minutes in rows:
+                workload[bucket] = count
+                workload["minutes"] += minutes
+            overdue_cache.put(key, generation, workload)
+        return dict(workload)
+
+    def load_task_store(self, project_id = None, filters: dict = None):
+        """
+        Returns a columnar snapshot (controllers.task_store.TaskColumnStore) of the
+        matching tasks for vectorized counts, filters and date bucketing. The rows are
+        streamed from one cursor; the store is cached until the next task change.
+
+        Args:
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            TaskColumnStore or None: The store, or None if NumPy is not installed or the query failed.
+        """
+        if not columnar_available():
+            return None
+        key = (project_id, tuple(sorted((filters or {}).items())))
+        store = store_cache.get(key)
+        if store is not None:
+            return store
+        generation = store_cache.generation
+        conditions, params = self._filter_conditions(project_id, filters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {STORE_COLUMNS} FROM tasks {where}"
+        try:
+            with connection() as db, track(query, db, tuple(params)) as probe:
+                store = TaskColumnStore.from_rows(db.execute(query, tuple(params)))
+                probe["rows"] = len(store)
+        except sqlite3.Error as e:
+            print(f"[TaskController] Error loading task store: {e}")
+            return None
+        store_cache.put(key, generation, store)
+        return store
+
+    def count_overdue(self) -> int:
+        """
+        Returns the number of open tasks whose due date is before today.
+        Due dates are stored as 'YYYY-MM-DD', so this is a range scan of the
+        partial index on due_date of open tasks; the result is cached
+        until the next task change or the next day.
+
+        Returns:
+            int: The number of overdue tasks.
+        """
+        today = date.today().isoformat()
+        key = ("count", today)
+        count = overdue_cache.get(key)
+        if count is None:
+            generation = overdue_cache.generation
+            rows, _ = self.execute_query(
+                "SELECT COUNT(*) FROM tasks WHERE done = 0 AND due_date < ?",
+                (today,), fetch=True
+            )
+            if rows is None:
+                return 0
+            count = rows[0][0]
+            overdue_cache.put(key, generation, count)
+        return count
+
+    def list_overdue(self, limit: int = 50) -> list:
+        """
+        Returns the open tasks whose due date is before today, oldest due date first.
+        The result is cached like count_overdue().
+
+        Args:
+            limit (int): Maximum number of tasks to return.
+
+        Returns:
+            list: Task objects with their subtasks.
+        """
+        today = date.today().isoformat()
+        key = ("list", today, int(limit))
+        tasks = overdue_cache.get(key)
+        if tasks is None:
+            generation = overdue_cache.generation
+            rows, _ = self.execute_query(
+                f"""
+                SELECT {TASK_COLUMNS} FROM tasks
+                 WHERE done = 0 AND due_date < ?
+                 ORDER BY due_date, id LIMIT ?
+                """,
+                (today, int(limit)), fetch=True
+            )
+            if rows is None:
+                return []
+            tasks = self._hydrate_tasks(rows)
+            overdue_cache.put(key, generation, tasks)
+        return list(tasks)
+
+    def count_tasks_by_day(self, month_start, month_end) -> dict:
+        """
+        Counts tasks per due day between two dates (inclusive) with one grouped query,
+        answered from the due_date index alone. Used by the calendar to mark busy days.
+
+        Args:
+            month_start (date or str): First day of the range.
+            month_end (date or str): Last day of the range.
+
+        Returns:
+            dict: Mapping of 'YYYY-MM-DD' to the number of tasks due that day.
+        """
+        rows, _ = self.execute_query(
+            "SELECT due_date, COUNT(*) FROM tasks WHERE due_date BETWEEN ? AND ? GROUP BY due_date",
+            (to_storage_date(month_start), to_storage_date(month_end)), fetch=True
+        )
+        return {day: count for day, count in rows or []}
+
+    def list_tasks_on(self, day) -> list:
+        """
+        Returns the tasks due on one day, with their subtasks, using the due_date index.
+
+        Args:
+            day (date or str): The day.
+
+        Returns:
+            list: Task objects ordered by time.
+        """
+        rows, _ = self.execute_query(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE due_date = ? ORDER BY time, id",
+            (to_storage_date(day),), fetch=True
+        )
+        return self._hydrate_tasks(rows or [])
+
+    @staticmethod
+    def _filter_conditions(project_id = None, filters: dict = None):
+        """
+        Builds the WHERE conditions for a project and whitelisted header filters.
+
+        Args:
+            project_id (int): Optional project ID to filter tasks.
+            filters (dict): Optional header filters, keyed by FILTER_CONDITIONS fields.
+
+        Returns:
+            tuple: (list of SQL conditions, list of parameters).
+        """
+        conditions, params = [], []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        for field, value in (filters or {}).items():
+            if field not in FILTER_CONDITIONS:
+                raise ValueError(f"Unsupported filter field: {field}")
+            conditions.append(FILTER_CONDITIONS[field])
+            params.append(value if field == "project" else normalize_choice(value))
+        return conditions, params
+
+    def get_task(self, task_id: int):
+        """
+        Returns a task with its subtasks, served from the identity map when cached.
+
+        Args:
+            task_id (int): The task's ID.
+
+        Returns:
+            Task or None: The task, or None if it does not exist.
+        """
+        task = task_cache.get(task_id)
+        if task is not None:
+            return task
+        rows, _ = self.execute_query(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,), fetch=True)
+        tasks = self._hydrate_tasks(rows or [], lookup=False)
+        return tasks[0] if tasks else None
+
+    def _hydrate_tasks(self, rows, with_subtasks: bool = True, populate: bool = True, lookup: bool = True):
+        """
+        Turns task rows into Task objects through the identity map.
+        A cached task is reused when its updated_at matches the row; the other rows
+        are built and, when with_subtasks is True, get their subtasks with one query.
+
+        Args:
+            rows (list): Rows selected with TASK_COLUMNS.
+            with_subtasks (bool): If True, populate Task.subtasks of the new objects.
+            populate (bool): If True, add the new objects (with subtasks) to the cache.
+            lookup (bool): If False, skip the cache lookup (already done by the caller).
+
+        Returns:
+            list: The tasks, in row order.
+        """
+        tasks, built = [], []
+        for row in rows:
+            task = task_cache.get(row[0], version=row[4], check_version=True) if lookup else None
+            if task is None:
+                task = self._task_from_row(row)
+                built.append(task)
+            tasks.append(task)
+        if with_subtasks:
+            # Bounded IN lists keep each query under SQLite's host parameter limit.
+            for start in range(0, len(built), MAX_PAGE_SIZE):
+                chunk = built[start:start + MAX_PAGE_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                subtasks_by_task = self._load_subtasks(
+                    f"WHERE task_id IN ({placeholders})", tuple(t.id for t in chunk)
                 )
-                # Retrieve and assign associated subtasks.
-                t.subtasks = self.list_subtasks(t.id)
-                tasks.append(t)
+                for t in chunk:
+                    t.subtasks = subtasks_by_task.get(t.id, [])
+                    if populate:
+                        task_cache.put(t.id, t)
         return tasks
 
+    @staticmethod
+    def _patch_cached_task(task_id: int, **fields):
+        """
+        Applies committed field changes to the cached task, if any.
+        Inside an explicit transaction the change may still be rolled back, so the
+        cached task is invalidated instead.
+
+        Args:
+            task_id (int): The task's ID.
+            **fields: Attribute values to set on the cached task.
+        """
+        cached = task_cache.peek(task_id)
+        if cached is None:
+            return
+        if current_transaction() is not None:
+            task_cache.invalidate(task_id)
+            return
+        for name, value in fields.items():
+            setattr(cached, name, value)
+
+    @staticmethod
+    def _task_from_row(row) -> Task:
+        """
+        Builds a Task (without subtasks) from a row selected with TASK_COLUMNS.
+
+        Args:
+            row (tuple): The database row.
+
+        Returns:
+            Task: The hydrated task.
+        """
+        (id_, title, desc, created_at, updated_at, due_date, time_field, dur,
+         priority, status, done_val, proj_id) = row
+        return Task(
+            id=id_,
+            title=title,
+            description=desc or "",
+            created_at=created_at,
+            updated_at=updated_at,
+            due_date=intern_text(due_date),
+            time=intern_text(time_field),
+            duration=dur,
+            priority=intern_text(priority),
+            status=intern_text(status),
+            done=bool(done_val),
+            project_id=proj_id
+        )
+
+    @staticmethod
+    def _summary_from_row(row) -> TaskSummary:
+        """
+        Builds a TaskSummary from a row selected by build_summary_query(), interning
+        the repeated project, status, priority and due date values.
+
+        Args:
+            row (tuple): The database row.
+
+        Returns:
+            TaskSummary: The summary.
+        """
+        (id_, title, proj_id, project, status, priority, due_date, time_field,
+         updated_at, subtasks_done, subtasks_total) = row
+        return TaskSummary(
+            id_, title, proj_id, intern_text(project), intern_text(status), intern_text(priority),
+            intern_text(due_date), intern_text(time_field), updated_at, subtasks_done, subtasks_total
+        )
+
     def mark_task_done(self, task_id: int, is_done: bool = True):
         """
         Marks a task as done (or not done) and updates its status accordingly.
@@ -148,44 +954,144 @@ class TaskController:
         status = "completed" if is_done else "not started"
         query = "UPDATE tasks SET done = ?, status = ?, updated_at = ? WHERE id = ?"
         timestamp = get_current_timestamp()
-        self.execute_query(query, (1 if is_done else 0, status, timestamp, task_id))
+        _, last_id = self.execute_query(query, (1 if is_done else 0, status, timestamp, task_id))
+        if last_id is None:
+            task_cache.invalidate(task_id)
+            return
+        self._patch_cached_task(task_id, done=is_done, status=status, updated_at=timestamp)
+        events.bus.publish(events.TASK_UPDATED, (task_id,), ("done", "status"))
 
-    def delete_task(self, task_id: int):
+    def delete_task(self, task_id: int) -> bool:
         """
-        Deletes a task and all its associated subtasks from the database.
+        Deletes a task and all its associated subtasks from the database
+        in a single transaction.
 
         Args:
             task_id (int): The ID of the task to delete.
+
+        Returns:
+            bool: True if the deletion was committed, False otherwise.
         """
-        self.execute_query("DELETE FROM subtasks WHERE task_id = ?", (task_id,))
-        self.execute_query("DELETE FROM tasks WHERE id = ?", (task_id,))
+        with transaction() as tx:
+            self.execute_query("DELETE FROM subtasks WHERE task_id = ?", (task_id,))
+            self.execute_query("DELETE FROM tasks WHERE id = ?", (task_id,))
+            events.bus.publish(events.TASK_DELETED, (task_id,))
+        task_cache.invalidate(task_id)
+        return not tx.failed
 
-    def update_task(self, task: Task):
+    def delete_tasks(self, task_ids) -> bool:
+        """
+        Deletes several tasks and their subtasks in a single transaction.
+
+        Args:
+            task_ids (iterable of int): The IDs of the tasks to delete.
+
+        Returns:
+            bool: True if the deletion was committed, False otherwise.
+        """
+        params = [(task_id,) for task_id in task_ids]
+        if not params:
+            return True
+        with transaction() as tx:
+            self.execute_many("DELETE FROM subtasks WHERE task_id = ?", params)
+            self.execute_many("DELETE FROM tasks WHERE id = ?", params)
+            events.bus.publish(events.TASK_DELETED, (task_id for task_id, in params))
+        task_cache.invalidate_many(task_id for task_id, in params)
+        return not tx.failed
+
+    def update_task(self, task: Task, fields=None):
         """
         Updates an existing task with new data. Updates the updated_at timestamp.
+        The task object is brought in line with the stored row, and the cached
+        copy of the task (if it is a different object) is patched as well. Callers
+        should edit a copy (dataclasses.replace) of a cached task, so a rejected
+        update leaves the cache unchanged.
 
         Args:
             task (Task): The Task object containing updated information.
+            fields (iterable): Names of the fields the caller changed, reported in the
+                TASK_UPDATED event; defaults to EDITABLE_TASK_FIELDS.
+
+        Returns:
+            bool: True if the task was updated.
         """
+        try:
+            due_date, due_time = to_storage_date(task.due_date), to_storage_time(task.time)
+        except ValueError as e:
+            print(f"[TaskController] Invalid due date or time: {e}")
+            # The cached object may have been edited in place; reload it on the next read.
+            task_cache.invalidate(task.id)
+            return False
         timestamp = get_current_timestamp()
         query = """
             UPDATE tasks
                SET title = ?, description = ?, updated_at = ?, due_date = ?, time = ?, duration = ?, priority = ?, status = ?, done = ?, project_id = ?
              WHERE id = ?
         """
-        self.execute_query(query, (
+        priority = normalize_choice(task.priority)
+        status = normalize_choice(task.status)
+        _, last_id = self.execute_query(query, (
             task.title,
             task.description,
             timestamp,
-            task.due_date,
-            task.time,
+            due_date,
+            due_time,
             task.duration,
-            task.priority,
-            task.status,
+            priority,
+            status,
             int(task.done),
             task.project_id,
             task.id
         ))
+        if last_id is None:
+            task_cache.invalidate(task.id)
+            return False
+        task.updated_at, task.priority, task.status = timestamp, priority, status
+        task.due_date, task.time = due_date, due_time
+        if task_cache.peek(task.id) is not task:
+            self._patch_cached_task(
+                task.id,
+                title=task.title,
+                description=task.description,
+                updated_at=timestamp,
+                due_date=task.due_date,
+                time=task.time,
+                duration=task.duration,
+                priority=priority,
+                status=status,
+                done=task.done,
+                project_id=task.project_id
+            )
+        elif current_transaction() is not None:
+            task_cache.invalidate(task.id)
+        events.bus.publish(events.TASK_UPDATED, (task.id,), fields or EDITABLE_TASK_FIELDS)
+        return True
+
+    def search_tasks(self, query: str, limit: int = 20):
+        """
+        Full-text search over task titles, descriptions and subtask titles.
+        Results are ranked with BM25 (title matches weigh most) and include a
+        snippet where matched words are wrapped in [brackets].
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: (task_id, title, snippet) tuples, best match first.
+        """
+        match = build_match_expression(query)
+        if match is None:
+            return []
+        sql = f"""
+            SELECT rowid, title, snippet(tasks_fts, -1, '[', ']', '…', 10)
+              FROM tasks_fts
+             WHERE tasks_fts MATCH ?
+             ORDER BY bm25(tasks_fts, {", ".join(str(w) for w in SEARCH_WEIGHTS)})
+             LIMIT ?
+        """
+        rows, _ = self.execute_query(sql, (match, int(limit)), fetch=True)
+        return [tuple(row) for row in rows or []]
 
     # --- SUBTASK METHODS ---
 
@@ -199,20 +1105,32 @@ class TaskController:
         Returns:
             list: A list of Subtask objects.
         """
-        query = "SELECT id, title, description, done FROM subtasks WHERE task_id = ?"
-        rows, _ = self.execute_query(query, (task_id,), fetch=True)
-        subs = []
+        return self._load_subtasks("WHERE task_id = ?", (task_id,)).get(task_id, [])
+
+    def _load_subtasks(self, where: str = "", params: tuple = ()):
+        """
+        Loads subtasks matching an optional WHERE clause and groups them by parent task.
+
+        Args:
+            where (str): SQL WHERE clause applied to the subtasks table.
+            params (tuple): Parameters for the WHERE clause.
+
+        Returns:
+            dict: Mapping of task_id to a list of Subtask objects, in id order.
+        """
+        query = f"SELECT id, task_id, title, description, done FROM subtasks {where} ORDER BY task_id, id"
+        rows, _ = self.execute_query(query, params, fetch=True)
+        grouped = {}
         if rows:
-            for row in rows:
-                id_, title, desc, done_val = row
-                subs.append(Subtask(
+            for id_, task_id, title, desc, done_val in rows:
+                grouped.setdefault(task_id, []).append(Subtask(
                     id=id_,
                     task_id=task_id,
                     title=title,
                     description=desc,
                     done=bool(done_val)
                 ))
-        return subs
+        return grouped
 
     def create_subtask(self, task_id: int, title: str, description: str = "") -> bool:
         """
@@ -233,7 +1151,51 @@ class TaskController:
             VALUES (?, ?, ?, 0)
         """
         _, last_id = self.execute_query(query, (task_id, title, description))
-        return last_id is not None
+        task_cache.invalidate(task_id)
+        if last_id is None:
+            return False
+        events.bus.publish(events.TASK_UPDATED, (task_id,), (events.SUBTASKS_FIELD,))
+        return True
+
+    def create_subtasks_bulk(self, rows) -> list:
+        """
+        Creates many subtasks in a single transaction.
+        Each row is a mapping with task_id, title and an optional description.
+        An invalid row aborts the whole batch.
+
+        Args:
+            rows (iterable): Mappings describing the subtasks to create.
+
+        Returns:
+            list: The ids of the created subtasks in input order, or an empty list on failure.
+        """
+        task_ids = set()
+
+        def params():
+            for index, row in enumerate(rows):
+                task_id = row.get("task_id")
+                title = row.get("title", "")
+                if task_id is None or not validate_positive_int(task_id):
+                    raise ValueError(f"row {index}: invalid task id {task_id!r}")
+                if not validate_non_empty(title):
+                    raise ValueError(f"row {index}: title is required")
+                task_ids.add(int(task_id))
+                yield (int(task_id), title, row.get("description", ""))
+
+        query = """
+            INSERT INTO subtasks (task_id, title, description, done)
+            VALUES (?, ?, ?, 0)
+        """
+        index_new_rows = """
+            UPDATE tasks_fts
+               SET subtasks = (SELECT IFNULL(group_concat(s.title, ' '), '') FROM subtasks s WHERE s.task_id = tasks_fts.rowid)
+             WHERE rowid IN (SELECT task_id FROM subtasks WHERE id BETWEEN ? AND ?)
+        """
+        ids = self._insert_bulk(query, params(), index_new_rows)
+        task_cache.invalidate_many(task_ids)
+        if ids:
+            events.bus.publish(events.TASK_UPDATED, sorted(task_ids), (events.SUBTASKS_FIELD,))
+        return ids
 
     def update_subtask(self, subtask: Subtask):
         """
@@ -247,7 +1209,10 @@ class TaskController:
                SET title = ?, description = ?, done = ?
              WHERE id = ?
         """
-        self.execute_query(query, (subtask.title, subtask.description, int(subtask.done), subtask.id))
+        _, last_id = self.execute_query(query, (subtask.title, subtask.description, int(subtask.done), subtask.id))
+        task_cache.invalidate(subtask.task_id)
+        if last_id is not None:
+            events.bus.publish(events.TASK_UPDATED, (subtask.task_id,), (events.SUBTASKS_FIELD,))
 
     def delete_subtask(self, subtask_id: int):
         """
@@ -256,5 +1221,10 @@ class TaskController:
         Args:
             subtask_id (int): The ID of the subtask to delete.
         """
+        rows, _ = self.execute_query("SELECT task_id FROM subtasks WHERE id = ?", (subtask_id,), fetch=True)
         query = "DELETE FROM subtasks WHERE id = ?"
-        self.execute_query(query, (subtask_id,))
+        _, last_id = self.execute_query(query, (subtask_id,))
+        if rows:
+            task_cache.invalidate(rows[0][0])
+            if last_id is not None:
+                events.bus.publish(events.TASK_UPDATED, (rows[0][0],), (events.SUBTASKS_FIELD,))
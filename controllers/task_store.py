@@ -0,0 +1,258 @@
+"""
+task_store.py
+
+Columnar, in-memory snapshot of the tasks table for vectorized analytics.
+Each task attribute used by the analytics lives in a NumPy array (ids, project
+ids, status and priority codes, due dates, durations, done flags); status and
+priority strings are stored once in a StringTable side-table and referenced by
+code. Filters build boolean masks, and counts are computed with bincount and
+unique instead of Python loops over Task objects.
+
+NumPy is an optional dependency: without it columnar_available() returns False
+and callers fall back to the SQL queries of TaskController.
+"""
+
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency.
+    np = None
+
+# Task columns read into the store, in row order.
+STORE_COLUMNS = "id, project_id, status, priority, due_date, duration, done"
+
+# Rows converted to arrays at a time while the store is built.
+BUILD_CHUNK_SIZE = 50000
+
+def columnar_available() -> bool:
+    """
+    Returns True if NumPy is installed and the columnar store can be built.
+    """
+    return np is not None
+
+class StringTable:
+    """
+    Side-table of the distinct strings of a categorical column.
+    Code 0 stands for NULL; strings get codes 1, 2, ... in order of appearance.
+    """
+
+    def __init__(self):
+        self.values = [None]
+        self._codes = {None: 0}
+
+    def code(self, value) -> int:
+        """
+        Returns the code of value, adding it to the table if needed.
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value) -> int:
+        """
+        Returns the code of value, or -1 if it does not occur in the column.
+        """
+        return self._codes.get(value, -1)
+
+    def encode(self, values):
+        """
+        Returns the codes of a sequence of values as an int16 array.
+        """
+        code = self.code
+        return np.fromiter((code(v) for v in values), dtype=np.int16, count=len(values))
+
+class TaskColumnStore:
+    """
+    Column arrays of a set of tasks, built by TaskColumnStore.from_rows().
+
+    Attributes:
+        ids (ndarray[int64]): Task ids, in the order the rows were read.
+        project_ids (ndarray[int64]): Project ids; 0 when the task has no project.
+        status, priority (ndarray[int16]): Codes into the statuses / priorities tables.
+        due (ndarray[datetime64[D]]): Due dates; NaT when not set.
+        duration (ndarray[int32]): Durations in minutes; 0 when not set.
+        done (ndarray[bool]): Completion flags.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("The columnar task store requires NumPy.")
+        self.statuses = StringTable()
+        self.priorities = StringTable()
+        self.ids = np.empty(0, dtype=np.int64)
+        self.project_ids = np.empty(0, dtype=np.int64)
+        self.status = np.empty(0, dtype=np.int16)
+        self.priority = np.empty(0, dtype=np.int16)
+        self.due = np.empty(0, dtype="datetime64[D]")
+        self.duration = np.empty(0, dtype=np.int32)
+        self.done = np.empty(0, dtype=bool)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds a store from rows selected with STORE_COLUMNS.
+
+        Args:
+            rows (iterable): The rows; read and converted BUILD_CHUNK_SIZE at a time.
+
+        Returns:
+            TaskColumnStore: The store.
+        """
+        store = cls()
+        chunks = {name: [] for name in ("ids", "project_ids", "status", "priority", "due", "duration", "done")}
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BUILD_CHUNK_SIZE:
+                store._convert(batch, chunks)
+                batch = []
+        if batch:
+            store._convert(batch, chunks)
+        for name, parts in chunks.items():
+            if parts:
+                setattr(store, name, np.concatenate(parts))
+        return store
+
+    def _convert(self, batch, chunks):
+        """
+        Converts one batch of rows into column arrays appended to chunks.
+        """
+        count = len(batch)
+        ids, project_ids, statuses, priorities, dues, durations, dones = zip(*batch)
+        chunks["ids"].append(np.fromiter(ids, dtype=np.int64, count=count))
+        chunks["project_ids"].append(np.fromiter((p or 0 for p in project_ids), dtype=np.int64, count=count))
+        chunks["status"].append(self.statuses.encode(statuses))
+        chunks["priority"].append(self.priorities.encode(priorities))
+        # None converts to NaT.
+        chunks["due"].append(np.array(dues, dtype="datetime64[D]"))
+        chunks["duration"].append(np.fromiter((d or 0 for d in durations), dtype=np.int32, count=count))
+        chunks["done"].append(np.fromiter((bool(d) for d in dones), dtype=bool, count=count))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def mask(self, project_id = None, status: str = None, priority: str = None, done: bool = None,
+             due_from = None, due_to = None):
+        """
+        Returns the boolean mask of the tasks matching every given criterion.
+
+        Args:
+            project_id (int): Project ID.
+            status (str): Stored status value (e.g. "in progress").
+            priority (str): Stored priority value.
+            done (bool): Completion flag.
+            due_from (date or str): First due date (inclusive).
+            due_to (date or str): Last due date (inclusive).
+
+        Returns:
+            ndarray[bool]: The mask.
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if project_id is not None:
+            selected &= self.project_ids == project_id
+        if status is not None:
+            selected &= self.status == self.statuses.lookup(status)
+        if priority is not None:
+            selected &= self.priority == self.priorities.lookup(priority)
+        if done is not None:
+            selected &= self.done == bool(done)
+        if due_from is not None:
+            selected &= self.due >= np.datetime64(str(due_from), "D")
+        if due_to is not None:
+            selected &= self.due <= np.datetime64(str(due_to), "D")
+        return selected
+
+    def count(self, mask=None) -> int:
+        """
+        Returns the number of tasks selected by mask (all tasks by default).
+        """
+        return len(self) if mask is None else int(np.count_nonzero(mask))
+
+    def count_by(self, column: str, mask=None) -> dict:
+        """
+        Counts the selected tasks per value of a column.
+
+        Args:
+            column (str): "status", "priority", "project_id" or "done".
+            mask (ndarray[bool]): Optional selection.
+
+        Returns:
+            dict: value -> count, without zero counts; None for unset values.
+        """
+        if column in ("status", "priority"):
+            table = self.statuses if column == "status" else self.priorities
+            codes = getattr(self, column) if mask is None else getattr(self, column)[mask]
+            counts = np.bincount(codes, minlength=len(table.values))
+            return {table.values[code]: int(n) for code, n in enumerate(counts) if n}
+        if column == "project_id":
+            values = self.project_ids if mask is None else self.project_ids[mask]
+            keys, counts = np.unique(values, return_counts=True)
+            return {(int(k) or None): int(n) for k, n in zip(keys, counts)}
+        if column == "done":
+            values = self.done if mask is None else self.done[mask]
+            done = int(np.count_nonzero(values))
+            return {key: n for key, n in ((True, done), (False, len(values) - done)) if n}
+        raise ValueError(f"Unsupported column: {column}")
+
+    def count_by_day(self, start, end, mask=None) -> dict:
+        """
+        Counts the selected tasks per due day between two dates (inclusive).
+
+        Args:
+            start (date or str): First day.
+            end (date or str): Last day.
+            mask (ndarray[bool]): Optional selection.
+
+        Returns:
+            dict: 'YYYY-MM-DD' -> count, for days with at least one task.
+        """
+        first = np.datetime64(str(start), "D")
+        days = (np.datetime64(str(end), "D") - first).astype(int) + 1
+        due = self.due if mask is None else self.due[mask]
+        offsets = (due[~np.isnat(due)] - first).astype(np.int64)
+        offsets = offsets[(offsets >= 0) & (offsets < days)]
+        counts = np.bincount(offsets, minlength=max(days, 0))
+        return {str(first + int(i)): int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def due_buckets(self, today: date = None, mask=None) -> dict:
+        """
+        Buckets the selected tasks by due date relative to today.
+
+        Args:
+            today (date): Reference day; defaults to today.
+            mask (ndarray[bool]): Optional selection, e.g. mask(done=False).
+
+        Returns:
+            dict: overdue, today, this_week (the next 6 days), later and no_date counts.
+        """
+        today = np.datetime64(str(today or date.today()), "D")
+        due = self.due if mask is None else self.due[mask]
+        unset = np.isnat(due)
+        # NaT compares False with everything, so unset dates fall in no bucket below.
+        edges = np.array([today, today + 1, today + 7], dtype="datetime64[D]")
+        bucket = np.searchsorted(edges, due[~unset], side="right")
+        counts = np.bincount(bucket, minlength=4)
+        return {
+            "overdue": int(counts[0]),
+            "today": int(counts[1]),
+            "this_week": int(counts[2]),
+            "later": int(counts[3]),
+            "no_date": int(np.count_nonzero(unset)),
+        }
+
+    def total_duration(self, mask=None) -> int:
+        """
+        Returns the summed duration (minutes) of the selected tasks.
+        """
+        values = self.duration if mask is None else self.duration[mask]
+        return int(values.sum(dtype=np.int64))
+
+    def task_ids(self, mask=None) -> list:
+        """
+        Returns the ids of the selected tasks, e.g. to load them with TaskController.
+        """
+        values = self.ids if mask is None else self.ids[mask]
+        return values.tolist()
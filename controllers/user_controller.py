@@ -6,18 +6,18 @@ retrieval, deletion, and login time updates. It uses a helper function to get th
 timestamp and executes SQL queries with appropriate error handling.
 """
 
-from datetime import datetime
 import sqlite3
-from database.database import connect_db, close_db
+from utils.dates import now_timestamp
+from database.instrumentation import run_query
 
 def get_current_timestamp() -> str:
     """
-    Returns the current timestamp in ISO format.
+    Returns the current timestamp in the canonical ISO form of utils.dates.
 
     Returns:
         str: The current timestamp.
     """
-    return datetime.now().isoformat()
+    return now_timestamp()
 
 class UserController:
     """
@@ -37,21 +37,11 @@ class UserController:
             tuple: (rows, last_id) where rows is the fetched data (if any),
                    and last_id is the last inserted row id.
         """
-        db = None
         try:
-            db = connect_db()
-            if not db:
-                return (None, None)
-            cursor = db.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall() if fetch else None
-            db.commit()
-            return (rows, cursor.lastrowid)
+            return run_query(query, params, fetch)
         except sqlite3.Error as e:
             print(f"[UserController] Error executing query: {e}")
             return (None, None)
-        finally:
-            close_db(db)
 
     def create_user(self, username: str, email: str, password: str, theme: str = "dark") -> bool:
         """
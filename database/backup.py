@@ -0,0 +1,219 @@
+"""
+backup.py
+
+Online snapshots of the database file built on sqlite3.Connection.backup().
+Pages are copied a few at a time inside one read transaction on the live
+database: other connections keep reading and writing (WAL mode) while the copy
+runs, and the snapshot is the database as it was when the backup started.
+Snapshots are written next to each other in BACKUP_DIR, the oldest beyond a
+limit are deleted, and any snapshot can be copied back over the live database.
+"""
+
+import os
+import re
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+from database.database import DB_PATH, connect_db, close_db
+from database.migrations import migrate
+
+# Directory holding the snapshots.
+BACKUP_DIR = "data/backups"
+# Number of snapshots kept by rotate_snapshots().
+BACKUP_KEEP = 5
+# Pages copied per backup step; the progress callback runs (and cancellation is checked) between steps.
+BACKUP_STEP_PAGES = 256
+
+# Snapshot file names: database-YYYYMMDD-HHMMSS-mmm.db (sortable, unique per millisecond).
+SNAPSHOT_PREFIX = "database-"
+SNAPSHOT_TIME_FORMAT = "%Y%m%d-%H%M%S-%f"
+_SNAPSHOT_NAME = re.compile(r"^database-(\d{8}-\d{6}-\d{3})\.db$")
+
+# path: snapshot file; created: datetime from the file name; size: file size in bytes.
+Snapshot = namedtuple("Snapshot", ["path", "created", "size"])
+
+def snapshot_path(backup_dir: str = BACKUP_DIR, now: datetime = None) -> str:
+    """
+    Returns the path of a new snapshot taken now.
+
+    Args:
+        backup_dir (str): Directory holding the snapshots.
+        now (datetime): Snapshot time; defaults to the current time.
+
+    Returns:
+        str: backup_dir/database-YYYYMMDD-HHMMSS-mmm.db
+    """
+    now = now or datetime.now()
+    stamp = f"{now:%Y%m%d-%H%M%S}-{now.microsecond // 1000:03d}"
+    return os.path.join(backup_dir, f"{SNAPSHOT_PREFIX}{stamp}.db")
+
+def list_snapshots(backup_dir: str = BACKUP_DIR) -> list:
+    """
+    Lists the snapshots in backup_dir, newest first. Other files are ignored.
+
+    Args:
+        backup_dir (str): Directory holding the snapshots.
+
+    Returns:
+        list: Snapshot tuples.
+    """
+    try:
+        names = os.listdir(backup_dir)
+    except FileNotFoundError:
+        return []
+    snapshots = []
+    for name in names:
+        match = _SNAPSHOT_NAME.match(name)
+        if not match:
+            continue
+        path = os.path.join(backup_dir, name)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        created = datetime.strptime(match.group(1), SNAPSHOT_TIME_FORMAT)
+        snapshots.append(Snapshot(path, created, size))
+    snapshots.sort(key=lambda s: s.created, reverse=True)
+    return snapshots
+
+def rotate_snapshots(keep: int = BACKUP_KEEP, backup_dir: str = BACKUP_DIR) -> list:
+    """
+    Deletes the snapshots beyond the keep most recent.
+
+    Args:
+        keep (int): Number of snapshots kept.
+        backup_dir (str): Directory holding the snapshots.
+
+    Returns:
+        list: Paths of the deleted snapshots.
+    """
+    deleted = []
+    for snapshot in list_snapshots(backup_dir)[max(keep, 0):]:
+        try:
+            os.remove(snapshot.path)
+            deleted.append(snapshot.path)
+        except OSError as e:
+            print(f"Error deleting snapshot {snapshot.path}: {e}")
+    return deleted
+
+def backup_to(path: str, progress=None, pages: int = BACKUP_STEP_PAGES, db_path: str = DB_PATH) -> str:
+    """
+    Copies the live database to path. The copy is written to path + ".part" and
+    renamed once complete, so path is either absent or a complete snapshot.
+
+    Args:
+        path (str): Destination file.
+        progress (callable): Called as progress(pages_copied, total_pages) after each step;
+            an exception raised by it aborts the backup and is propagated.
+        pages (int): Pages copied per step.
+        db_path (str): The live database.
+
+    Returns:
+        str: path.
+
+    Raises:
+        sqlite3.Error: If the database cannot be read or the snapshot written.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    part = path + ".part"
+    source = _open(db_path)
+    target = None
+    try:
+        # Steps of one read transaction see one version of the database: writes
+        # committed meanwhile by other connections neither restart nor tear the copy.
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        target = _open(part)
+        source.backup(target, pages=pages, progress=_step_reporter(progress))
+        # The copied header keeps the WAL flag; a standalone file needs no -wal/-shm companions.
+        target.execute("PRAGMA journal_mode = DELETE")
+        target.close()
+        target = None
+        os.replace(part, path)
+    except BaseException:
+        close_db(target)
+        if os.path.exists(part):
+            os.remove(part)
+        raise
+    finally:
+        close_db(source)
+    return path
+
+def check_snapshot(path: str) -> str:
+    """
+    Verifies that path is a readable, uncorrupted SQLite database.
+
+    Args:
+        path (str): The snapshot file.
+
+    Returns:
+        str: "ok", or the first problem reported by PRAGMA quick_check.
+    """
+    if not os.path.isfile(path):
+        return f"{path} does not exist"
+    try:
+        db = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+    except sqlite3.Error as e:
+        return str(e)
+    try:
+        return db.execute("PRAGMA quick_check").fetchone()[0]
+    except sqlite3.Error as e:
+        return str(e)
+    finally:
+        close_db(db)
+
+def restore_from(path: str, progress=None, pages: int = BACKUP_STEP_PAGES, db_path: str = DB_PATH) -> int:
+    """
+    Replaces the content of the live database with the snapshot at path, then
+    applies the schema migrations the snapshot predates. The copy runs in one
+    write transaction on the live database: other writers wait until it ends,
+    and the database is left unchanged if it fails or is aborted.
+
+    Args:
+        path (str): The snapshot file.
+        progress (callable): Called as progress(pages_copied, total_pages) after each step;
+            an exception raised by it aborts the restore and is propagated.
+        pages (int): Pages copied per step.
+        db_path (str): The live database.
+
+    Returns:
+        int: Schema version of the restored database.
+
+    Raises:
+        ValueError: If the snapshot fails the integrity check.
+        sqlite3.Error: If the snapshot cannot be read or the database written (MigrationError
+            if a migration of the restored schema fails).
+    """
+    problem = check_snapshot(path)
+    if problem != "ok":
+        raise ValueError(f"{path} is not a valid snapshot: {problem}")
+    source = _open(path)
+    target = None
+    try:
+        target = _open(db_path)
+        source.backup(target, pages=pages, progress=_step_reporter(progress))
+        return migrate(target)
+    finally:
+        close_db(source)
+        close_db(target)
+
+def _open(db_path: str) -> sqlite3.Connection:
+    """
+    Opens a connection dedicated to a backup or restore, outside the connection pool.
+    """
+    db = connect_db(db_path)
+    if db is None:
+        raise sqlite3.OperationalError(f"Unable to open database {db_path}")
+    return db
+
+def _step_reporter(progress):
+    """
+    Adapts progress(pages_copied, total_pages) to the sqlite3 backup callback.
+    """
+    if progress is None:
+        return None
+
+    def report(status, remaining, total):
+        progress(total - remaining, total)
+
+    return report
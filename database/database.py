@@ -4,12 +4,21 @@ database.py
 Provides functions to manage the SQLite database connection and table creation.
 It creates the required database directories, connects to the database,
 enables foreign key support, and creates the necessary tables if they don't exist.
+
+Controllers share a single ConnectionPool so that statements reuse long-lived
+connections instead of opening and closing the database file for every query.
+Statements can be grouped into one atomic commit with `with transaction():`.
 """
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
+from database.migrations import migrate
+
+DB_PATH = "data/database.db"
 
-def connect_db(db_path: str = "data/database.db"):
+def connect_db(db_path: str = DB_PATH):
     """
     Connects to the SQLite database at the specified path.
     Ensures that the directory exists and enables foreign key support.
@@ -23,9 +32,12 @@ def connect_db(db_path: str = "data/database.db"):
     # Create the directory if it does not exist.
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     try:
-        db = sqlite3.connect(db_path)
+        # Pooled connections may be handed to other threads (one at a time).
+        db = sqlite3.connect(db_path, check_same_thread=False)
         # Enable foreign key support.
         db.execute("PRAGMA foreign_keys = ON;")
+        # In WAL mode NORMAL is durable across application crashes and avoids an fsync per commit.
+        db.execute("PRAGMA synchronous = NORMAL;")
         return db
     except sqlite3.Error as e:
         print(f"Database connection error: {e}")
@@ -125,11 +137,299 @@ def close_db(db: sqlite3.Connection):
         except sqlite3.Error as e:
             print(f"Error closing database: {e}")
 
+class ConnectionPool:
+    """
+    Keeps a small set of open connections to the same database file and hands
+    them out on demand. A connection is used by a single caller between
+    checkout() and release(); released connections stay open for reuse.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, max_idle: int = 4):
+        """
+        Args:
+            db_path (str): The file path for the SQLite database.
+            max_idle (int): Maximum number of idle connections kept open.
+        """
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def checkout(self) -> sqlite3.Connection:
+        """
+        Returns a healthy connection, reusing an idle one when possible.
+
+        Returns:
+            sqlite3.Connection: An open database connection.
+
+        Raises:
+            sqlite3.OperationalError: If the pool is closed or a new connection cannot be opened.
+        """
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.OperationalError("Connection pool is closed")
+                db = self._idle.pop() if self._idle else None
+            if db is None:
+                break
+            if self.is_healthy(db):
+                return db
+            close_db(db)
+        db = connect_db(self.db_path)
+        if db is None:
+            raise sqlite3.OperationalError(f"Unable to open database {self.db_path}")
+        return db
+
+    def release(self, db: sqlite3.Connection):
+        """
+        Returns a connection to the pool. Any open transaction is rolled back.
+        Connections beyond max_idle (or released after shutdown) are closed.
+
+        Args:
+            db (sqlite3.Connection): The connection obtained from checkout().
+        """
+        if db is None:
+            return
+        try:
+            if db.in_transaction:
+                db.rollback()
+        except sqlite3.Error:
+            close_db(db)
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(db)
+                return
+        close_db(db)
+
+    @staticmethod
+    def is_healthy(db: sqlite3.Connection) -> bool:
+        """
+        Checks that a connection is still usable.
+
+        Args:
+            db (sqlite3.Connection): The connection to check.
+
+        Returns:
+            bool: True if a trivial query succeeds, False otherwise.
+        """
+        try:
+            db.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager wrapping checkout() and release().
+
+        Yields:
+            sqlite3.Connection: A pooled database connection.
+        """
+        db = self.checkout()
+        try:
+            yield db
+        finally:
+            self.release(db)
+
+    def close_all(self):
+        """
+        Closes every idle connection and refuses further checkouts.
+        Connections currently checked out are closed when released.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for db in idle:
+            close_db(db)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    """
+    Returns the connection pool shared by all controllers, creating it on first use.
+
+    Returns:
+        ConnectionPool: The shared pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+def shutdown_db():
+    """
+    Closes the shared connection pool. Called when the application exits.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+
+class Transaction:
+    """
+    State of an open unit of work: the connection every statement of the
+    current thread runs on, whether one of those statements failed, and the
+    callbacks to run once it has been committed.
+    """
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+        self.failed = False
+        self.commit_callbacks = []
+
+    def on_commit(self, callback):
+        """
+        Registers a callback run after the transaction commits; it is discarded on rollback.
+
+        Args:
+            callback (callable): Called without arguments.
+        """
+        self.commit_callbacks.append(callback)
+
+_local = threading.local()
+
+def current_transaction():
+    """
+    Returns the unit of work open on the calling thread, if any.
+
+    Returns:
+        Transaction or None: The active transaction.
+    """
+    return getattr(_local, "transaction", None)
+
+@contextmanager
+def transaction():
+    """
+    Groups every statement executed on the calling thread into a single commit.
+    Controller queries issued inside the block share one pooled connection. The
+    transaction is rolled back if the block raises or if any statement failed.
+    Nested blocks join the outermost transaction. Callbacks registered with
+    Transaction.on_commit() run after a successful commit.
+
+    Usage:
+        with transaction() as tx:
+            controller.execute_query(...)
+            controller.execute_query(...)
+        ok = not tx.failed
+
+    Yields:
+        Transaction: The active unit of work.
+    """
+    outer = current_transaction()
+    if outer is not None:
+        try:
+            yield outer
+        except Exception:
+            outer.failed = True
+            raise
+        return
+    db = _acquire()
+    tx = Transaction(db)
+    _local.transaction = tx
+    try:
+        # Take the write lock up front so concurrent writers wait instead of deadlocking.
+        db.execute("BEGIN IMMEDIATE")
+        yield tx
+        if tx.failed:
+            db.rollback()
+        else:
+            db.commit()
+    except Exception:
+        tx.failed = True
+        db.rollback()
+        raise
+    finally:
+        _local.transaction = None
+        _release(db)
+    if not tx.failed:
+        for callback in tx.commit_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in commit callback: {e}")
+
+@contextmanager
+def connection():
+    """
+    Provides the connection a single statement should run on.
+    Inside transaction() this is the transaction's connection and nothing is
+    committed here; otherwise a pooled connection is checked out and the
+    statement is committed (or rolled back on error) before it is released.
+
+    Yields:
+        sqlite3.Connection: The connection to execute on.
+    """
+    tx = current_transaction()
+    if tx is not None:
+        try:
+            yield tx.db
+        except Exception:
+            tx.failed = True
+            raise
+        return
+    db = _acquire()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        _release(db)
+
+@contextmanager
+def pinned_connection():
+    """
+    Dedicates one pooled connection to the calling thread for the duration of the block.
+    Every statement and transaction issued by that thread runs on it. Used by
+    long-lived threads such as the background database worker.
+
+    Yields:
+        sqlite3.Connection: The pinned connection.
+    """
+    pool = get_pool()
+    db = pool.checkout()
+    _local.pinned = db
+    try:
+        yield db
+    finally:
+        _local.pinned = None
+        pool.release(db)
+
+def _acquire() -> sqlite3.Connection:
+    """
+    Returns the connection pinned to the calling thread, or checks one out of the pool.
+    """
+    pinned = getattr(_local, "pinned", None)
+    return pinned if pinned is not None else get_pool().checkout()
+
+def _release(db: sqlite3.Connection):
+    """
+    Returns a connection obtained from _acquire(); pinned connections stay with their thread.
+    """
+    if db is not getattr(_local, "pinned", None):
+        get_pool().release(db)
+
 def init_db():
     """
-    Initializes the database by connecting, creating required tables, then closing the connection.
+    Initializes the database by connecting, creating required tables,
+    applying pending schema migrations, then closing the connection.
+
+    Raises:
+        MigrationError: If a migration fails; the application must not start on a partly migrated schema.
     """
     db = connect_db()
     if db:
-        create_tables(db)
-        close_db(db)
+        try:
+            create_tables(db)
+            migrate(db)
+            # Write-ahead logging lets long reads (streaming, exports) run while other connections write.
+            db.execute("PRAGMA journal_mode = WAL;")
+        finally:
+            close_db(db)
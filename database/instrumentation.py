@@ -0,0 +1,348 @@
+"""
+instrumentation.py
+
+Shared, instrumented query executor used by every controller.
+Each statement is timed and recorded under its normalized SQL (literals and
+IN lists folded to placeholders), together with the controller method that
+issued it. The recorder keeps per-statement call/error/row counts and latency
+histograms, a log of slow statements, and the EXPLAIN QUERY PLAN of statements
+that fall back to a full table scan. The summary is shown in SettingsView and
+written to QUERY_STATS_PATH when the application exits.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from database.database import connection
+
+QUERY_STATS_PATH = "data/query_stats.txt"
+
+# Statements slower than this (ms) are added to the slow-query log.
+SLOW_QUERY_MS = 50.0
+SLOW_LOG_SIZE = 200
+
+# Upper bounds (ms) of the latency histogram buckets.
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf"))
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+# Numbers, but not the index of a numbered parameter such as ?1.
+_NUMBER = re.compile(r"(?<!\?)\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+# EXPLAIN QUERY PLAN detail of a full table scan, e.g. "SCAN tasks" (not "SCAN tasks USING INDEX ...").
+_FULL_SCAN = re.compile(r"^SCAN \w+$")
+
+@lru_cache(maxsize=2048)
+def normalize_sql(query: str) -> str:
+    """
+    Returns the statement shape used as the statistics key: whitespace collapsed,
+    string and number literals replaced by ?, and IN lists folded to (?...).
+
+    Args:
+        query (str): The SQL statement.
+
+    Returns:
+        str: The normalized statement.
+    """
+    text = _WHITESPACE.sub(" ", query).strip()
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    return _PLACEHOLDER_LIST.sub("(?...)", text)
+
+def _find_caller() -> str:
+    """
+    Returns "Class.method" of the innermost public controller method on the stack.
+    Executors and private helpers are skipped so time is charged to the API callers use.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        name = frame.f_code.co_name
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("controllers.") and not name.startswith(("execute", "_")):
+            owner = frame.f_locals.get("self")
+            prefix = type(owner).__name__ if owner is not None else module.rsplit(".", 1)[-1]
+            return f"{prefix}.{name}"
+        frame = frame.f_back
+    return "<other>"
+
+class StatementStats:
+    """
+    Aggregated measurements of one normalized statement.
+    """
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * len(LATENCY_BUCKETS_MS)
+        self.callers = Counter()
+
+    def add(self, elapsed_ms: float, rows: int, caller: str, error: bool):
+        self.calls += 1
+        self.errors += int(error)
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.callers[caller] += 1
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.histogram[index] += 1
+                break
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Returns the upper bound (ms) of the histogram bucket holding the given fraction of calls.
+        """
+        target = fraction * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram):
+            seen += count
+            if seen >= target:
+                return bound
+        return LATENCY_BUCKETS_MS[-1]
+
+class QueryRecorder:
+    """
+    Thread-safe store of statement statistics, slow statements and full-scan plans.
+    """
+
+    def __init__(self, slow_threshold_ms: float = SLOW_QUERY_MS, capture_plans: bool = True):
+        self.enabled = True
+        self.slow_threshold_ms = slow_threshold_ms
+        self.capture_plans = capture_plans
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears every recorded measurement.
+        """
+        with self._lock:
+            self.statements = {}
+            self.slow_log = deque(maxlen=SLOW_LOG_SIZE)
+            self.full_scans = {}
+            self._explained = set()
+
+    def record(self, query: str, elapsed_ms: float, rows: int = 0, error: bool = False,
+               db=None, params=None):
+        """
+        Records one execution of a statement.
+
+        Args:
+            query (str): The SQL statement.
+            elapsed_ms (float): Execution time in milliseconds.
+            rows (int): Rows fetched or affected.
+            error (bool): True if the statement raised.
+            db (sqlite3.Connection): Connection the statement ran on, used for plan capture.
+            params (tuple): The statement's parameters, used for plan capture.
+        """
+        if not self.enabled:
+            return
+        sql = normalize_sql(query)
+        caller = _find_caller()
+        with self._lock:
+            stats = self.statements.get(sql)
+            if stats is None:
+                stats = self.statements[sql] = StatementStats(sql)
+            stats.add(elapsed_ms, rows, caller, error)
+            if elapsed_ms >= self.slow_threshold_ms:
+                self.slow_log.append((datetime.now().isoformat(timespec="seconds"), round(elapsed_ms, 3), caller, sql))
+            explain = self.capture_plans and db is not None and params is not None and sql not in self._explained
+            if explain:
+                self._explained.add(sql)
+        if explain:
+            self._capture_plan(sql, query, params, db)
+
+    def _capture_plan(self, sql: str, query: str, params, db):
+        """
+        Runs EXPLAIN QUERY PLAN for a statement seen for the first time and keeps the
+        plan if it contains a full table scan.
+        """
+        try:
+            plan = [row[-1] for row in db.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()]
+        except Exception:
+            return
+        if any(_FULL_SCAN.match(detail) for detail in plan):
+            with self._lock:
+                self.full_scans[sql] = plan
+
+    def summary(self) -> list:
+        """
+        Returns per-statement statistics, the most expensive (total time) first.
+
+        Returns:
+            list: StatementStats objects.
+        """
+        with self._lock:
+            return sorted(self.statements.values(), key=lambda s: s.total_ms, reverse=True)
+
+    def by_caller(self) -> list:
+        """
+        Returns (caller, calls, total_ms) tuples, the most expensive first. A statement's
+        time is split between its callers in proportion to their call counts.
+        """
+        totals = {}
+        for stats in self.summary():
+            for caller, calls in stats.callers.items():
+                entry = totals.setdefault(caller, [0, 0.0])
+                entry[0] += calls
+                entry[1] += stats.total_ms * calls / stats.calls
+        return sorted(((c, n, ms) for c, (n, ms) in totals.items()), key=lambda item: item[2], reverse=True)
+
+    def format_summary(self, top: int = 20) -> str:
+        """
+        Formats the statistics as a plain-text report.
+
+        Args:
+            top (int): Number of statements and callers listed.
+
+        Returns:
+            str: The report.
+        """
+        lines = ["== Controller methods by total query time =="]
+        for caller, calls, total_ms in self.by_caller()[:top]:
+            lines.append(f"{total_ms:10.1f} ms {calls:8d} calls  {caller}")
+        lines.append("")
+        lines.append("== Statements by total time ==")
+        for stats in self.summary()[:top]:
+            mean = stats.total_ms / stats.calls if stats.calls else 0.0
+            lines.append(
+                f"{stats.total_ms:10.1f} ms {stats.calls:8d} calls  mean {mean:.3f} ms  "
+                f"p50<={stats.percentile(0.5)} p95<={stats.percentile(0.95)} max {stats.max_ms:.3f} ms  "
+                f"rows {stats.rows}  errors {stats.errors}"
+            )
+            lines.append(f"    {stats.sql}")
+            lines.append(f"    callers: {', '.join(f'{c} ({n})' for c, n in stats.callers.most_common(3))}")
+        lines.append("")
+        lines.append(f"== Slow statements (>= {self.slow_threshold_ms} ms) ==")
+        with self._lock:
+            slow = list(self.slow_log)
+            scans = dict(self.full_scans)
+        for when, elapsed_ms, caller, sql in slow[-top:]:
+            lines.append(f"{when} {elapsed_ms:10.3f} ms  {caller}  {sql}")
+        lines.append("")
+        lines.append("== Full table scans ==")
+        for sql, plan in scans.items():
+            lines.append(sql)
+            lines.extend(f"    {detail}" for detail in plan)
+        return "\n".join(lines)
+
+    def dump(self, path: str = QUERY_STATS_PATH) -> bool:
+        """
+        Writes the report to a file.
+
+        Args:
+            path (str): Destination file.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        if not self.statements:
+            return False
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.format_summary(top=50))
+            return True
+        except OSError as e:
+            print(f"Error writing query statistics: {e}")
+            return False
+
+# Shared by every controller.
+recorder = QueryRecorder()
+
+@contextmanager
+def track(query: str, db=None, params=None, streaming: bool = False):
+    """
+    Times the statement(s) run inside the block and records them under query.
+    The block sets probe["rows"] to the number of rows fetched or affected.
+
+    A streaming block yields its rows to a consumer as they are fetched, so its
+    wall-clock time includes the consumer's work. With streaming=True only the
+    calls made through timed() are counted.
+
+    Args:
+        query (str): The SQL statement.
+        db (sqlite3.Connection): Connection used, for plan capture.
+        params (tuple): Statement parameters, for plan capture.
+        streaming (bool): If True, record the time spent in timed() calls only.
+
+    Yields:
+        dict: The probe.
+    """
+    probe = {"rows": 0}
+    if streaming:
+        probe["elapsed_ms"] = 0.0
+    error = False
+    start = time.perf_counter()
+    try:
+        yield probe
+    except Exception:
+        error = True
+        raise
+    finally:
+        elapsed_ms = probe["elapsed_ms"] if streaming else (time.perf_counter() - start) * 1000
+        recorder.record(query, elapsed_ms, probe["rows"], error, db, params)
+
+def timed(probe: dict, func, *args):
+    """
+    Calls func(*args) (e.g. db.execute or cursor.fetchmany) and adds its duration
+    to a streaming probe of track().
+
+    Args:
+        probe (dict): The probe yielded by track(streaming=True).
+        func (callable): The database call.
+        *args: Arguments passed to func.
+
+    Returns:
+        The result of func.
+    """
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        probe["elapsed_ms"] += (time.perf_counter() - start) * 1000
+
+def run_query(query: str, params: tuple = (), fetch: bool = False):
+    """
+    Executes one statement on connection() and records it.
+    Errors are recorded and re-raised; controllers decide how to report them.
+
+    Args:
+        query (str): The SQL statement.
+        params (tuple): Statement parameters.
+        fetch (bool): If True, fetch and return the result rows.
+
+    Returns:
+        tuple: (rows, last_id) as returned by the controllers' execute_query.
+    """
+    with connection() as db:
+        with track(query, db, params) as probe:
+            cursor = db.execute(query, params)
+            rows = cursor.fetchall() if fetch else None
+            probe["rows"] = len(rows) if fetch else max(cursor.rowcount, 0)
+    return (rows, cursor.lastrowid)
+
+def run_many(query: str, seq_of_params) -> int:
+    """
+    Executes a statement for every parameter tuple on connection() and records it as one call.
+
+    Args:
+        query (str): The SQL statement.
+        seq_of_params (iterable): Parameter tuples; may be a generator.
+
+    Returns:
+        int: Number of affected rows.
+    """
+    with connection() as db:
+        with track(query) as probe:
+            cursor = db.executemany(query, seq_of_params)
+            probe["rows"] = max(cursor.rowcount, 0)
+    return cursor.rowcount
@@ -0,0 +1,321 @@
+"""
+migrations.py
+
+Versioned schema migrations for the SQLite database.
+The schema version is stored in PRAGMA user_version. Each migration step has a
+version number and is applied once, in order, inside its own transaction, so an
+existing data/database.db can evolve without being recreated.
+"""
+
+import sqlite3
+from datetime import date
+from utils.dates import parse_datetime, to_storage_time, to_storage_timestamp
+
+class MigrationError(sqlite3.Error):
+    """
+    Raised when a migration step fails. The database is left at the previous version.
+    """
+
+def _dedupe_settings(db: sqlite3.Connection):
+    """
+    Removes duplicate (user_id, key) settings, keeping the most recent row,
+    so that the unique index can be created on existing databases.
+    """
+    db.execute("""
+        DELETE FROM settings
+         WHERE id NOT IN (SELECT MAX(id) FROM settings GROUP BY user_id, key)
+    """)
+    db.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_user_key ON settings(user_id, key)")
+
+def _create_task_search_index(db: sqlite3.Connection):
+    """
+    Creates the FTS5 full-text index over task titles, task descriptions and
+    subtask titles (one document per task, rowid = task id), the triggers that
+    keep it in sync, and fills it from the existing rows.
+
+    The triggers only fire while search_sync.enabled is 1. Bulk inserts switch it
+    off inside their transaction and index the new rows with one statement,
+    because FTS5 flushes its pending terms at every trigger savepoint.
+    """
+    db.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description, subtasks, tokenize = 'unicode61 remove_diacritics 2'
+        )
+    """)
+    db.execute("CREATE TABLE IF NOT EXISTS search_sync (enabled INTEGER NOT NULL)")
+    db.execute("DELETE FROM search_sync")
+    db.execute("INSERT INTO search_sync (enabled) VALUES (1)")
+    enabled = "WHEN (SELECT enabled FROM search_sync) = 1"
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks {enabled} BEGIN
+            INSERT INTO tasks_fts(rowid, title, description, subtasks)
+            VALUES (new.id, new.title, new.description, '');
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks {enabled} BEGIN
+            UPDATE tasks_fts SET title = new.title, description = new.description WHERE rowid = new.id;
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks {enabled} BEGIN
+            DELETE FROM tasks_fts WHERE rowid = old.id;
+        END
+    """)
+    refresh_subtasks = """
+        UPDATE tasks_fts
+           SET subtasks = (SELECT IFNULL(group_concat(s.title, ' '), '') FROM subtasks s WHERE s.task_id = tasks_fts.rowid)
+         WHERE rowid IN ({ids});
+    """
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS subtasks_fts_insert AFTER INSERT ON subtasks {enabled} BEGIN
+            {refresh_subtasks.format(ids="new.task_id")}
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS subtasks_fts_update AFTER UPDATE OF title, task_id ON subtasks {enabled} BEGIN
+            {refresh_subtasks.format(ids="old.task_id, new.task_id")}
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS subtasks_fts_delete AFTER DELETE ON subtasks {enabled} BEGIN
+            {refresh_subtasks.format(ids="old.task_id")}
+        END
+    """)
+    db.execute("DELETE FROM tasks_fts")
+    db.execute("""
+        INSERT INTO tasks_fts(rowid, title, description, subtasks)
+        SELECT t.id, t.title, t.description,
+               (SELECT IFNULL(group_concat(s.title, ' '), '') FROM subtasks s WHERE s.task_id = t.id)
+          FROM tasks t
+    """)
+
+# Merges counter deltas into the stats table.
+_STATS_UPSERT = "ON CONFLICT(dimension, key) DO UPDATE SET count = count + excluded.count"
+
+def _task_counters(row: str, sign: str) -> str:
+    """
+    Returns the VALUES rows adding (sign "+") or removing (sign "-") the counters of
+    the task row named row ("new" or "old") in a trigger.
+    """
+    return f"""
+        ('tasks', 'total', {sign}1),
+        ('tasks', 'done', {sign}(IFNULL({row}.done, 0) <> 0)),
+        ('status', IFNULL({row}.status, ''), {sign}1),
+        ('priority', IFNULL({row}.priority, ''), {sign}1),
+        ('project', IFNULL({row}.project_id, ''), {sign}1)
+    """
+
+def _create_stats_counters(db: sqlite3.Connection):
+    """
+    Creates the stats table of aggregate counters, the triggers that keep it in
+    sync with tasks and projects, and fills it from the existing rows.
+
+    Each counter is a (dimension, key) pair: ('tasks', 'total'), ('tasks', 'done'),
+    ('projects', 'total'), and one row per status, priority and project_id value.
+    NULL keys are stored as ''. Every trigger runs a single UPSERT statement.
+    """
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS stats (
+            dimension TEXT NOT NULL,
+            key TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, key)
+        ) WITHOUT ROWID
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_stats_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO stats (dimension, key, count) VALUES {_task_counters("new", "+")} {_STATS_UPSERT};
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_stats_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO stats (dimension, key, count) VALUES {_task_counters("old", "-")} {_STATS_UPSERT};
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_stats_update AFTER UPDATE OF done, status, priority, project_id ON tasks
+        WHEN old.done IS NOT new.done OR old.status IS NOT new.status
+          OR old.priority IS NOT new.priority OR old.project_id IS NOT new.project_id
+        BEGIN
+            INSERT INTO stats (dimension, key, count)
+            VALUES {_task_counters("old", "-")}, {_task_counters("new", "+")} {_STATS_UPSERT};
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS projects_stats_insert AFTER INSERT ON projects BEGIN
+            INSERT INTO stats (dimension, key, count) VALUES ('projects', 'total', 1) {_STATS_UPSERT};
+        END
+    """)
+    db.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS projects_stats_delete AFTER DELETE ON projects BEGIN
+            INSERT INTO stats (dimension, key, count) VALUES ('projects', 'total', -1) {_STATS_UPSERT};
+        END
+    """)
+    db.execute("DELETE FROM stats")
+    db.execute("""
+        INSERT INTO stats (dimension, key, count)
+        SELECT 'tasks', 'total', COUNT(*) FROM tasks
+        UNION ALL SELECT 'tasks', 'done', COUNT(*) FROM tasks WHERE IFNULL(done, 0) <> 0
+        UNION ALL SELECT 'projects', 'total', COUNT(*) FROM projects
+        UNION ALL SELECT 'status', IFNULL(status, ''), COUNT(*) FROM tasks GROUP BY 2
+        UNION ALL SELECT 'priority', IFNULL(priority, ''), COUNT(*) FROM tasks GROUP BY 2
+        UNION ALL SELECT 'project', IFNULL(project_id, ''), COUNT(*) FROM tasks GROUP BY 2
+    """)
+
+def _gate_task_counters(db: sqlite3.Connection):
+    """
+    Makes the task insert counter trigger fire only while stats_sync.enabled is 1,
+    like the search index triggers with search_sync. Imports switch both off inside
+    each batch transaction and count the batch's rows with one statement.
+    """
+    db.execute("CREATE TABLE IF NOT EXISTS stats_sync (enabled INTEGER NOT NULL)")
+    db.execute("DELETE FROM stats_sync")
+    db.execute("INSERT INTO stats_sync (enabled) VALUES (1)")
+    db.execute("DROP TRIGGER IF EXISTS tasks_stats_insert")
+    db.execute(f"""
+        CREATE TRIGGER tasks_stats_insert AFTER INSERT ON tasks
+        WHEN (SELECT enabled FROM stats_sync) = 1
+        BEGIN
+            INSERT INTO stats (dimension, key, count) VALUES {_task_counters("new", "+")} {_STATS_UPSERT};
+        END
+    """)
+
+def _canonical_timestamp(value):
+    """
+    Returns the canonical form of a stored timestamp, or None if it cannot be parsed.
+    """
+    try:
+        return to_storage_timestamp(value)
+    except ValueError:
+        return None
+
+def _normalize_dates(db: sqlite3.Connection):
+    """
+    Rewrites task due dates, times and the created_at/updated_at timestamps of
+    tasks and projects in the canonical forms of utils.dates.
+
+    Due dates may be ISO dates, ISO date-times or the former display format
+    'dd/mm - HH:MM', whose year is taken from the task's updated_at (or created_at).
+    A time found in the due date fills an empty time column. Values that cannot
+    be parsed are set to NULL.
+    """
+    updates = []
+    rows = db.execute("SELECT id, due_date, time, created_at, updated_at FROM tasks")
+    for id_, due_date, time_value, created_at, updated_at in rows:
+        created = _canonical_timestamp(created_at)
+        updated = _canonical_timestamp(updated_at)
+        reference = updated or created
+        year = int(reference[:4]) if reference else date.today().year
+        new_date, due_time = None, None
+        if due_date:
+            try:
+                day, due_time = parse_datetime(due_date, default_year=year)
+                new_date = day.isoformat()
+            except ValueError:
+                pass
+        try:
+            new_time = to_storage_time(time_value) if time_value else None
+        except ValueError:
+            new_time = None
+        if new_time is None and due_time is not None:
+            new_time = due_time.strftime("%H:%M")
+        if (new_date, new_time, created, updated) != (due_date, time_value, created_at, updated_at):
+            updates.append((new_date, new_time, created, updated, id_))
+    db.executemany(
+        "UPDATE tasks SET due_date = ?, time = ?, created_at = ?, updated_at = ? WHERE id = ?",
+        updates
+    )
+    projects = db.execute("SELECT id, created_at, updated_at FROM projects").fetchall()
+    db.executemany(
+        "UPDATE projects SET created_at = ?, updated_at = ? WHERE id = ?",
+        [(_canonical_timestamp(c), _canonical_timestamp(u), id_) for id_, c, u in projects]
+    )
+
+# Ordered list of (version, description, step). A step is either a list of SQL
+# statements or a callable receiving the open connection.
+MIGRATIONS = [
+    (1, "Index task project, task due date and subtask parent lookups", [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks(project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date)",
+        "CREATE INDEX IF NOT EXISTS idx_subtasks_task_id ON subtasks(task_id)",
+    ]),
+    (2, "Make settings unique per (user_id, key)", _dedupe_settings),
+    (3, "Index task sort keys used by keyset pagination", [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks(updated_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks(title)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_project_due ON tasks(project_id, due_date)",
+    ]),
+    (4, "Store status/priority in lowercase and index them for filtering and sorting", [
+        "UPDATE tasks SET status = LOWER(TRIM(status)), priority = LOWER(TRIM(priority))",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority)",
+    ]),
+    (5, "Add the FTS5 task search index", _create_task_search_index),
+    (6, "Add trigger-maintained dashboard counters", _create_stats_counters),
+    (7, "Index the due dates of open tasks for overdue queries", [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_open_due ON tasks(due_date) WHERE done = 0",
+    ]),
+    (8, "Store due dates, times and timestamps in canonical sortable form", _normalize_dates),
+    (9, "Record the content hash of imported tasks for duplicate detection", [
+        "ALTER TABLE tasks ADD COLUMN import_hash TEXT",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_import_hash ON tasks(import_hash) WHERE import_hash IS NOT NULL",
+    ]),
+    (10, "Let bulk imports switch off the task insert counter trigger", _gate_task_counters),
+    (11, "Cover the planned durations of open tasks in their due date index", [
+        "DROP INDEX IF EXISTS idx_tasks_open_due",
+        "CREATE INDEX idx_tasks_open_due ON tasks(due_date, duration) WHERE done = 0",
+    ]),
+    (12, "Index project names for sorting tasks by project", [
+        "CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name)",
+    ]),
+]
+
+def get_schema_version(db: sqlite3.Connection) -> int:
+    """
+    Returns the schema version recorded in the database.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Returns:
+        int: The current PRAGMA user_version.
+    """
+    return db.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(db: sqlite3.Connection) -> int:
+    """
+    Applies every migration whose version is greater than the current schema version.
+    Each step runs in its own transaction together with the user_version update,
+    so a failing step leaves the database at the previous version.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Returns:
+        int: The schema version after migrating.
+
+    Raises:
+        MigrationError: If a step fails; the later steps are not applied.
+    """
+    current = get_schema_version(db)
+    for version, description, step in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            db.execute("BEGIN")
+            if callable(step):
+                step(db)
+            else:
+                for statement in step:
+                    db.execute(statement)
+            # PRAGMA does not accept bound parameters; version is an int from MIGRATIONS.
+            db.execute(f"PRAGMA user_version = {int(version)}")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Migration {version} ({description}) failed: {e}")
+            raise MigrationError(f"Migration {version} ({description}) failed: {e}") from e
+        current = version
+    return current
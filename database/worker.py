@@ -0,0 +1,160 @@
+"""
+worker.py
+
+Background database worker. A single dedicated thread owns a pinned database
+connection and executes submitted jobs one at a time, so long queries, exports
+and deletes never block the Tk main loop. Job results are delivered to
+completion callbacks on the Tk thread: the worker queues them and the main
+loop drains that queue periodically with after().
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from database.database import pinned_connection
+
+# Interval (ms) at which the Tk main loop checks for completed jobs.
+POLL_INTERVAL = 30
+
+class DatabaseWorker:
+    """
+    Runs database jobs on a background thread and dispatches their callbacks on the Tk thread.
+    """
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._callbacks = queue.Queue()
+        self._thread = None
+        self._root = None
+        self._poll_job = None
+
+    def start(self):
+        """
+        Starts the worker thread if it is not already running.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="database-worker", daemon=True)
+            self._thread.start()
+
+    def attach(self, root, poll_interval: int = POLL_INTERVAL):
+        """
+        Attaches the worker to the Tk root window whose main loop runs the callbacks.
+
+        Args:
+            root: The Tk root window.
+            poll_interval (int): Interval in milliseconds between callback queue checks.
+        """
+        self._root = root
+        self._poll_interval = poll_interval
+        self.start()
+        if self._poll_job is None:
+            self._poll()
+
+    def submit(self, func, *args, callback=None, errback=None, **kwargs) -> Future:
+        """
+        Queues func(*args, **kwargs) for execution on the worker thread.
+
+        Args:
+            func (callable): The job, typically a controller method.
+            callback (callable): Called on the Tk thread with the job's result.
+            errback (callable): Called on the Tk thread with the exception if the job raised.
+            *args, **kwargs: Arguments passed to func.
+
+        Returns:
+            Future: Completed with the job's result or exception.
+        """
+        future = Future()
+        self.start()
+        self._jobs.put((future, func, args, kwargs, callback, errback))
+        return future
+
+    def call_soon(self, func, *args):
+        """
+        Schedules func(*args) on the Tk thread. Safe to call from any thread.
+
+        Args:
+            func (callable): The function to call.
+            *args: Arguments passed to func.
+        """
+        self._callbacks.put((func, args))
+
+    def in_worker_thread(self) -> bool:
+        """
+        Returns True when called from the worker thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def _run(self):
+        """
+        Worker thread loop: executes jobs in submission order on the pinned connection.
+        """
+        with pinned_connection():
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                future, func, args, kwargs, callback, errback = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    future.set_exception(e)
+                    if errback is not None:
+                        self.call_soon(errback, e)
+                    else:
+                        print(f"[DatabaseWorker] Error in {getattr(func, '__name__', func)}: {e}")
+                else:
+                    future.set_result(result)
+                    if callback is not None:
+                        self.call_soon(callback, result)
+
+    def _poll(self):
+        """
+        Runs the pending callbacks on the Tk thread and reschedules itself.
+        """
+        while True:
+            try:
+                func, args = self._callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"[DatabaseWorker] Error in callback {getattr(func, '__name__', func)}: {e}")
+        self._poll_job = self._root.after(self._poll_interval, self._poll)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops the worker after the queued jobs have run and stops polling.
+
+        Args:
+            wait (bool): If True, block until the worker thread has exited.
+        """
+        if self._poll_job is not None and self._root is not None:
+            try:
+                self._root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+            self._poll_job = None
+        if self._thread is not None and self._thread.is_alive():
+            self._jobs.put(None)
+            if wait:
+                self._thread.join()
+        self._thread = None
+
+_worker = None
+_worker_lock = threading.Lock()
+
+def get_worker() -> DatabaseWorker:
+    """
+    Returns the database worker shared by all views, creating it on first use.
+
+    Returns:
+        DatabaseWorker: The shared worker.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = DatabaseWorker()
+        return _worker
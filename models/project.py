@@ -1,7 +1,7 @@
 """
 project.py
 
-Defines the Project model using a dataclass. This model represents a project
+Defines the Project model using a slotted dataclass. This model represents a project
 in the application and includes fields such as id, name, description, creation
 and update timestamps, as well as optional fields for color, icon, and ordering.
 """
@@ -9,7 +9,7 @@ and update timestamps, as well as optional fields for color, icon, and ordering.
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: Optional[int] = None              # Unique project identifier.
     name: str = ""                        # Name of the project.
@@ -1,14 +1,14 @@
 """
 settings.py
 
-Defines the Setting model using a dataclass. This model represents a user-specific
+Defines the Setting model using a slotted dataclass. This model represents a user-specific
 setting in the application, storing key-value pairs along with creation and update timestamps.
 """
 
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Setting:
     id: Optional[int] = None              # Unique identifier for the setting.
     user_id: int = 0                      # Associated user's identifier.
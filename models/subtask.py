@@ -1,7 +1,7 @@
 """
 subtask.py
 
-Defines the Subtask model using a dataclass. A Subtask represents a smaller unit of work,
+Defines the Subtask model using a slotted dataclass. A Subtask represents a smaller unit of work,
 which is associated with a main task. It includes fields for id, parent task identifier,
 title, description, and completion status.
 """
@@ -9,7 +9,7 @@ title, description, and completion status.
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Subtask:
     id: Optional[int] = None          # Unique identifier of the subtask.
     task_id: int = 0                  # Identifier of the parent task.
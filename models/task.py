@@ -1,16 +1,18 @@
 """
 task.py
 
-Defines the Task model using a dataclass. This model represents a task in the application,
+Defines the Task model using a slotted dataclass. This model represents a task in the application,
 including fields such as id, title, description, timestamps (creation, update, due date),
 time, duration, priority, status, completion flag, associated project, and a list of subtasks.
+Model instances use __slots__ instead of a per-instance __dict__, which keeps large
+numbers of loaded tasks compact; serialize them with dataclasses.asdict().
 """
 
 from dataclasses import dataclass, field
 from typing import List, Optional
 from models.subtask import Subtask
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: Optional[int] = None               # Unique identifier of the task.
     title: str = ""                        # Title of the task.
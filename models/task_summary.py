@@ -0,0 +1,24 @@
+"""
+task_summary.py
+
+Defines TaskSummary, the read model of a row of the task table. It holds only the
+columns the table displays, the name of the task's project and the number of done
+and total subtasks, as a named tuple: it is much smaller and cheaper to build than
+a Task with its description and subtasks. Edits go through the full Task.
+"""
+
+from collections import namedtuple
+
+TaskSummary = namedtuple("TaskSummary", [
+    "id",              # Unique identifier of the task.
+    "title",           # Title of the task.
+    "project_id",      # Associated project's identifier.
+    "project",         # Name of the associated project, or None.
+    "status",          # Current status (e.g., "not started", "in progress", "completed").
+    "priority",        # Priority level (e.g., "low", "medium", "high").
+    "due_date",        # Due date as 'YYYY-MM-DD'.
+    "time",            # Due time as 'HH:MM'.
+    "updated_at",      # ISO timestamp of the last update.
+    "subtasks_done",   # Number of completed subtasks.
+    "subtasks_total",  # Number of subtasks.
+])
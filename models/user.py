@@ -1,7 +1,7 @@
 """
 user.py
 
-Defines the User model using a dataclass. This model represents a user in the application
+Defines the User model using a slotted dataclass. This model represents a user in the application
 and includes fields for user identification, username, email address, password (hash),
 display theme, and timestamps such as creation, update, and last login.
 """
@@ -9,7 +9,7 @@ display theme, and timestamps such as creation, update, and last login.
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[int] = None           # Unique user identifier.
     username: str = ""                 # Username.
@@ -0,0 +1,169 @@
+"""
+dates.py
+
+Storage contract for dates and times, and the conversions used at the UI boundary.
+Values are stored as fixed-width ISO text, which sorts chronologically, so date
+sorting and range queries are plain index range scans:
+  - tasks.due_date: 'YYYY-MM-DD'
+  - tasks.time: 'HH:MM'
+  - created_at / updated_at: 'YYYY-MM-DDTHH:MM:SS.ffffff'
+Controllers normalize values with the to_storage_* functions before writing;
+views only parse user input and format stored values for display.
+"""
+
+from datetime import date, datetime, time
+
+STORAGE_DATE_FORMAT = "%Y-%m-%d"
+STORAGE_TIME_FORMAT = "%H:%M"
+# Display format of due dates and timestamps in the task table.
+DISPLAY_FORMAT = "%d/%m - %H:%M"
+DISPLAY_DATE_FORMAT = "%d/%m"
+
+def now_timestamp() -> str:
+    """
+    Returns the current local time as a canonical timestamp.
+
+    Returns:
+        str: 'YYYY-MM-DDTHH:MM:SS.ffffff'
+    """
+    return datetime.now().isoformat(timespec="microseconds")
+
+def parse_datetime(value, default_year: int = None):
+    """
+    Parses a date or date-time entered by the user or found in an old database.
+    Accepted: date/datetime objects, ISO dates and date-times, 'dd/mm/yyyy' and the
+    former display format 'dd/mm - HH:MM' (which has no year; default_year is used).
+
+    Args:
+        value: The value to parse.
+        default_year (int): Year for values without one; defaults to the current year.
+
+    Returns:
+        tuple: (date, time or None).
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if isinstance(value, datetime):
+        return value.date(), value.time().replace(second=0, microsecond=0)
+    if isinstance(value, date):
+        return value, None
+    text = str(value).strip()
+    try:
+        if len(text) == 10:
+            return date.fromisoformat(text), None
+        parsed = datetime.fromisoformat(text)
+        return parsed.date(), parsed.time().replace(second=0, microsecond=0)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(text, "%d/%m/%Y").date(), None
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.strptime(text, DISPLAY_FORMAT)
+    except ValueError:
+        raise ValueError(f"Unrecognized date: {value!r}") from None
+    year = default_year or date.today().year
+    return parsed.date().replace(year=year), parsed.time()
+
+def to_storage_date(value):
+    """
+    Normalizes a due date to 'YYYY-MM-DD'.
+
+    Args:
+        value: A date, datetime or date string; empty values mean no due date.
+
+    Returns:
+        str or None: The canonical date.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return parse_datetime(value)[0].strftime(STORAGE_DATE_FORMAT)
+
+def to_storage_time(value):
+    """
+    Normalizes a time of day to 'HH:MM'.
+
+    Args:
+        value: A time, datetime or string such as '9:05' or '09:05:00'; empty values mean no time.
+
+    Returns:
+        str or None: The canonical time.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, datetime):
+        value = value.time()
+    if not isinstance(value, time):
+        parts = str(value).strip().split(":")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Invalid time: {value!r}")
+        value = time(int(parts[0]), int(parts[1]))
+    return value.strftime(STORAGE_TIME_FORMAT)
+
+def to_storage_timestamp(value):
+    """
+    Normalizes an ISO timestamp to 'YYYY-MM-DDTHH:MM:SS.ffffff'.
+
+    Args:
+        value (str or datetime): The timestamp.
+
+    Returns:
+        str or None: The canonical timestamp.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).strip())
+    return value.isoformat(timespec="microseconds")
+
+def format_due(due_date, due_time=None, default_today: bool = False) -> str:
+    """
+    Formats a stored due date and time for display.
+
+    Args:
+        due_date (str): Stored 'YYYY-MM-DD' date, or None.
+        due_time (str): Stored 'HH:MM' time, or None.
+        default_today (bool): If True and no date is set, show today at 00:00.
+
+    Returns:
+        str: e.g. '17/10 - 14:30', '17/10', or '' when there is nothing to show.
+    """
+    if not due_date:
+        if not default_today:
+            return ""
+        return datetime.combine(date.today(), time()).strftime(DISPLAY_FORMAT)
+    try:
+        day = date.fromisoformat(due_date)
+    except ValueError:
+        return due_date
+    if not due_time:
+        return day.strftime(DISPLAY_DATE_FORMAT)
+    return f"{day.strftime(DISPLAY_DATE_FORMAT)} - {due_time}"
+
+def format_timestamp(value) -> str:
+    """
+    Formats a stored timestamp for display.
+
+    Args:
+        value (str): Stored ISO timestamp, or None.
+
+    Returns:
+        str: e.g. '17/10 - 14:30', or '' when not set.
+    """
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(value).strftime(DISPLAY_FORMAT)
+    except ValueError:
+        return value
@@ -2,14 +2,23 @@
 calendar_view.py
 
 CalendarView displays a calendar and lists tasks corresponding to the selected date.
+Days with tasks due are marked with calendar events, loaded with one grouped
+query per displayed month; selecting a day queries only that day.
 Inherits from BaseView to benefit from consistent theme and translation management.
 """
 
+import calendar as calendar_module
+from datetime import date
 import customtkinter as ctk
 from tkcalendar import Calendar
 from controllers.task_controller import TaskController
+from controllers import events
+from database.worker import get_worker
 from views.base_view import BaseView
 
+# Calendar event tag used to mark days with tasks due.
+BUSY_TAG = "busy"
+
 class CalendarView(BaseView):
     def __init__(self, master, *args, **kwargs):
         """
@@ -21,7 +30,12 @@ class CalendarView(BaseView):
         """
         super().__init__(master, *args, **kwargs)
         self.controller = TaskController()
+        self.worker = get_worker()
         self._create_widgets()
+        for event_type in (events.TASK_CREATED, events.TASK_UPDATED, events.TASK_DELETED, events.PROJECT_DELETED,
+                           events.DATABASE_RESTORED):
+            events.bus.subscribe(event_type, self._on_tasks_changed)
+        self._mark_busy_days()
 
     def _create_widgets(self):
         """
@@ -37,7 +51,10 @@ class CalendarView(BaseView):
 
         # Calendar widget for date selection.
         self.calendar = Calendar(self, selectmode="day", date_pattern="yyyy-mm-dd")
+        self.calendar.tag_config(BUSY_TAG, background="#007BFF", foreground="white")
         self.calendar.pack(pady=10)
+        self.calendar.bind("<<CalendarMonthChanged>>", lambda e: self._mark_busy_days())
+        self.calendar.bind("<<CalendarSelected>>", lambda e: self._show_tasks())
 
         # Button to show tasks.
         show_tasks_text = self.translations.t("show_tasks") if hasattr(self.translations, "t") else "Show Tasks"
@@ -52,30 +69,91 @@ class CalendarView(BaseView):
         self.tasks_textbox = ctk.CTkTextbox(self, width=600, height=300)
         self.tasks_textbox.pack(pady=10)
 
+    def _mark_busy_days(self):
+        """
+        Requests the number of tasks due on each day of the displayed month;
+        the days are marked by _show_busy_days when the counts arrive.
+        """
+        month, year = self.calendar.get_displayed_month()
+        first = date(year, month, 1)
+        last = date(year, month, calendar_module.monthrange(year, month)[1])
+        self.worker.submit(
+            self.controller.count_tasks_by_day, first, last,
+            callback=lambda counts: self._show_busy_days((month, year), counts)
+        )
+
+    def _show_busy_days(self, displayed_month, counts):
+        """
+        Replaces the busy-day marks with the counts loaded by _mark_busy_days.
+
+        Args:
+            displayed_month (tuple): (month, year) the counts were requested for.
+            counts (dict): Mapping of 'YYYY-MM-DD' to a task count.
+        """
+        if not self.winfo_exists() or self.calendar.get_displayed_month() != displayed_month:
+            return
+        self.calendar.calevent_remove(tag=BUSY_TAG)
+        for day, count in counts.items():
+            label = f"{count} task" if count == 1 else f"{count} tasks"
+            self.calendar.calevent_create(date.fromisoformat(day), label, BUSY_TAG)
+
     def _show_tasks(self):
         """
-        Retrieves and displays tasks corresponding to the selected date.
+        Requests the tasks due on the selected date; they are displayed by _display_tasks.
         """
-        self.tasks_textbox.delete("1.0", "end")
         selected_date = self.calendar.get_date()
-        try:
-            all_tasks = self.controller.list_tasks()
-            tasks_for_date = [t for t in all_tasks if t.due_date == selected_date]
-            if tasks_for_date:
-                for t in tasks_for_date:
-                    self.tasks_textbox.insert("end", f"{t}\n")
-                    for sub in t.subtasks:
-                        self.tasks_textbox.insert("end", f"   -> {sub}\n")
-                    self.tasks_textbox.insert("end", "\n")
-            else:
-                msg = self.translations.t("no_tasks_for_date") if hasattr(self.translations, "t") else "No tasks for this date."
-                self.tasks_textbox.insert("end", msg)
-        except Exception as e:
-            self.tasks_textbox.insert("end", f"Error: {e}")
+        self.worker.submit(
+            self.controller.list_tasks_on, selected_date,
+            callback=lambda tasks: self._display_tasks(selected_date, tasks),
+            errback=self._display_error
+        )
+
+    def _display_tasks(self, selected_date, tasks):
+        """
+        Displays the tasks (and their subtasks) due on the selected date.
+
+        Args:
+            selected_date (str): The date the tasks were loaded for.
+            tasks (list): Task objects due that day.
+        """
+        if not self.winfo_exists() or self.calendar.get_date() != selected_date:
+            return
+        self.tasks_textbox.delete("1.0", "end")
+        if tasks:
+            for t in tasks:
+                self.tasks_textbox.insert("end", f"{t}\n")
+                for sub in t.subtasks:
+                    self.tasks_textbox.insert("end", f"   -> {sub}\n")
+                self.tasks_textbox.insert("end", "\n")
+        else:
+            msg = self.translations.t("no_tasks_for_date") if hasattr(self.translations, "t") else "No tasks for this date."
+            self.tasks_textbox.insert("end", msg)
+
+    def _display_error(self, error):
+        """
+        Shows an error raised while loading the tasks of a day.
+
+        Args:
+            error (Exception): The error.
+        """
+        if self.winfo_exists():
+            self.tasks_textbox.delete("1.0", "end")
+            self.tasks_textbox.insert("end", f"Error: {error}")
+
+    def _on_tasks_changed(self, event):
+        """
+        Updates the busy-day marks and the displayed day after a task change.
+
+        Args:
+            event (ChangeEvent): The change event.
+        """
+        if self.winfo_exists():
+            self.refresh()
 
     def refresh(self) -> None:
         """
-        Refresh the calendar view content.
-        Simply re-run the _show_tasks method to update displayed tasks.
+        Refresh the calendar view content: the busy-day marks of the displayed
+        month and the tasks of the selected date.
         """
+        self._mark_busy_days()
         self._show_tasks()
@@ -6,15 +6,28 @@ DashboardView shows a summary of tasks and projects:
   - Completed tasks
   - Overdue tasks
   - Total projects
+  - Workload of open tasks by due date and planned time
+The counts are recomputed once a burst of task or project change events has
+settled, with at most one computation queued on the database worker at a time,
+so bulk edits do not queue a computation per change. Every figure comes from
+the stats counters or an aggregate over the index of open tasks, so a refresh
+never scans the tasks table.
 It inherits from BaseView for consistent styling and translation.
 """
 
+import time
 import customtkinter as ctk
 from controllers.task_controller import TaskController
-from controllers.project_controller import ProjectController
+from database.worker import get_worker
+from controllers import events
 from views.base_view import BaseView
 import theme
 
+# Quiet period (ms) after the last change event before the dashboard refreshes.
+REFRESH_DELAY = 300
+# Longest time (ms) a stream of change events can postpone the refresh.
+REFRESH_MAX_DELAY = 2000
+
 class DashboardView(BaseView):
     def __init__(self, master, *args, **kwargs):
         """
@@ -26,8 +39,17 @@ class DashboardView(BaseView):
         """
         super().__init__(master, *args, **kwargs)
         self.controller = TaskController()
-        self.project_controller = ProjectController()
+        self.worker = get_worker()
+        self.refresh_job = None
+        # time.monotonic() of the first change event waiting for the scheduled refresh.
+        self.first_change = None
+        # True while _compute_counts is queued or running; refresh_pending asks for another run after it.
+        self.computing = False
+        self.refresh_pending = False
         self._create_widgets()
+        for event_type in (events.TASK_CREATED, events.TASK_UPDATED, events.TASK_DELETED,
+                           events.PROJECT_CREATED, events.PROJECT_DELETED, events.DATABASE_RESTORED):
+            events.bus.subscribe(event_type, self._on_data_changed)
         self.refresh()
 
     def _create_widgets(self):
@@ -69,16 +91,97 @@ class DashboardView(BaseView):
         )
         self.total_projects_label.pack(pady=5)
 
+        self.workload_label = ctk.CTkLabel(self, text="", font=("Roboto", 14), justify="left")
+        self.workload_label.pack(pady=(15, 5))
+
+    def _on_data_changed(self, event) -> None:
+        """
+        Schedules a refresh REFRESH_DELAY ms after the last of a burst of change events.
+        Each event postpones it again, up to REFRESH_MAX_DELAY ms after the first one.
+
+        Args:
+            event (ChangeEvent): The change event.
+        """
+        if not self.winfo_exists():
+            return
+        now = time.monotonic()
+        if self.refresh_job is not None:
+            if (now - self.first_change) * 1000 >= REFRESH_MAX_DELAY:
+                return
+            self.after_cancel(self.refresh_job)
+        else:
+            self.first_change = now
+        self.refresh_job = self.after(REFRESH_DELAY, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        """
+        Runs the refresh scheduled by _on_data_changed.
+        """
+        self.refresh_job = None
+        self.refresh()
+
     def refresh(self) -> None:
         """
-        Refreshes the dashboard data by recalculating task and project counts.
+        Requests the task and project counters from the database worker;
+        the labels are updated by _show_counts when they arrive. While a request
+        is in flight, a single follow-up request is made once it completes.
+        """
+        if self.computing:
+            self.refresh_pending = True
+            return
+        self.computing = True
+        self.worker.submit(self._compute_counts, callback=self._show_counts, errback=self._on_counts_failed)
+
+    def _computation_done(self) -> None:
+        """
+        Ends the request made by refresh() and makes the follow-up request, if any.
+        """
+        self.computing = False
+        if self.refresh_pending and self.winfo_exists():
+            self.refresh_pending = False
+            self.refresh()
+
+    def _on_counts_failed(self, error) -> None:
+        """
+        Reports an error raised by _compute_counts.
+
+        Args:
+            error (Exception): The exception.
+        """
+        print(f"[DashboardView] Error computing counts: {error}")
+        self._computation_done()
+
+    def _compute_counts(self) -> tuple:
+        """
+        Reads task and project counts from the stats counters, and the (cached)
+        overdue count and workload of open tasks from the index of open tasks.
+        Runs on the worker thread.
+
+        Returns:
+            tuple: (total, done, overdue, total_projects, workload); workload is the
+                   dict returned by TaskController.get_workload().
+        """
+        stats = self.controller.get_dashboard_stats()
+        workload = self.controller.get_workload()
+        return stats["total"], stats["done"], workload["overdue"], stats["projects"], workload
+
+    def _show_counts(self, counts: tuple) -> None:
+        """
+        Displays the counts computed by _compute_counts.
+
+        Args:
+            counts (tuple): (total, done, overdue, total_projects, workload)
         """
-        tasks = self.controller.list_tasks()
-        total = len(tasks)
-        done = len([t for t in tasks if t.done])
-        overdue = 0  # Add overdue logic here as needed.
-        projects = self.project_controller.list_projects()
-        total_projects = len(projects)
+        self._computation_done()
+        if not self.winfo_exists():
+            return
+        total, done, overdue, total_projects, workload = counts
+        hours, minutes = divmod(workload["minutes"], 60)
+        self.workload_label.configure(text=(
+            f"Due today: {workload['today']}    This week: {workload['this_week']}    "
+            f"Later: {workload['later']}    No due date: {workload['no_date']}\n"
+            f"Planned time (open tasks): {hours}h{minutes:02d}"
+        ))
         self.total_tasks_label.configure(text=f"{self.translations.t('total_tasks') if hasattr(self.translations, 't') else 'Total Tasks:'} {total}")
         self.done_tasks_label.configure(text=f"{self.translations.t('completed_tasks') if hasattr(self.translations, 't') else 'Completed Tasks:'} {done}")
         self.overdue_tasks_label.configure(text=f"{self.translations.t('overdue_tasks') if hasattr(self.translations, 't') else 'Overdue Tasks:'} {overdue}")
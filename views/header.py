@@ -6,12 +6,16 @@ It is divided into three sections:
   - Left: Menu toggle and search field.
   - Center: View title.
   - Right: Share and User actions.
-Includes callbacks for menu, share, and login events.
+Includes callbacks for menu, share, login and search events. Search results are
+shown in a list below the header while the user types.
 """
 
 import customtkinter as ctk
 from theme import get_font, load_icon, current_mode
 
+# Delay (ms) after the last keystroke before a search is run.
+SEARCH_DELAY = 200
+
 class Header(ctk.CTkFrame):
     def __init__(
         self,
@@ -23,6 +27,8 @@ class Header(ctk.CTkFrame):
         user_logged_in=False,
         user_initials="??",
         translations=None,
+        search_callback=None,
+        search_select_callback=None,
         *args,
         **kwargs
     ):
@@ -38,6 +44,8 @@ class Header(ctk.CTkFrame):
             user_logged_in (bool): Whether a user is logged in.
             user_initials (str): Initials to display when a user is logged in.
             translations: Translation manager for i18n.
+            search_callback (callable): Called with the search text; should call show_search_results(results, text).
+            search_select_callback (callable): Called with a task ID when a search result is clicked.
             *args, **kwargs: Additional arguments.
         """
         self.translations = translations
@@ -49,7 +57,12 @@ class Header(ctk.CTkFrame):
         self.login_callback = login_callback
         self.user_logged_in = user_logged_in
         self.user_initials = user_initials
+        self.search_callback = search_callback
+        self.search_select_callback = search_select_callback
         self.dropdown_visible = False
+        self._search_job = None
+        # Text of the latest search request, from schedule_search().
+        self._search_text = None
 
         # Load icons based on current mode.
         dark_mode = (current_mode == "dark")
@@ -78,6 +91,8 @@ class Header(ctk.CTkFrame):
 
         # Dropdown frame for user actions.
         self.dropdown_frame = ctk.CTkFrame(self)
+        # Frame listing live search results.
+        self.search_results_frame = ctk.CTkFrame(self)
         self.set_sidebar_expanded(True)
 
     def _create_left_frame(self):
@@ -108,6 +123,8 @@ class Header(ctk.CTkFrame):
             width=120
         )
         self.search_entry.grid(row=0, column=1, padx=(0, 5))
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_search(self.search_entry.get()))
+        self.search_entry.bind("<Escape>", lambda e: self.hide_search_results())
 
     def _create_center_frame(self, title):
         """
@@ -213,6 +230,79 @@ class Header(ctk.CTkFrame):
             logout_button.pack(padx=5, pady=5)
             self.dropdown_visible = True
 
+    def schedule_search(self, text):
+        """
+        Runs the search callback once typing pauses for SEARCH_DELAY milliseconds.
+
+        Args:
+            text (str): The current search text.
+        """
+        self._search_text = text
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        if not text.strip():
+            self.hide_search_results()
+            return
+        if callable(self.search_callback):
+            self._search_job = self.after(SEARCH_DELAY, lambda: self._run_search(text))
+
+    def _run_search(self, text):
+        """
+        Invokes the search callback for the given text.
+
+        Args:
+            text (str): The search text.
+        """
+        self._search_job = None
+        self.search_callback(text)
+
+    def show_search_results(self, results, text=None):
+        """
+        Displays search results below the header.
+
+        Args:
+            results (list): (task_id, title, snippet) tuples, best match first.
+            text (str): The searched text; the results are dropped if the search text
+                has changed since (a newer search is pending or running).
+        """
+        if text is not None and text != self._search_text:
+            return
+        for widget in self.search_results_frame.winfo_children():
+            widget.destroy()
+        self.search_results_frame.grid(row=2, column=0, columnspan=3, sticky="ew", padx=5, pady=(0, 5))
+        if not results:
+            ctk.CTkLabel(self.search_results_frame, text="No results", text_color="gray",
+                         font=get_font("text")).pack(anchor="w", padx=5, pady=2)
+            return
+        for task_id, title, snippet in results:
+            btn = ctk.CTkButton(
+                self.search_results_frame,
+                text=f"{title}  —  {snippet}",
+                anchor="w",
+                font=get_font("text"),
+                fg_color="transparent",
+                command=lambda tid=task_id: self._select_search_result(tid)
+            )
+            btn.pack(fill="x", padx=5, pady=1)
+
+    def hide_search_results(self):
+        """
+        Hides the search results list.
+        """
+        self.search_results_frame.grid_forget()
+
+    def _select_search_result(self, task_id):
+        """
+        Hides the results and invokes the selection callback.
+
+        Args:
+            task_id (int): The ID of the selected task.
+        """
+        self.hide_search_results()
+        if callable(self.search_select_callback):
+            self.search_select_callback(task_id)
+
     def set_title(self, title):
         """
         Updates the displayed view title.
@@ -3,6 +3,7 @@ projects_view.py
 
 ProjectsView displays all projects as cards arranged in a grid (3 per row).
 Each card is clickable to open the project, and includes a delete button.
+Project change events update only the affected card.
 Inherits from BaseView for common functionality.
 """
 
@@ -12,6 +13,7 @@ from controllers.project_controller import ProjectController
 from models.project import Project
 import tkinter.messagebox as messagebox
 from controllers.task_controller import TaskController
+from controllers import events
 from views.base_view import BaseView
 
 class ProjectsView(BaseView):
@@ -27,7 +29,14 @@ class ProjectsView(BaseView):
         super().__init__(master, *args, **kwargs)
         self.controller = ProjectController()
         self.navigate_project_callback = navigate_project_callback
+        # Project ID -> card widget, in display order.
+        self.project_cards = {}
+        self.no_proj_label = None
         self._create_widgets()
+        events.bus.subscribe(events.PROJECT_CREATED, self._on_project_created)
+        events.bus.subscribe(events.PROJECT_UPDATED, self._on_project_updated)
+        events.bus.subscribe(events.PROJECT_DELETED, self._on_project_deleted)
+        events.bus.subscribe(events.DATABASE_RESTORED, self._on_database_restored)
         self.refresh()
 
     def _create_widgets(self):
@@ -61,22 +70,91 @@ class ProjectsView(BaseView):
         """
         for widget in self.projects_container.winfo_children():
             widget.destroy()
-        projects = self.controller.list_projects()
-        if not projects:
-            no_proj_label = ctk.CTkLabel(
-                self.projects_container,
-                text=self.translations.t("no_projects") if hasattr(self.translations, "t") else "No projects yet. Click here to create one.",
-                text_color="gray",
-                anchor="center"
-            )
-            no_proj_label.grid(row=0, column=0, columnspan=3, pady=20)
-            no_proj_label.bind("<Button-1>", lambda e: self._open_add_project_area())
-        else:
-            for idx, project in enumerate(projects):
-                row = idx // 3
-                col = idx % 3
-                card = self._create_project_card(project)
-                card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+        self.no_proj_label = None
+        self.project_cards = {}
+        for project in self.controller.list_projects():
+            self.project_cards[project.id] = self._create_project_card(project)
+        self._layout_cards()
+
+    def _layout_cards(self):
+        """
+        Places the project cards in the grid, or the placeholder when there are none.
+        """
+        if not self.project_cards:
+            if self.no_proj_label is None:
+                self.no_proj_label = ctk.CTkLabel(
+                    self.projects_container,
+                    text=self.translations.t("no_projects") if hasattr(self.translations, "t") else "No projects yet. Click here to create one.",
+                    text_color="gray",
+                    anchor="center"
+                )
+                self.no_proj_label.grid(row=0, column=0, columnspan=3, pady=20)
+                self.no_proj_label.bind("<Button-1>", lambda e: self._open_add_project_area())
+            return
+        if self.no_proj_label is not None:
+            self.no_proj_label.destroy()
+            self.no_proj_label = None
+        for idx, card in enumerate(self.project_cards.values()):
+            row = idx // 3
+            col = idx % 3
+            card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+
+    def _on_project_created(self, event):
+        """
+        Adds a card for each created project.
+
+        Args:
+            event (ChangeEvent): The PROJECT_CREATED event.
+        """
+        if not self.winfo_exists():
+            return
+        for project_id in event.ids:
+            project = self.controller.get_project(project_id)
+            if project is not None and project_id not in self.project_cards:
+                self.project_cards[project_id] = self._create_project_card(project)
+        self._layout_cards()
+
+    def _on_project_updated(self, event):
+        """
+        Rebuilds the cards of the updated projects in place.
+
+        Args:
+            event (ChangeEvent): The PROJECT_UPDATED event.
+        """
+        if not self.winfo_exists():
+            return
+        for project_id in event.ids:
+            project = self.controller.get_project(project_id)
+            if project is None or project_id not in self.project_cards:
+                continue
+            self.project_cards[project_id].destroy()
+            self.project_cards[project_id] = self._create_project_card(project)
+        self._layout_cards()
+
+    def _on_project_deleted(self, event):
+        """
+        Removes the cards of the deleted projects.
+
+        Args:
+            event (ChangeEvent): The PROJECT_DELETED event.
+        """
+        if not self.winfo_exists():
+            return
+        for project_id in event.ids:
+            card = self.project_cards.pop(project_id, None)
+            if card is not None:
+                card.destroy()
+        self._layout_cards()
+
+    def _on_database_restored(self, event):
+        """
+        Rebuilds the project cards after the database was replaced by a snapshot.
+
+        Args:
+            event (ChangeEvent): The DATABASE_RESTORED event.
+        """
+        if self.winfo_exists():
+            self.refresh()
 
     def _create_project_card(self, project: Project):
         """
@@ -151,8 +229,8 @@ class ProjectsView(BaseView):
             project (Project): The project model.
         """
         task_controller = TaskController()
-        tasks = task_controller.list_tasks(project_id=project.id)
-        if (project.description and project.description.strip()) or (tasks and len(tasks) > 0):
+        task_count = task_controller.count_tasks(project_id=project.id)
+        if (project.description and project.description.strip()) or task_count > 0:
             choice = messagebox.askyesnocancel(
                 self.translations.t("confirm_deletion") if hasattr(self.translations, "t") else "Confirm deletion",
                 f"{self.translations.t('delete_project_msg') if hasattr(self.translations, 't') else 'Delete project and ALL associated tasks?'}\n"
@@ -168,7 +246,6 @@ class ProjectsView(BaseView):
                 self.controller.delete_project(project.id, delete_tasks=False)
         else:
             self.controller.delete_project(project.id, delete_tasks=True)
-        self.refresh()
 
     def _open_add_project_area(self):
         """
@@ -205,6 +282,5 @@ class ProjectsView(BaseView):
             if name:
                 self.controller.create_project(name, desc)
             self.add_area.destroy()
-            self.refresh()
             
         name_entry.bind("<Return>", save_project)
@@ -1,16 +1,29 @@
 """
 settings_view.py
 
-SettingsView allows users to toggle the theme, change the font, and export tasks as CSV or JSON.
+SettingsView allows users to toggle the theme, change the font, export tasks as CSV, JSON
+or JSON Lines (optionally gzip-compressed), import such files back, back up the database
+and restore a snapshot, and inspect the query statistics collected by the database
+instrumentation.
+Exports, imports, backups and restores run on a background thread; their progress is
+shown below the buttons and they can be cancelled.
 It inherits from BaseView for unified theme and translation management.
 """
 
 import customtkinter as ctk
 import tkinter.filedialog as filedialog
-import csv
-import json
+import tkinter.messagebox as messagebox
+import os
 import theme
-from controllers.task_controller import TaskController
+from controllers.export_controller import (
+    ExportController, TASK_EXPORT_FIELDS, DEFAULT_TASK_EXPORT_FIELDS, FORMAT_JSON, FORMAT_NDJSON,
+    JOB_DONE, JOB_CANCELLED
+)
+from controllers.import_controller import ImportController
+from controllers.backup_controller import BackupController, PHASE_RESTORE
+from database.backup import BACKUP_DIR
+from database.worker import get_worker
+from database.instrumentation import recorder
 from views.base_view import BaseView
 
 class SettingsView(BaseView):
@@ -24,7 +37,11 @@ class SettingsView(BaseView):
             *args, **kwargs: Additional arguments.
         """
         super().__init__(master, *args, **kwargs)
-        self.controller = TaskController()
+        self.exporter = ExportController(dispatcher=get_worker().call_soon)
+        self.importer = ImportController(dispatcher=get_worker().call_soon)
+        self.backups = BackupController(dispatcher=get_worker().call_soon)
+        # The running export, import, backup or restore, if any; one runs at a time.
+        self.export_job = None
         self.change_theme_callback = change_theme_callback
         self._create_widgets()
 
@@ -63,6 +80,27 @@ class SettingsView(BaseView):
         self.font_combobox.pack(pady=10)
         self.font_combobox.bind("<<ComboboxSelected>>", self._on_font_change)
         
+        # Exported columns and export options.
+        fields_frame = ctk.CTkFrame(self, fg_color="transparent")
+        fields_frame.pack(pady=(10, 0))
+        self.export_field_vars = {}
+        for index, field in enumerate(TASK_EXPORT_FIELDS):
+            var = ctk.BooleanVar(value=field in DEFAULT_TASK_EXPORT_FIELDS)
+            ctk.CTkCheckBox(fields_frame, text=field, variable=var, font=theme.get_font("text")).grid(
+                row=index // 4, column=index % 4, padx=5, pady=2, sticky="w"
+            )
+            self.export_field_vars[field] = var
+        self.export_subtasks_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            self, text="Also export subtasks (second CSV)", variable=self.export_subtasks_var,
+            font=theme.get_font("text")
+        ).pack(pady=5)
+        self.export_gzip_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            self, text="Compress JSON exports (gzip)", variable=self.export_gzip_var,
+            font=theme.get_font("text")
+        ).pack(pady=5)
+
         # Export buttons.
         export_csv_btn = ctk.CTkButton(
             self,
@@ -71,12 +109,51 @@ class SettingsView(BaseView):
         )
         export_csv_btn.pack(pady=10)
         
-        export_json_btn = ctk.CTkButton(
+        self.export_json_btn = ctk.CTkButton(
             self,
             text="Export JSON",
             command=self._export_json
         )
-        export_json_btn.pack(pady=10)
+        self.export_json_btn.pack(pady=10)
+
+        # Import.
+        self.import_dedupe_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(
+            self, text="Skip tasks already imported", variable=self.import_dedupe_var,
+            font=theme.get_font("text")
+        ).pack(pady=5)
+        self.import_btn = ctk.CTkButton(
+            self,
+            text="Import CSV / JSON",
+            command=self._import_file
+        )
+        self.import_btn.pack(pady=10)
+
+        # Database snapshots.
+        self.backup_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.backup_frame.pack(pady=10)
+        ctk.CTkButton(self.backup_frame, text="Back Up Now", command=self._backup).pack(side="left", padx=5)
+        ctk.CTkButton(self.backup_frame, text="Restore...", command=self._choose_snapshot).pack(side="left", padx=5)
+
+        # Progress of the running job, shown while it runs.
+        self.progress_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.progress_label = ctk.CTkLabel(self.progress_frame, text="", font=theme.get_font("text"))
+        self.progress_label.pack(pady=(0, 5))
+        self.progress_bar = ctk.CTkProgressBar(self.progress_frame, width=300)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side="left", padx=5)
+        self.cancel_export_btn = ctk.CTkButton(
+            self.progress_frame, text="Cancel", width=80, fg_color="gray", command=self._cancel_export
+        )
+        self.cancel_export_btn.pack(side="left", padx=5)
+
+        # Query statistics.
+        query_stats_btn = ctk.CTkButton(
+            self,
+            text="Query Statistics",
+            command=self._show_query_stats
+        )
+        query_stats_btn.pack(pady=10)
 
     def _on_toggle_theme(self):
         """
@@ -94,37 +171,310 @@ class SettingsView(BaseView):
         setattr(theme, "DEFAULT_FONT_FAMILY", selected_font)
         self.change_theme_callback()
 
+    def _selected_fields(self) -> list:
+        """
+        Returns the columns checked for export, or an empty list (with a message) if none is.
+        """
+        fields = [field for field, var in self.export_field_vars.items() if var.get()]
+        if not fields:
+            print("Select at least one column to export.")
+        return fields
+
     def _export_csv(self):
         """
-        Exports tasks to a CSV file.
+        Starts a CSV export of the selected columns (and optionally the subtasks,
+        written next to it as <name>_subtasks.csv) on a background thread.
         """
-        tasks = self.controller.list_tasks()
+        if self.export_job is not None:
+            return
+        fields = self._selected_fields()
+        if not fields:
+            return
         file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-        if file_path:
-            try:
-                with open(file_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["id", "title", "description", "due_date", "time", "duration", "done", "project_id"])
-                    for t in tasks:
-                        writer.writerow([t.id, t.title, t.description, t.due_date, t.time, t.duration, t.done, t.project_id])
-                print("CSV export successful.")
-            except Exception as e:
-                print(f"Error exporting CSV: {e}")
+        if not file_path:
+            return
+        subtasks_path = None
+        if self.export_subtasks_var.get():
+            subtasks_path = f"{os.path.splitext(file_path)[0]}_subtasks.csv"
+        self.export_job = self.exporter.export_csv(
+            file_path, fields, subtasks_path,
+            on_progress=self._show_export_progress,
+            on_done=self._on_export_done
+        )
+        self._show_export_started("Exporting CSV...")
 
     def _export_json(self):
         """
-        Exports tasks to a JSON file.
-        """
-        tasks = self.controller.list_tasks()
-        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
-        if file_path:
-            try:
-                data = [t.__dict__ for t in tasks]
-                with open(file_path, "w", encoding="utf-8") as jf:
-                    json.dump(data, jf, ensure_ascii=False, indent=4)
-                print("JSON export successful.")
-            except Exception as e:
-                print(f"Error exporting JSON: {e}")
+        Starts a JSON export of the selected columns, with each task's subtasks nested
+        in it, on a background thread. A .jsonl or .ndjson name selects JSON Lines, and
+        the gzip option appends .gz to the file name.
+        """
+        if self.export_job is not None:
+            return
+        fields = self._selected_fields()
+        if not fields:
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("JSON Lines files", "*.jsonl *.ndjson")]
+        )
+        if not file_path:
+            return
+        fmt = FORMAT_NDJSON if file_path.lower().endswith((".jsonl", ".ndjson")) else FORMAT_JSON
+        compress = self.export_gzip_var.get()
+        if compress and not file_path.lower().endswith(".gz"):
+            file_path += ".gz"
+        self.export_job = self.exporter.export_json(
+            file_path, fmt, compress, fields,
+            on_progress=self._show_export_progress,
+            on_done=self._on_export_done
+        )
+        self._show_export_started("Exporting JSON Lines..." if fmt == FORMAT_NDJSON else "Exporting JSON...")
+
+    def _show_export_started(self, text: str):
+        """
+        Shows the progress bar of an export that has just started.
+
+        Args:
+            text (str): Label shown until the first progress report.
+        """
+        self.progress_label.configure(text=text)
+        self.progress_bar.set(0)
+        self.cancel_export_btn.configure(state="normal")
+        self.progress_frame.pack(pady=10, after=self.backup_frame)
+
+    def _show_export_progress(self, rows_written, total_rows):
+        """
+        Updates the progress bar of the running export.
+
+        Args:
+            rows_written (int): Rows written so far.
+            total_rows (int): Rows to write.
+        """
+        if not self.winfo_exists():
+            return
+        self.progress_bar.set(rows_written / total_rows if total_rows else 1)
+        self.progress_label.configure(text=f"Exporting... {rows_written}/{total_rows} rows")
+
+    def _cancel_export(self):
+        """
+        Cancels the running job: a partial export or backup file is removed, and an import
+        or a restore is rolled back.
+        """
+        if self.export_job is not None:
+            self.export_job.cancel()
+            self.cancel_export_btn.configure(state="disabled")
+
+    def _on_export_done(self, job):
+        """
+        Reports the outcome of an export and hides the progress bar.
+
+        Args:
+            job (ExportJob): The finished export.
+        """
+        self.export_job = None
+        if job.status == JOB_DONE:
+            print(f"Export successful: {', '.join(job.paths)}")
+        elif job.status == JOB_CANCELLED:
+            print("Export cancelled.")
+        else:
+            print(f"Error exporting: {job.error}")
+        if self.winfo_exists():
+            self.progress_frame.pack_forget()
+
+    def _import_file(self):
+        """
+        Starts importing a CSV, JSON or JSON Lines file (optionally gzipped) on a background
+        thread. For a CSV, a <name>_subtasks.csv next to it is imported with it.
+        """
+        if self.export_job is not None:
+            return
+        file_path = filedialog.askopenfilename(filetypes=[
+            ("Task exports", "*.csv *.json *.jsonl *.ndjson *.gz"),
+            ("All files", "*.*"),
+        ])
+        if not file_path:
+            return
+        base = file_path[:-3] if file_path.lower().endswith(".gz") else file_path
+        subtasks_path = None
+        if base.lower().endswith(".csv"):
+            candidate = f"{os.path.splitext(base)[0]}_subtasks.csv"
+            if os.path.exists(candidate):
+                subtasks_path = candidate
+        self.export_job = self.importer.import_file(
+            file_path, subtasks_path, dedupe=self.import_dedupe_var.get(),
+            on_progress=self._show_import_progress,
+            on_done=self._on_import_done
+        )
+        self._show_export_started("Importing...")
+
+    def _show_import_progress(self, bytes_read, file_size):
+        """
+        Updates the progress bar of the running import.
+
+        Args:
+            bytes_read (int): Bytes of the file read so far.
+            file_size (int): Size of the file.
+        """
+        if not self.winfo_exists():
+            return
+        fraction = min(bytes_read / file_size, 1) if file_size else 1
+        self.progress_bar.set(fraction)
+        self.progress_label.configure(text=f"Importing... {fraction:.0%}")
+
+    def _on_import_done(self, job):
+        """
+        Reports the outcome of an import and hides the progress bar.
+
+        Args:
+            job (ImportJob): The finished import.
+        """
+        self.export_job = None
+        if job.status == JOB_DONE:
+            print(f"Imported {job.imported} tasks ({job.duplicates} already imported, {job.invalid} invalid).")
+            for error in job.errors:
+                print(f"  {error}")
+        elif job.status == JOB_CANCELLED:
+            print("Import cancelled; nothing was imported.")
+        else:
+            print(f"Error importing: {job.error}")
+        if self.winfo_exists():
+            self.progress_frame.pack_forget()
+
+    def _backup(self):
+        """
+        Starts writing a snapshot of the database on a background thread.
+        """
+        if self.export_job is not None:
+            return
+        self.export_job = self.backups.create_snapshot(
+            on_progress=self._show_backup_progress,
+            on_done=self._on_backup_done
+        )
+        self._show_export_started("Backing up...")
+
+    def _choose_snapshot(self):
+        """
+        Opens a window listing the snapshots, newest first, each with a Restore button.
+        Another snapshot file can be picked with a file dialog.
+        """
+        if self.export_job is not None:
+            return
+        window = ctk.CTkToplevel(self)
+        window.title("Restore Snapshot")
+        window.geometry("420x360")
+        listing = ctk.CTkScrollableFrame(window)
+        listing.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+        snapshots = self.backups.list_snapshots()
+        if not snapshots:
+            ctk.CTkLabel(listing, text="No snapshots yet.", font=theme.get_font("text")).pack(pady=10)
+        for snapshot in snapshots:
+            row = ctk.CTkFrame(listing, fg_color="transparent")
+            row.pack(fill="x", pady=2)
+            text = f"{snapshot.created:%Y-%m-%d %H:%M:%S}  ({snapshot.size / 1048576:.1f} MB)"
+            ctk.CTkLabel(row, text=text, font=theme.get_font("text")).pack(side="left", padx=5)
+            ctk.CTkButton(
+                row, text="Restore", width=80,
+                command=lambda path=snapshot.path: self._restore(window, path)
+            ).pack(side="right", padx=5)
+
+        def browse():
+            path = filedialog.askopenfilename(
+                parent=window, initialdir=BACKUP_DIR,
+                filetypes=[("SQLite databases", "*.db"), ("All files", "*.*")]
+            )
+            if path:
+                self._restore(window, path)
+
+        ctk.CTkButton(window, text="Other File...", command=browse).pack(pady=10)
+
+    def _restore(self, window, path: str):
+        """
+        Asks for confirmation, then starts restoring the snapshot at path on a background thread.
+
+        Args:
+            window: The snapshot list window, closed once the restore starts.
+            path (str): The snapshot to restore.
+        """
+        if self.export_job is not None:
+            return
+        if not messagebox.askyesno(
+            "Restore Snapshot",
+            "Replace all tasks, projects and settings with this snapshot?\n"
+            "The current data is backed up first.",
+            parent=window
+        ):
+            return
+        window.destroy()
+        self.export_job = self.backups.restore_snapshot(
+            path,
+            on_progress=self._show_backup_progress,
+            on_done=self._on_backup_done
+        )
+        self._show_export_started("Backing up the current data...")
+
+    def _show_backup_progress(self, pages_copied, total_pages):
+        """
+        Updates the progress bar of the running backup or restore.
+
+        Args:
+            pages_copied (int): Database pages copied so far.
+            total_pages (int): Pages of the database being copied.
+        """
+        if not self.winfo_exists() or self.export_job is None:
+            return
+        action = "Restoring" if self.export_job.phase == PHASE_RESTORE else "Backing up"
+        self.progress_bar.set(pages_copied / total_pages if total_pages else 1)
+        self.progress_label.configure(text=f"{action}... {pages_copied}/{total_pages} pages")
+
+    def _on_backup_done(self, job):
+        """
+        Reports the outcome of a backup or restore and hides the progress bar.
+
+        Args:
+            job (BackupJob): The finished job.
+        """
+        self.export_job = None
+        restore = job.restore_path is not None
+        if job.status == JOB_DONE:
+            if restore:
+                print(f"Restored {job.restore_path} (previous data saved to {job.snapshot}).")
+            else:
+                print(f"Backup written to {job.snapshot}.")
+            if job.deleted:
+                print(f"Removed {len(job.deleted)} old snapshot(s).")
+        elif job.status == JOB_CANCELLED:
+            print("Restore cancelled; nothing was changed." if restore else "Backup cancelled.")
+        else:
+            print(f"Error {job.ACTION}: {job.error}")
+        if self.winfo_exists():
+            self.progress_frame.pack_forget()
+
+    def _show_query_stats(self):
+        """
+        Opens a window with the query statistics collected since startup.
+        """
+        window = ctk.CTkToplevel(self)
+        window.title("Query Statistics")
+        window.geometry("900x600")
+        textbox = ctk.CTkTextbox(window, wrap="none", font=("Courier", 12))
+        textbox.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+
+        def show():
+            textbox.configure(state="normal")
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", recorder.format_summary())
+            textbox.configure(state="disabled")
+
+        def reset():
+            recorder.reset()
+            show()
+
+        buttons = ctk.CTkFrame(window, fg_color="transparent")
+        buttons.pack(pady=10)
+        ctk.CTkButton(buttons, text="Refresh", command=show).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Reset", command=reset).pack(side="left", padx=5)
+        show()
 
     def refresh(self) -> None:
         """
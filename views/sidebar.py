@@ -2,15 +2,17 @@
 sidebar.py
 
 Sidebar widget provides navigation between views.
-It includes navigation buttons, a search entry, and a collapsible projects section.
+It includes navigation buttons, a search entry, and a collapsible projects section
+kept up to date by project change events.
 """
 
 import customtkinter as ctk
 from controllers.project_controller import ProjectController
+from controllers import events
 from theme import get_font, current_mode, load_icon, get_default_frame_color, get_ctkframe_top_color
 
 class Sidebar(ctk.CTkFrame):
-    def __init__(self, master, navigate_callback, translations, width, *args, **kwargs):
+    def __init__(self, master, navigate_callback, translations, width, *args, search_callback=None, **kwargs):
         """
         Initializes the Sidebar widget.
 
@@ -19,16 +21,22 @@ class Sidebar(ctk.CTkFrame):
             navigate_callback (callable): Function called when a navigation button is clicked.
             translations: Translation manager object.
             width (int): Initial width of the sidebar.
+            search_callback (callable): Called with the text of the search entry at every keystroke;
+                TodoApp passes Header.schedule_search, which debounces it and shows the results.
             *args, **kwargs: Additional arguments.
         """
         kwargs["width"] = width
         self.translations = translations
         super().__init__(master, *args, **kwargs)
         self.navigate_callback = navigate_callback
+        self.search_callback = search_callback
         self.project_controller = ProjectController()
         self.expanded = True
         self.default_width = width
         self.header_callback = None  # Notifies header when toggling
+        # Project ID -> navigation button, in display order.
+        self.project_buttons = {}
+        self.no_projects_label = None
 
         # Disable geometry propagation to enforce fixed width.
         self.pack_propagate(False)
@@ -47,6 +55,10 @@ class Sidebar(ctk.CTkFrame):
         self.configure(width=self.default_width, height=self.fixed_height)
 
         self._build_sidebar()
+        events.bus.subscribe(events.PROJECT_CREATED, self._on_projects_changed)
+        events.bus.subscribe(events.PROJECT_UPDATED, self._on_projects_changed)
+        events.bus.subscribe(events.PROJECT_DELETED, self._on_projects_deleted)
+        events.bus.subscribe(events.DATABASE_RESTORED, self._on_database_restored)
 
     def _build_sidebar(self):
         """
@@ -89,6 +101,8 @@ class Sidebar(ctk.CTkFrame):
             width=120
         )
         self.search_entry.place(x=60, y=10)
+        if callable(self.search_callback):
+            self.search_entry.bind("<KeyRelease>", lambda e: self.search_callback(self.search_entry.get()))
 
     def _create_main_section(self):
         """
@@ -185,32 +199,100 @@ class Sidebar(ctk.CTkFrame):
         """
         for widget in self.projects_frame.winfo_children():
             widget.destroy()
-        max_chars = 20
+        self.project_buttons = {}
+        self.no_projects_label = None
         projects = self.project_controller.list_projects() if hasattr(self, "project_controller") else []
-        if not projects:
-            label = ctk.CTkLabel(
+        for proj in projects:
+            self.project_buttons[proj.id] = ctk.CTkButton(
                 self.projects_frame,
-                text=self.translations.t("no_projects"),
-                font=get_font("label"),
-                corner_radius=10,
-                wraplength=140
+                text=self._project_label(proj),
+                command=lambda p=proj: self.navigate_callback(("project", p.id)),
+                font=get_font("button"),
+                width=140
             )
-            label.place(x=10, y=10)
-            label.bind("<Button-1>", lambda e: self.navigate_callback("projects"))
-        else:
-            y_pos = 10
-            for proj in projects:
-                display_text = proj.name if len(proj.name) <= max_chars else proj.name[:max_chars] + "..."
-                btn = ctk.CTkButton(
+        self._place_project_buttons()
+
+    @staticmethod
+    def _project_label(project, max_chars: int = 20) -> str:
+        """
+        Returns the project name, shortened to max_chars characters.
+        """
+        return project.name if len(project.name) <= max_chars else project.name[:max_chars] + "..."
+
+    def _place_project_buttons(self):
+        """
+        Stacks the project buttons, or shows the placeholder when there are none.
+        """
+        if not self.project_buttons:
+            if self.no_projects_label is None:
+                self.no_projects_label = ctk.CTkLabel(
+                    self.projects_frame,
+                    text=self.translations.t("no_projects"),
+                    font=get_font("label"),
+                    corner_radius=10,
+                    wraplength=140
+                )
+                self.no_projects_label.place(x=10, y=10)
+                self.no_projects_label.bind("<Button-1>", lambda e: self.navigate_callback("projects"))
+            return
+        if self.no_projects_label is not None:
+            self.no_projects_label.destroy()
+            self.no_projects_label = None
+        y_pos = 10
+        for btn in self.project_buttons.values():
+            # Only x and y are passed to place(), width is set in constructor.
+            btn.place(x=10, y=y_pos)
+            y_pos += 40
+
+    def _on_projects_changed(self, event):
+        """
+        Adds buttons for created projects and relabels renamed ones.
+
+        Args:
+            event (ChangeEvent): A PROJECT_CREATED or PROJECT_UPDATED event.
+        """
+        if not self.winfo_exists():
+            return
+        for project_id in event.ids:
+            project = self.project_controller.get_project(project_id)
+            if project is None:
+                continue
+            if project_id in self.project_buttons:
+                self.project_buttons[project_id].configure(text=self._project_label(project))
+            else:
+                self.project_buttons[project_id] = ctk.CTkButton(
                     self.projects_frame,
-                    text=display_text,
-                    command=lambda p=proj: self.navigate_callback(("project", p.id)),
+                    text=self._project_label(project),
+                    command=lambda p=project: self.navigate_callback(("project", p.id)),
                     font=get_font("button"),
                     width=140
                 )
-                # Only x and y are passed to place(), width is set in constructor.
-                btn.place(x=10, y=y_pos)
-                y_pos += 40
+        self._place_project_buttons()
+
+    def _on_projects_deleted(self, event):
+        """
+        Removes the buttons of deleted projects.
+
+        Args:
+            event (ChangeEvent): The PROJECT_DELETED event.
+        """
+        if not self.winfo_exists():
+            return
+        for project_id in event.ids:
+            btn = self.project_buttons.pop(project_id, None)
+            if btn is not None:
+                btn.destroy()
+        self._place_project_buttons()
+
+    def _on_database_restored(self, event):
+        """
+        Rebuilds the project buttons after the database was replaced by a snapshot.
+
+        Args:
+            event (ChangeEvent): The DATABASE_RESTORED event.
+        """
+        if self.winfo_exists():
+            self._populate_projects()
 
     def _create_footer_section(self):
         """
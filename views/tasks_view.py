@@ -4,18 +4,35 @@ tasks_view.py
 TasksView is the primary view for displaying tasks in an interactive table.
 It comprises:
   - A scrollable container to display the task table.
+  - Pages of task summaries requested from the background database worker and
+    rendered when they arrive, so the window never waits on the database. Full
+    tasks are only loaded for the details panel and for edits.
+  - Change events from the controllers, applied to the affected rows only.
+  - A "Load more" button that fetches the next page of tasks on demand.
   - An "Add Task" button located at the bottom-right corner.
 
 This view leverages a consistent style by using common fonts and colors from the theme.
 """
 
+from dataclasses import replace
+from datetime import datetime
 import customtkinter as ctk
-from controllers.task_controller import TaskController
+from controllers.task_controller import TaskController, build_task_query, EDITABLE_TASK_FIELDS
+from controllers.project_controller import ProjectController
+from controllers import events
+from utils.dates import to_storage_date, to_storage_time
+from database.worker import get_worker
 from utils.translations import TranslationsManager
 from components.task_table import TaskTable
 from theme import get_font
 from views.base_view import BaseView  # Assuming you later extend TasksView from BaseView
 
+# Number of tasks fetched per page.
+PAGE_SIZE = 100
+
+# Task column behind each header filter; changes to these columns can move rows in or out of the view.
+FILTER_COLUMNS = {"project": "project_id", "status": "status", "priority": "priority"}
+
 class TasksView(BaseView):
     def __init__(self, master, *args, **kwargs):
         """
@@ -29,18 +46,31 @@ class TasksView(BaseView):
         super().__init__(master, *args, **kwargs)
         # Initialize controller and translation manager.
         self.controller = TaskController()
+        self.worker = get_worker()
         self.translations = TranslationsManager(language="fr")
         
-        # Dictionary to store filter/sort criteria.
-        self.filter_sort_criteria = {}
+        # Filter/sort criteria from the table header, applied by the database query.
+        self.filter_sort_criteria = {"sort": None, "filters": {}}
         # Current project ID to filter tasks; set to None for all tasks.
         self.current_project = None
+        # Keyset of the last loaded page; None when every task is displayed.
+        self.next_page_key = None
+        # Incremented on every refresh; results of older requests are discarded.
+        self.generation = 0
+        # True while a "Load more" request is in flight.
+        self.loading_page = False
 
         # Configure grid to ensure view expands to fill the available space.
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         self._create_widgets()
+        events.bus.subscribe(events.TASK_CREATED, self._on_tasks_created)
+        events.bus.subscribe(events.TASK_UPDATED, self._on_tasks_updated)
+        events.bus.subscribe(events.TASK_DELETED, self._on_tasks_deleted)
+        events.bus.subscribe(events.PROJECT_UPDATED, self._on_projects_updated)
+        events.bus.subscribe(events.PROJECT_DELETED, self._on_project_deleted)
+        events.bus.subscribe(events.DATABASE_RESTORED, self._on_database_restored)
         self.refresh_tasks()
 
     def _create_widgets(self):
@@ -68,32 +98,76 @@ class TasksView(BaseView):
 
         # Placeholder label for when no tasks are present.
         self.empty_label = None
+        # Button loading the next page of tasks.
+        self.load_more_btn = None
 
     def refresh_tasks(self):
         """
-        Refresh the tasks list by clearing and re-populating the task table.
+        Requests the first page of tasks from the database worker.
+        The table is rebuilt by _render_tasks once the page arrives; pages from
+        requests superseded by a newer refresh are dropped.
+        """
+        self.generation += 1
+        generation = self.generation
+        self.loading_page = False
+        self.worker.submit(
+            self._fetch_page, None, self.current_project, build_task_query(self.filter_sort_criteria),
+            callback=lambda page: self._render_tasks(generation, *page)
+        )
+
+    def _fetch_page(self, after_key, project_id, query):
+        """
+        Loads one page of task summaries and the number of matching tasks. Runs on the worker thread.
+
+        Args:
+            after_key (tuple or None): Keyset returned with the previous page.
+            project_id (int or None): Project to filter by.
+            query (dict): Sort and filter arguments from build_task_query().
+
+        Returns:
+            tuple: (tasks, next_key, total); total is None when no page remains.
+        """
+        tasks, next_key = self.controller.list_task_summaries(
+            after_key=after_key,
+            limit=PAGE_SIZE,
+            project_id=project_id,
+            **query
+        )
+        total = None
+        if next_key is not None:
+            total = self.controller.count_tasks(project_id=project_id, filters=query["filters"])
+        return tasks, next_key, total
+
+    def _render_tasks(self, generation, tasks, next_key, total):
+        """
+        Clears and re-populates the task table with the first page of tasks.
         If no tasks exist, displays a placeholder message.
+
+        Args:
+            generation (int): The refresh that requested the page.
+            tasks (list of TaskSummary): The first page of tasks.
+            next_key (tuple or None): Keyset of the next page.
+            total (int or None): Number of matching tasks.
         """
+        if generation != self.generation or not self.winfo_exists():
+            return
         # Clear any existing widgets in the container.
         for widget in self.table_container.winfo_children():
             widget.destroy()
 
-        tasks = self.controller.list_tasks(project_id=self.current_project)
+        self.load_more_btn = None
+        self.next_page_key = next_key
         if not tasks:
-            # Show placeholder message when no tasks exist.
-            if self.empty_label is None:
-                self.empty_label = ctk.CTkLabel(
-                    self.table_container,
-                    text=self.translations.t("no_tasks") or "Click 'Add Task' to create one.",
-                    text_color="gray",
-                    font=get_font("button")
-                )
-                self.empty_label.pack(expand=True, fill="both", pady=20)
+            # The placeholder was destroyed with the container's children.
+            self.empty_label = ctk.CTkLabel(
+                self.table_container,
+                text=self.translations.t("no_tasks") or "Click 'Add Task' to create one.",
+                text_color="gray",
+                font=get_font("button")
+            )
+            self.empty_label.pack(expand=True, fill="both", pady=20)
             return
-        else:
-            if self.empty_label:
-                self.empty_label.destroy()
-                self.empty_label = None
+        self.empty_label = None
 
         # Create and add the task table widget.
         self.task_table = TaskTable(
@@ -104,11 +178,67 @@ class TasksView(BaseView):
             on_filter_sort_change=self._on_filter_sort_change,
             on_update=self._on_task_update,
             on_delete=self._on_task_delete,
+            on_toggle_details=self._load_task_details,
             on_field_edit=self._on_field_edit,
             on_details_save=self._save_task_details,
             on_subtask_update=self._on_subtask_update
         )
         self.task_table.grid(row=0, column=0, sticky="nsew")
+        self._update_load_more(total)
+
+    def _load_next_page(self):
+        """
+        Requests the next page of tasks; it is appended to the task table when it arrives.
+        """
+        if self.next_page_key is None or self.loading_page or not hasattr(self, 'task_table'):
+            return
+        self.loading_page = True
+        generation = self.generation
+        self.worker.submit(
+            self._fetch_page, self.next_page_key, self.current_project, build_task_query(self.filter_sort_criteria),
+            callback=lambda page: self._append_page(generation, *page)
+        )
+
+    def _append_page(self, generation, tasks, next_key, total):
+        """
+        Appends a page of tasks loaded by _load_next_page to the task table.
+
+        Args:
+            generation (int): The refresh the page belongs to.
+            tasks (list of TaskSummary): The page of tasks.
+            next_key (tuple or None): Keyset of the next page.
+            total (int or None): Number of matching tasks.
+        """
+        if generation != self.generation or not self.winfo_exists():
+            return
+        self.loading_page = False
+        self.next_page_key = next_key
+        self.task_table.append_tasks(tasks)
+        self._update_load_more(total)
+
+    def _update_load_more(self, total):
+        """
+        Shows the "Load more" button while pages remain, with the loaded/total count.
+
+        Args:
+            total (int or None): Number of matching tasks.
+        """
+        if self.next_page_key is None:
+            if self.load_more_btn is not None:
+                self.load_more_btn.destroy()
+                self.load_more_btn = None
+            return
+        text = f"Load more ({len(self.task_table.tasks)}/{total})"
+        if self.load_more_btn is None:
+            self.load_more_btn = ctk.CTkButton(
+                self.table_container,
+                text=text,
+                font=get_font("button"),
+                command=self._load_next_page
+            )
+            self.load_more_btn.grid(row=1, column=0, pady=10)
+        else:
+            self.load_more_btn.configure(text=text)
 
     def _select_all_tasks(self, selected):
         """
@@ -143,10 +273,8 @@ class TasksView(BaseView):
         btn_frame.pack(pady=5)
         
         def confirm_delete():
-            for tid in selected_ids:
-                self.controller.delete_task(tid)
             confirm.destroy()
-            self.refresh_tasks()
+            self.worker.submit(self.controller.delete_tasks, selected_ids)
         
         ctk.CTkButton(btn_frame, text="Yes", command=confirm_delete, fg_color="#D9534F", font=get_font("button")).pack(side="left", padx=5)
         ctk.CTkButton(btn_frame, text="No", command=confirm.destroy, fg_color="gray", font=get_font("button")).pack(side="left", padx=5)
@@ -154,12 +282,18 @@ class TasksView(BaseView):
     def _on_filter_sort_change(self, field, value):
         """
         Updates the filter or sort criteria and refreshes the tasks view.
+        Sort events arrive as "Sort asc"/"Sort desc"; ("filter", "None") clears all filters.
 
         Args:
             field (str): The field to filter or sort by.
             value: The new value for the criterion.
         """
-        self.filter_sort_criteria[field] = value
+        if isinstance(value, str) and value.startswith("Sort "):
+            self.filter_sort_criteria["sort"] = (field, value.split(" ", 1)[1])
+        elif field == "filter" and value == "None":
+            self.filter_sort_criteria["filters"] = {}
+        else:
+            self.filter_sort_criteria["filters"][field] = value
         self.refresh_tasks()
 
     def _on_add_task(self):
@@ -177,76 +311,120 @@ class TasksView(BaseView):
             title = entry.get().strip()
             entry_frame.destroy()
             if title:
-                self.controller.create_task(title=title, project_id=self.current_project)
-            self.refresh_tasks()
+                self.worker.submit(self.controller.create_task, title=title, project_id=self.current_project)
         
         entry.bind("<Return>", save_entry)
         entry.bind("<FocusOut>", save_entry)
 
     def _on_task_update(self, task):
         """
-        Callback triggered when a task is updated.
+        Callback triggered when a task is updated. The row is refreshed when the
+        TASK_UPDATED event of the write arrives, so nothing is reloaded here.
         
         Args:
-            task: The updated task object.
+            task: The updated task summary.
         """
-        self.refresh_tasks()
 
     def _on_task_delete(self, task_id):
         """
-        Deletes a task and refreshes the view.
+        Deletes a task on the database worker and refreshes the view.
 
         Args:
             task_id (int): The ID of the task to delete.
         """
-        self.controller.delete_task(task_id)
-        self.refresh_tasks()
+        self.worker.submit(self.controller.delete_task, task_id)
+
+    def _load_task_details(self, task_id):
+        """
+        Loads the full task for a row's details panel on the database worker.
+
+        Args:
+            task_id (int): The ID of the task.
+        """
+        generation = self.generation
+        self.worker.submit(
+            self.controller.get_task, task_id,
+            callback=lambda task: self._show_task_details(generation, task)
+        )
+
+    def _show_task_details(self, generation, task):
+        """
+        Hands a task loaded by _load_task_details to the task table.
+
+        Args:
+            generation (int): The refresh the request belongs to.
+            task (Task or None): The task, or None if it was deleted meanwhile.
+        """
+        if task is None or generation != self.generation or not self.winfo_exists():
+            return
+        if hasattr(self, 'task_table') and self.task_table.winfo_exists():
+            self.task_table.show_details(task)
 
     def _save_task_details(self, task, new_values):
         """
-        Updates task details with new values and refreshes the tasks view.
+        Updates task details with new values; the row is refreshed by the TASK_UPDATED event.
+        A copy of the task is edited: the cached task is only patched once the update succeeds.
 
         Args:
-            task: The task object to update.
+            task: The full task object shown in the details panel.
             new_values (dict): A dictionary containing updated task fields.
         """
-        if new_values.get("title", "").strip() == "":
-            return
-        task.description = new_values.get("description", task.description)
-        task.due_date = new_values.get("due_date", task.due_date)
-        task.time = new_values.get("time", task.time)
         try:
-            task.duration = int(new_values.get("duration", task.duration))
-        except ValueError:
-            task.duration = task.duration
-        self.controller.update_task(task)
-        self.refresh_tasks()
+            duration = int(new_values.get("duration", task.duration))
+        except (TypeError, ValueError):
+            duration = task.duration
+        edited = replace(
+            task,
+            description=new_values.get("description", task.description),
+            due_date=new_values.get("due_date", task.due_date),
+            time=new_values.get("time", task.time),
+            duration=duration
+        )
+        self.worker.submit(self.controller.update_task, edited, ("description", "due_date", "time", "duration"))
 
     def _on_field_edit(self, field, new_value, task):
         """
         Updates a specific field of a task after in-line editing.
+        Rows hold read-only summaries, so the edit is applied to the full task on the worker.
 
         Args:
             field (str): The field being edited (e.g., "title", "status").
+            new_value: The new value for the field (a datetime for "due_date").
+            task: The task summary of the edited row.
+        """
+        if field == "title" and new_value.strip() == "":
+            return
+        self.worker.submit(self._apply_field_edit, task.id, field, new_value)
+
+    def _apply_field_edit(self, task_id, field, new_value):
+        """
+        Loads the full task and saves an in-line edit to a copy of it. Runs on the worker thread.
+
+        Args:
+            task_id (int): The ID of the edited task.
+            field (str): The field being edited.
             new_value: The new value for the field.
-            task: The task object to update.
         """
-        if field == "title":
-            if new_value.strip() == "":
-                return
-            task.title = new_value
+        task = self.controller.get_task(task_id)
+        if task is None:
+            return
+        if field in ("title", "status", "priority"):
+            changes = {field: new_value}
         elif field == "project":
-            task.project = new_value
-        elif field == "status":
-            task.status = new_value
-        elif field == "priority":
-            task.priority = new_value
+            # The row shows project names; unknown names are ignored.
+            project = next((p for p in ProjectController().list_projects() if p.name == new_value), None)
+            if project is None:
+                return
+            changes = {"project_id": project.id}
         elif field == "due_date":
-            task.due_date = new_value
-        elif field == "updated_at":
-            task.updated_at = new_value
-        self.controller.update_task(task)
-        self.refresh_tasks()
+            # The row editor passes a datetime; it is stored as separate date and time.
+            changes = {
+                "due_date": to_storage_date(new_value),
+                "time": to_storage_time(new_value) if isinstance(new_value, datetime) else task.time,
+            }
+        else:
+            return
+        self.controller.update_task(replace(task, **changes), tuple(changes))
 
     def _on_subtask_update(self, action, data):
         """
@@ -259,6 +437,235 @@ class TasksView(BaseView):
         # Implement subtask update functionality as needed.
         pass
 
+    def _sensitive_fields(self) -> set:
+        """
+        Returns the task fields whose change can move a row within, into or out of
+        the displayed list: the sort column, the filtered columns and the project.
+        Events only report the edited fields, but every task update also sets
+        updated_at, so when sorting by it any edited column moves the row.
+        """
+        query = build_task_query(self.filter_sort_criteria)
+        fields = {query["order_by"]} | {FILTER_COLUMNS[f] for f in query["filters"]}
+        if query["order_by"] == "updated_at":
+            fields.update(EDITABLE_TASK_FIELDS)
+        if self.current_project is not None:
+            fields.add("project_id")
+        return fields
+
+    def _fetch_tasks(self, task_ids, project_id):
+        """
+        Loads task summaries by id, keeping those that belong to project_id. Runs on the worker thread.
+
+        Args:
+            task_ids (iterable): IDs of the tasks to load.
+            project_id (int or None): Project displayed by the view.
+
+        Returns:
+            list: The summaries of the existing matching tasks.
+        """
+        summaries = self.controller.get_task_summaries(task_ids)
+        return [t for t in summaries if project_id is None or t.project_id == project_id]
+
+    def _on_tasks_created(self, event):
+        """
+        Appends newly created tasks to the table. In id order the new tasks sort last, so
+        they are only appended once every page is loaded; other orders and filters reload the list.
+
+        Args:
+            event (ChangeEvent): The TASK_CREATED event.
+        """
+        if not self.winfo_exists():
+            return
+        query = build_task_query(self.filter_sort_criteria)
+        if (query["filters"] or query["order_by"] != "id" or query["descending"]
+                or self.empty_label is not None or len(event.ids) > PAGE_SIZE):
+            self.refresh_tasks()
+            return
+        if self.next_page_key is not None:
+            return
+        generation = self.generation
+        self.worker.submit(
+            self._fetch_tasks, event.ids, self.current_project,
+            callback=lambda tasks: self._append_created(generation, tasks)
+        )
+
+    def _append_created(self, generation, tasks):
+        """
+        Adds the rows of tasks loaded by _on_tasks_created.
+
+        Args:
+            generation (int): The refresh the request belongs to.
+            tasks (list): The created task summaries.
+        """
+        if generation != self.generation or not self.winfo_exists() or not tasks:
+            return
+        if hasattr(self, 'task_table') and self.task_table.winfo_exists():
+            self.task_table.append_tasks(tasks)
+        else:
+            self.refresh_tasks()
+
+    def _on_tasks_updated(self, event):
+        """
+        Refreshes the rows of updated tasks. A change to a sorted or filtered column
+        reloads the list, since it can move rows.
+
+        Args:
+            event (ChangeEvent): The TASK_UPDATED event.
+        """
+        if not self.winfo_exists() or not hasattr(self, 'task_table') or not self.task_table.winfo_exists():
+            return
+        if self._sensitive_fields() & set(event.fields):
+            self.refresh_tasks()
+            return
+        shown = [tid for tid in event.ids if tid in self.task_table.task_rows]
+        if not shown:
+            return
+        generation = self.generation
+        self.worker.submit(
+            self._fetch_tasks, shown, None,
+            callback=lambda tasks: self._update_rows(generation, tasks)
+        )
+
+    def _update_rows(self, generation, tasks):
+        """
+        Applies tasks loaded by _on_tasks_updated to their rows.
+
+        Args:
+            generation (int): The refresh the request belongs to.
+            tasks (list): The updated task summaries.
+        """
+        if generation != self.generation or not self.winfo_exists():
+            return
+        for task in tasks:
+            self.task_table.update_task(task)
+
+    def _on_tasks_deleted(self, event):
+        """
+        Removes the rows of deleted tasks; an emptied list is reloaded to show the placeholder.
+
+        Args:
+            event (ChangeEvent): The TASK_DELETED event.
+        """
+        if not self.winfo_exists() or not hasattr(self, 'task_table') or not self.task_table.winfo_exists():
+            return
+        self.task_table.remove_tasks(event.ids)
+        if not self.task_table.task_rows:
+            self.refresh_tasks()
+
+    def _on_projects_updated(self, event):
+        """
+        Refreshes the rows showing the name of a renamed project. When sorting by
+        project, which orders by project name, the list is reloaded instead.
+
+        Args:
+            event (ChangeEvent): The PROJECT_UPDATED event.
+        """
+        if "name" not in event.fields or not self.winfo_exists():
+            return
+        if build_task_query(self.filter_sort_criteria)["order_by"] == "project_id":
+            self.refresh_tasks()
+            return
+        if not hasattr(self, 'task_table') or not self.task_table.winfo_exists():
+            return
+        shown = [tid for tid, row in self.task_table.task_rows.items() if row.task.project_id in event.ids]
+        if not shown:
+            return
+        generation = self.generation
+        self.worker.submit(
+            self._fetch_tasks, shown, None,
+            callback=lambda tasks: self._update_rows(generation, tasks)
+        )
+
+    def _on_project_deleted(self, event):
+        """
+        Reloads the tasks after a project deletion, which deletes or detaches its tasks.
+
+        Args:
+            event (ChangeEvent): The PROJECT_DELETED event.
+        """
+        if self.current_project in event.ids:
+            self.current_project = None
+        if self.winfo_exists():
+            self.refresh_tasks()
+
+    def _on_database_restored(self, event):
+        """
+        Reloads the tasks after the database was replaced by a snapshot.
+
+        Args:
+            event (ChangeEvent): The DATABASE_RESTORED event.
+        """
+        if self.winfo_exists():
+            self.refresh_tasks()
+
+    def focus_task(self, task_id):
+        """
+        Opens the details of a task, e.g. after selecting a search result. A task that
+        is not on the loaded pages is sought: the project and filters are cleared and
+        the table is reloaded from a page starting at the task, in the current sort order.
+
+        Args:
+            task_id (int): The ID of the task to show.
+        """
+        if hasattr(self, 'task_table') and task_id in self.task_table.task_rows:
+            self._open_task_row(task_id)
+            return
+        self.current_project = None
+        self.filter_sort_criteria["filters"] = {}
+        self.generation += 1
+        generation = self.generation
+        self.loading_page = False
+        self.worker.submit(
+            self._fetch_page_at, task_id, build_task_query(self.filter_sort_criteria),
+            callback=lambda page: self._render_focused(generation, task_id, page)
+        )
+
+    def _fetch_page_at(self, task_id, query):
+        """
+        Loads the page of task summaries starting at a task, in the sort order of query.
+        Runs on the worker thread.
+
+        Args:
+            task_id (int): The first task of the page.
+            query (dict): Sort arguments from build_task_query() (filters are empty).
+
+        Returns:
+            tuple or None: (tasks, next_key, total) as returned by _fetch_page, or None
+                if the task no longer exists.
+        """
+        found = self.controller.get_task_summaries([task_id])
+        if not found:
+            return None
+        # Keysets are exclusive: resume just before the task in the sort order.
+        after_key = (getattr(found[0], query["order_by"]), task_id + 1 if query["descending"] else task_id - 1)
+        return self._fetch_page(after_key, None, query)
+
+    def _render_focused(self, generation, task_id, page):
+        """
+        Renders the page loaded by _fetch_page_at and opens the task's details.
+
+        Args:
+            generation (int): The refresh that requested the page.
+            task_id (int): The task to open.
+            page (tuple or None): The page, or None if the task no longer exists.
+        """
+        if page is None:
+            if generation == self.generation:
+                self.refresh_tasks()
+            return
+        self._render_tasks(generation, *page)
+        if generation == self.generation and self.winfo_exists():
+            self._open_task_row(task_id)
+
+    def _open_task_row(self, task_id):
+        """
+        Expands the details of a displayed task.
+        """
+        if hasattr(self, 'task_table') and task_id in self.task_table.task_rows:
+            row = self.task_table.task_rows[task_id]
+            if not row.details_shown:
+                row.toggle_details()
+
     def set_project(self, project_id):
         """
         Filters displayed tasks based on the selected project.